@@ -0,0 +1,322 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Any, Callable, Optional
+import pandas as pd
+import pyspark
+from pyspark.sql.session import SparkSession
+from pandas.core.frame import DataFrame as pandas_df
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.profiler.column_profiler import ColumnProfiler
+from benchmarks.data_generator import SyntheticDataGenerator
+
+# the metrics timed for every column, and the additional ones of the numeric columns
+COLUMN_METRICS = {
+	"total_count": "get_total_count",
+	"null_count": "get_null_count",
+	"unique_count": "get_unique_count",
+	"topn_values": "get_topn"
+}
+NUMBER_METRICS = {
+	"min": "get_min_value",
+	"max": "get_max_value",
+	"mean": "get_mean_value",
+	"stddev": "get_stddev_value"
+}
+
+
+def get_spark_session() -> SparkSession:
+	spark_session = (
+		SparkSession
+			.builder
+			.master("local[*]")
+			.appName("dq_whistler_benchmarks")
+			.getOrCreate()
+	)
+	return spark_session
+
+
+def time_call(function: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+	"""
+	Args:
+		function (:obj:`Callable[[], Any]`): The function to be timed
+		repeats (:obj:`int`): The number of timed calls, after one untimed warm up call
+
+	Returns:
+		:obj:`Dict[str, Any]`: The timings of the calls in seconds
+		Sample Output::
+			{
+				"min": 0.12,
+				"median": 0.13,
+				"mean": 0.135,
+				"repeats": 5
+			}
+	"""
+	function()
+	timings = []
+	for _ in range(repeats):
+		start = time.perf_counter()
+		function()
+		timings.append(time.perf_counter() - start)
+	return {
+		"min": min(timings),
+		"median": statistics.median(timings),
+		"mean": statistics.mean(timings),
+		"repeats": repeats
+	}
+
+
+def get_git_commit() -> Optional[str]:
+	"""
+	Returns:
+		:obj:`str`: The current git commit, ``None`` outside of a git checkout
+	"""
+	try:
+		return subprocess.run(
+			["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+		).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+class BenchmarkRunner:
+	"""
+	Times :meth:`dq_whistler.analyzer.DataQualityAnalyzer.analyze`, each metric of the column profilers and each
+	constraint class on the synthetic data, for the pandas and the Spark backends. The timings are keyed by
+	``<backend>/analyze``, ``<backend>/metric/<datatype>/<metric>`` and ``<backend>/constraint/<datatype>/<name>``
+
+	Args:
+		generator (:obj:`SyntheticDataGenerator`): The generator of the data
+		backends (:obj:`List[str]`): The backends, ``pandas`` and/or ``spark``
+		repeats (:obj:`int`): The number of timed calls of each benchmark
+		spark_session (:obj:`pyspark.sql.SparkSession`, optional): The Spark session, created on ``local[*]`` when
+			required and missing
+	"""
+	_generator: SyntheticDataGenerator
+	_backends: List[str]
+	_repeats: int
+	_spark_session: Optional[SparkSession]
+
+	def __init__(
+			self,
+			generator: SyntheticDataGenerator,
+			backends: List[str] = ("pandas", "spark"),
+			repeats: int = 3,
+			spark_session: Optional[SparkSession] = None
+	):
+		"""
+		Creates an instance of :obj:`BenchmarkRunner`
+		"""
+		for backend in backends:
+			if backend not in ("pandas", "spark"):
+				raise NotImplementedError
+		self._generator = generator
+		self._backends = list(backends)
+		self._repeats = repeats
+		self._spark_session = spark_session
+
+	def get_backend_data(self, data: pandas_df, backend: str) -> Any:
+		"""
+		Args:
+			data (:obj:`pandas.core.frame.DataFrame`): The synthetic data
+			backend (:obj:`str`): The backend
+
+		Returns:
+			:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`: The data for the backend, a Spark
+			dataframe is cached so that the timings do not include the conversion from pandas
+		"""
+		if backend == "pandas":
+			return data
+		if self._spark_session is None:
+			self._spark_session = get_spark_session()
+		spark_data = self._spark_session.createDataFrame(data.astype(object).where(data.notna(), None)).cache()
+		spark_data.count()
+		return spark_data
+
+	def get_profiler(self, data: Any, column_config: Dict[str, Any]) -> ColumnProfiler:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data of the backend
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+
+		Returns:
+			:obj:`ColumnProfiler`: A new profiler of the column, ready for the metrics and the constraints
+		"""
+		profiler = DataQualityAnalyzer(data, [column_config]).get_profiler(data, column_config)
+		profiler.build_constraints()
+		profiler.prepare_df_for_constraints()
+		return profiler
+
+	def run_backend(self, data: Any, backend: str, source: pandas_df) -> Dict[str, Dict[str, Any]]:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data of the backend
+			backend (:obj:`str`): The backend
+			source (:obj:`pandas.core.frame.DataFrame`): The synthetic data, for the values of the constraints
+
+		Returns:
+			:obj:`Dict[str, Dict[str, Any]]`: The timings of the benchmarks of the backend
+		"""
+		results = {}
+		config = self._generator.get_config(source)
+		results[f"{backend}/analyze"] = time_call(
+			lambda: DataQualityAnalyzer(data, config, persist=False).analyze(), self._repeats
+		)
+
+		for datatype in ("number", "string"):
+			column_config = next((column for column in config if column["datatype"] == datatype), None)
+			if column_config is None:
+				continue
+			metrics = {**COLUMN_METRICS, **(NUMBER_METRICS if datatype == "number" else {})}
+			for metric, method in metrics.items():
+				column = {**column_config, "constraints": []}
+				results[f"{backend}/metric/{datatype}/{metric}"] = time_call(
+					lambda: getattr(self.get_profiler(data, column), method)(), self._repeats
+				)
+			for constraint in self._generator.get_constraint_configs(datatype, source):
+				column = {**column_config, "constraints": [constraint]}
+				results[f"{backend}/constraint/{datatype}/{constraint['name']}"] = time_call(
+					lambda: self.get_profiler(data, column).get_custom_constraint_check(), self._repeats
+				)
+		return results
+
+	def run(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The timings of all the benchmarks along with the parameters of the run
+			Sample Output::
+				{
+					"meta": {
+						"commit": "8e92a21...",
+						"timestamp": 1700000000.0,
+						"python": "3.11.7",
+						"pandas": "2.1.0",
+						"pyspark": "3.5.0",
+						"repeats": 3,
+						"data": {"rows": 100000, ...}
+					},
+					"results": {
+						"pandas/analyze": {"min": 0.12, "median": 0.13, "mean": 0.135, "repeats": 3},
+						"spark/constraint/string/regex": {...}
+					}
+				}
+		"""
+		source = self._generator.generate()
+		results = {}
+		for backend in self._backends:
+			data = self.get_backend_data(source, backend)
+			try:
+				results.update(self.run_backend(data, backend, source))
+			finally:
+				if backend == "spark":
+					data.unpersist()
+		return {
+			"meta": {
+				"commit": get_git_commit(),
+				"timestamp": time.time(),
+				"python": platform.python_version(),
+				"pandas": pd.__version__,
+				"pyspark": pyspark.__version__,
+				"repeats": self._repeats,
+				"data": self._generator.get_params()
+			},
+			"results": results
+		}
+
+
+def compare(
+		baseline: Dict[str, Any],
+		current: Dict[str, Any],
+		threshold: float = 0.2,
+		min_seconds: float = 0.01
+) -> List[Dict[str, Any]]:
+	"""
+	Args:
+		baseline (:obj:`Dict[str, Any]`): The output of :meth:`BenchmarkRunner.run` for the baseline commit
+		current (:obj:`Dict[str, Any]`): The output of :meth:`BenchmarkRunner.run` for the current commit
+		threshold (:obj:`float`): The relative slowdown of the median above which a benchmark has regressed
+		min_seconds (:obj:`float`): The absolute slowdown of the median below which a benchmark has not regressed,
+			to ignore the noise of the very fast benchmarks
+
+	Returns:
+		:obj:`List[Dict[str, Any]]`: The regressed benchmarks present in both the runs
+		Sample Output::
+			[
+				{
+					"name": "spark/analyze",
+					"baseline": 1.2,
+					"current": 1.8,
+					"ratio": 1.5
+				}
+			]
+	"""
+	if baseline["meta"]["data"] != current["meta"]["data"]:
+		raise ValueError("The benchmarks were run on different data")
+	regressions = []
+	for name, timing in current["results"].items():
+		baseline_timing = baseline["results"].get(name)
+		if baseline_timing is None:
+			continue
+		slowdown = timing["median"] - baseline_timing["median"]
+		if slowdown > min_seconds and timing["median"] > baseline_timing["median"] * (1 + threshold):
+			regressions.append({
+				"name": name,
+				"baseline": baseline_timing["median"],
+				"current": timing["median"],
+				"ratio": timing["median"] / baseline_timing["median"]
+			})
+	return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmarks of dq_whistler on synthetic data")
+	parser.add_argument("--rows", type=int, default=100000)
+	parser.add_argument("--number-columns", type=int, default=2)
+	parser.add_argument("--string-columns", type=int, default=2)
+	parser.add_argument("--null-rate", type=float, default=0.05)
+	parser.add_argument("--cardinality", type=int, default=1000)
+	parser.add_argument("--skew", type=float, default=0.0)
+	parser.add_argument("--string-length", type=int, default=8)
+	parser.add_argument("--seed", type=int, default=42)
+	parser.add_argument("--backends", nargs="+", default=["pandas", "spark"], choices=["pandas", "spark"])
+	parser.add_argument("--repeats", type=int, default=3)
+	parser.add_argument("--output", help="The JSON file for the results")
+	parser.add_argument("--baseline", help="The JSON results of a previous run to compare with")
+	parser.add_argument("--threshold", type=float, default=0.2)
+	options = parser.parse_args(args)
+
+	generator = SyntheticDataGenerator(
+		rows=options.rows,
+		number_columns=options.number_columns,
+		string_columns=options.string_columns,
+		null_rate=options.null_rate,
+		cardinality=options.cardinality,
+		skew=options.skew,
+		string_length=options.string_length,
+		seed=options.seed
+	)
+	output = BenchmarkRunner(generator, backends=options.backends, repeats=options.repeats).run()
+	if options.output:
+		with open(options.output, "w") as output_file:
+			json.dump(output, output_file, indent=2)
+	for name, timing in sorted(output["results"].items()):
+		print(f"{name:<45} {timing['median'] * 1000:>10.2f} ms")
+
+	if options.baseline:
+		with open(options.baseline) as baseline_file:
+			regressions = compare(json.load(baseline_file), output, threshold=options.threshold)
+		for regression in regressions:
+			print(
+				f"REGRESSION {regression['name']}: {regression['baseline'] * 1000:.2f} ms -> "
+				f"{regression['current'] * 1000:.2f} ms ({regression['ratio']:.2f}x)"
+			)
+		return 1 if regressions else 0
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,200 @@
+import string
+from typing import Dict, List, Any, Optional
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame as pandas_df
+
+
+class SyntheticDataGenerator:
+	"""
+	Generates seeded synthetic data along with an analyzer config for the benchmarks, the same parameters and seed
+	always give the same data
+
+	Args:
+		rows (:obj:`int`): The number of rows
+		number_columns (:obj:`int`): The number of numeric columns, named ``number_col_<index>``
+		string_columns (:obj:`int`): The number of string columns, named ``string_col_<index>``
+		null_rate (:obj:`float`): The fraction of null values in each column
+		cardinality (:obj:`int`): The number of distinct values in each column
+		skew (:obj:`float`): The exponent of the Zipf distribution of the values, ``0`` for uniform values
+		string_length (:obj:`int`): The length of the string values
+		seed (:obj:`int`): The seed of the random generator
+	"""
+	_rows: int
+	_number_columns: int
+	_string_columns: int
+	_null_rate: float
+	_cardinality: int
+	_skew: float
+	_string_length: int
+	_seed: int
+
+	def __init__(
+			self,
+			rows: int = 100000,
+			number_columns: int = 2,
+			string_columns: int = 2,
+			null_rate: float = 0.05,
+			cardinality: int = 1000,
+			skew: float = 0.0,
+			string_length: int = 8,
+			seed: int = 42
+	):
+		"""
+		Creates an instance of :obj:`SyntheticDataGenerator`
+		"""
+		if not 0 <= null_rate <= 1 or cardinality < 1 or string_length < 1:
+			raise ValueError("Invalid parameters for the synthetic data")
+		if string_columns and cardinality > len(string.ascii_lowercase) ** string_length:
+			raise ValueError("The cardinality is larger than the number of strings of the given length")
+		self._rows = rows
+		self._number_columns = number_columns
+		self._string_columns = string_columns
+		self._null_rate = null_rate
+		self._cardinality = cardinality
+		self._skew = skew
+		self._string_length = string_length
+		self._seed = seed
+
+	def get_params(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The parameters of the data, stored along with the benchmark results
+		"""
+		return {
+			"rows": self._rows,
+			"number_columns": self._number_columns,
+			"string_columns": self._string_columns,
+			"null_rate": self._null_rate,
+			"cardinality": self._cardinality,
+			"skew": self._skew,
+			"string_length": self._string_length,
+			"seed": self._seed
+		}
+
+	def get_value_indexes(self, rng: np.random.Generator) -> np.ndarray:
+		"""
+		Args:
+			rng (:obj:`numpy.random.Generator`): The random generator
+
+		Returns:
+			:obj:`numpy.ndarray`: The index of the distinct value of each row, ``-1`` for the null rows
+		"""
+		ranks = np.arange(1, self._cardinality + 1, dtype=float)
+		weights = ranks ** -self._skew
+		indexes = rng.choice(self._cardinality, size=self._rows, p=weights / weights.sum())
+		indexes[rng.random(self._rows) < self._null_rate] = -1
+		return indexes
+
+	def get_string_values(self, rng: np.random.Generator) -> np.ndarray:
+		"""
+		Args:
+			rng (:obj:`numpy.random.Generator`): The random generator
+
+		Returns:
+			:obj:`numpy.ndarray`: The distinct string values, as many as the cardinality
+		"""
+		letters = np.array(list(string.ascii_lowercase))
+		values = set()
+		while len(values) < self._cardinality:
+			values.add("".join(rng.choice(letters, size=self._string_length)))
+		return np.array(sorted(values), dtype=object)
+
+	def generate(self) -> pandas_df:
+		"""
+		Returns:
+			:obj:`pandas.core.frame.DataFrame`: The synthetic data, numeric columns are floats with ``NaN`` for the
+			nulls and string columns are objects with ``None`` for the nulls
+		"""
+		rng = np.random.default_rng(self._seed)
+		columns = {}
+		for index in range(self._number_columns):
+			indexes = self.get_value_indexes(rng)
+			columns[f"number_col_{index}"] = np.where(indexes >= 0, indexes.astype(float), np.nan)
+		for index in range(self._string_columns):
+			values = self.get_string_values(rng)
+			indexes = self.get_value_indexes(rng)
+			column = values[np.maximum(indexes, 0)]
+			column[indexes < 0] = None
+			columns[f"string_col_{index}"] = column
+		return pd.DataFrame(columns)
+
+	def get_config(self, data: Optional[pandas_df] = None) -> List[Dict[str, Any]]:
+		"""
+		Args:
+			data (:obj:`pandas.core.frame.DataFrame`, optional): The generated data, the string constraints use its
+				first non null value so that they are not trivially failing
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The analyzer config of the columns, with a few constraints on each column
+		"""
+		config = []
+		middle = self._cardinality / 2
+		for index in range(self._number_columns):
+			config.append({
+				"name": f"number_col_{index}",
+				"datatype": "number",
+				"constraints": [
+					{"name": "gt_eq", "values": 0},
+					{"name": "between", "values": [0, middle]},
+					{"name": "is_in", "values": list(range(0, self._cardinality, 2))}
+				]
+			})
+		for index in range(self._string_columns):
+			column_name = f"string_col_{index}"
+			value = "a"
+			if data is not None and data[column_name].notna().any():
+				value = data[column_name].dropna().iloc[0]
+			config.append({
+				"name": column_name,
+				"datatype": "string",
+				"constraints": [
+					{"name": "regex", "values": "^[a-z]+$"},
+					{"name": "contains", "values": value[:2]},
+					{"name": "not_in", "values": [value]}
+				]
+			})
+		return config
+
+	def get_constraint_configs(self, datatype: str, data: Optional[pandas_df] = None) -> List[Dict[str, Any]]:
+		"""
+		Args:
+			datatype (:obj:`str`): Either ``number`` or ``string``
+			data (:obj:`pandas.core.frame.DataFrame`, optional): The generated data
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: A config of every constraint supported for the datatype, each is timed
+			separately
+		"""
+		middle = self._cardinality / 2
+		if datatype == "number":
+			return [
+				{"name": "eq", "values": middle},
+				{"name": "not_eq", "values": middle},
+				{"name": "lt", "values": middle},
+				{"name": "gt", "values": middle},
+				{"name": "lt_eq", "values": middle},
+				{"name": "gt_eq", "values": middle},
+				{"name": "between", "values": [0, middle]},
+				{"name": "not_between", "values": [0, middle]},
+				{"name": "is_in", "values": list(range(0, self._cardinality, 2))},
+				{"name": "not_in", "values": list(range(0, self._cardinality, 2))}
+			]
+		if datatype == "string":
+			value = "a"
+			if data is not None and self._string_columns and data["string_col_0"].notna().any():
+				value = data["string_col_0"].dropna().iloc[0]
+			return [
+				{"name": "eq", "values": value},
+				{"name": "not_eq", "values": value},
+				{"name": "contains", "values": value[:2]},
+				{"name": "not_contains", "values": value[:2]},
+				{"name": "starts_with", "values": value[:2]},
+				{"name": "not_starts_with", "values": value[:2]},
+				{"name": "ends_with", "values": value[-2:]},
+				{"name": "not_ends_with", "values": value[-2:]},
+				{"name": "is_in", "values": [value]},
+				{"name": "not_in", "values": [value]},
+				{"name": "regex", "values": "^[a-z]+$"}
+			]
+		raise NotImplementedError
@@ -1,22 +1,28 @@
 import json
-import numpy as np
-from typing import Dict, List, Any, Union
+import logging
+import threading
+import uuid
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Union, Optional, Tuple, Iterator, Callable
 import pyspark.sql.functions as F
+from pyspark import SparkContext, StorageLevel
 from pandas.core.frame import DataFrame as pandas_df
 from pyspark.sql.dataframe import DataFrame as spark_df
+from dq_whistler.cache import ResultCache
+from dq_whistler.constraints.constraint import Constraint
+from dq_whistler.constraints.engine import ConstraintEngine, RowGroupConstraintEngine
+from dq_whistler.drift import DriftDetector
+from dq_whistler.parquet_stats import ParquetFooterStats
+from dq_whistler.result import NpEncoder, AnalysisResult, ColumnResult
+from dq_whistler.sampling import Sampler
+from dq_whistler.profiler.column_profiler import ColumnProfiler
+from dq_whistler.profiler.column_state import ColumnState
+from dq_whistler.profiler.instrumentation import Instrumentation
 from dq_whistler.profiler.string_profiler import StringProfiler
 from dq_whistler.profiler.number_profiler import NumberProfiler
-
-
-class NpEncoder(json.JSONEncoder):
-	def default(self, obj):
-		if isinstance(obj, np.integer):
-			return int(obj)
-		if isinstance(obj, np.floating):
-			return float(obj)
-		if isinstance(obj, np.ndarray):
-			return obj.tolist()
-		return super(NpEncoder, self).default(obj)
+from dq_whistler.profiler.process_pool import SharedColumn, profile_shared_column
 
 
 class DataQualityAnalyzer:
@@ -26,44 +32,806 @@ class DataQualityAnalyzer:
 	Args:
 			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.series.Series`): Dataframe/Series containing the data
 			config (:obj:`List[Dict[str, str]]`): The array of dicts containing config for each column
+			fused (:obj:`bool`): If ``True``, the scalar metrics (counts, min, max, mean, stddev etc.) and the invalid
+				counts of the constraints of all the columns are computed together in a single Spark ``agg`` job instead
+				of separate jobs per metric and constraint
+			persist (:obj:`bool`): If ``True``, the configured columns of a Spark dataframe are persisted for the
+				duration of :meth:`analyze`, so that the source is read only once. Set it to ``False`` for data that
+				does not fit the cluster
+			storage_level (:obj:`str` | :obj:`pyspark.StorageLevel`): The storage level used to persist the data,
+				for ex: ``MEMORY_ONLY``, ``MEMORY_AND_DISK`` or ``OFF_HEAP``
+			max_concurrency (:obj:`int`): The max number of columns profiled concurrently on a thread pool. If the
+				Spark session runs with ``spark.scheduler.mode=FAIR``, the jobs of each thread are submitted to their
+				own FAIR scheduler pool, so that the narrow jobs of multiple columns share the cluster. In the default
+				FIFO mode the jobs are still submitted concurrently, but the ones submitted first take the free slots
+				first, and a warning is logged
+			executor (:obj:`str`): Either ``thread`` or ``process``, with ``process`` the columns of a pandas dataframe
+				are placed in shared memory and profiled by ``max_concurrency`` worker processes
+			parquet_source (:obj:`str` | :obj:`List[str]` | :obj:`pyarrow.dataset.FileSystemDataset`, optional): The
+				Parquet files the Spark dataframe was read from without any filter, the row count and for integer
+				columns the null count, min and max are then read from the footer statistics instead of scanning. Unless
+				``fused``, the range constraints of integer columns only read the row groups whose min/max statistics
+				can contain an invalid value
+			sampling (:obj:`Dict[str, Any]`, optional): If present, the profilers and constraints run on a sample of
+				the data, the counts are estimated for the whole data along with confidence intervals, see
+				:obj:`dq_whistler.sampling.Sampler` for the config
+			fail_fast (:obj:`bool`): If ``True``, every constraint is evaluated in the ``exists`` mode and is blocking,
+				unless set otherwise in its config. A constraint with ``"mode": "exists"`` stops at the first invalid
+				value instead of counting all of them, once a ``"blocking": true`` constraint fails the constraints
+				evaluated after it are skipped. Not applicable to the constraints computed in the ``fused`` job
+			profile (:obj:`bool`): If ``True``, the stats of each column have a ``_profile`` key with the cost of each
+				metric and constraint computed for the column: wall time, CPU time, the Spark jobs, stages, input rows
+				and shuffle bytes, or the peak memory for pandas with ``trace_memory``, see
+				:obj:`dq_whistler.profiler.instrumentation.Instrumentation`. Not applicable to the sampling mode and
+				the ``process`` executor
+			trace_memory (:obj:`bool`): If ``True``, the profile of a pandas dataframe also has the peak memory
+				allocated by each metric and constraint, traced with ``tracemalloc``, which slows down the profiled
+				code and so inflates the times of the same profile
+			on_profile (:obj:`Callable[[str, Dict[str, Any]], None]`, optional): Called with the name and the
+				profile of each column once it is profiled, the columns are profiled even without ``profile``
+			null_tokens (:obj:`Dict[str, List[str]]`, optional): The string values counted as null for each datatype,
+				for ex: ``{"string": ["", "NULL", "N/A"]}``, unless set by ``null_tokens`` in the config of a column.
+				By default ``""``, ``"None"`` and ``"NULL"`` are counted as null
+			cache (:obj:`dq_whistler.cache.ResultCache`, optional): If present, :meth:`analyze` returns the stored
+				result of a previous run on the same data with the same config instead of profiling again, see
+				:obj:`dq_whistler.cache.ResultCache` for the data which can be cached
+			states (:obj:`bool`): If ``True``, :meth:`analyze` also builds the mergeable state of each column from the
+				metrics of the same pass, returned by :meth:`get_states`, so that :meth:`detect_drift` does not scan
+				the data again. Not applicable to the sampling mode, ``fail_fast`` and the ``process`` executor, and
+				the cache is not used
 	"""
 	_data: Union[spark_df, pandas_df]
 	_config: List[Dict[str, str]]
+	_fused: bool
+	_persist: bool
+	_storage_level: StorageLevel
+	_persist_stats: Dict[str, Any]
+	_max_concurrency: int
+	_executor: str
+	_parquet_source: Optional[Union[str, List[str], Any]]
+	_footer_stats: Optional[ParquetFooterStats]
+	_sampling: Optional[Dict[str, Any]]
+	_fail_fast: bool
+	_profile: bool
+	_trace_memory: bool
+	_on_profile: Optional[Callable[[str, Dict[str, Any]], None]]
+	_instrumentation: Optional[Instrumentation]
+	_cache: Optional[ResultCache]
+	_states: bool
+	_column_states: Dict[str, ColumnState]
+
+	_job_properties = ("spark.jobGroup.id", "spark.job.description", "spark.job.interruptOnCancel")
 
-	def __init__(self, data: Union[spark_df, pandas_df], config: List[Dict[str, str]]):
+	def __init__(
+			self,
+			data: Union[spark_df, pandas_df],
+			config: List[Dict[str, str]],
+			fused: bool = False,
+			persist: bool = True,
+			storage_level: Union[str, StorageLevel] = "MEMORY_AND_DISK",
+			max_concurrency: int = 1,
+			executor: str = "thread",
+			parquet_source: Optional[Union[str, List[str], Any]] = None,
+			sampling: Optional[Dict[str, Any]] = None,
+			fail_fast: bool = False,
+			profile: bool = False,
+			trace_memory: bool = False,
+			on_profile: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+			null_tokens: Optional[Dict[str, List[str]]] = None,
+			cache: Optional[ResultCache] = None,
+			states: bool = False
+	):
 		"""
 		Creates an instance of DQAnalyzer
 		"""
 		self._data = data
+		self._fail_fast = fail_fast
+		if fail_fast:
+			config = [
+				{
+					**column_config,
+					"constraints": [
+						{"mode": "exists", "blocking": True, **constraint}
+						for constraint in column_config.get("constraints") or []
+					]
+				}
+				for column_config in config
+			]
+		if null_tokens:
+			config = [
+				{"null_tokens": null_tokens[column_config.get("datatype")], **column_config}
+				if column_config.get("datatype") in null_tokens else column_config
+				for column_config in config
+			]
 		self._config = config
+		self._fused = fused
+		self._persist = persist
+		self._storage_level = getattr(StorageLevel, storage_level) if isinstance(storage_level, str) else storage_level
+		self._persist_stats = {}
+		self._max_concurrency = max_concurrency
+		if executor not in ("thread", "process"):
+			raise NotImplementedError
+		self._executor = executor
+		self._parquet_source = parquet_source
+		self._footer_stats = None
+		self._sampling = sampling
+		self._profile = profile
+		self._trace_memory = trace_memory
+		self._on_profile = on_profile
+		self._instrumentation = None
+		self._cache = cache
+		if states and (sampling is not None or fail_fast or executor == "process"):
+			raise NotImplementedError
+		self._states = states
+		self._column_states = {}
 
-	def analyze(self) -> str:
+	def get_persist_stats(self) -> Dict[str, Any]:
 		"""
 		Returns:
-			:obj:`str`: :obj:`JSON` string containing stats for multiple columns
+			:obj:`Dict[str, Any]`: Stats of the data persisted during the last :meth:`analyze` run, ``spark_jobs`` is
+			the number of jobs executed on the data and ``jobs_on_persisted_data`` an estimate of the number of them
+			which read the persisted data instead of the source: every job but the first, which persists the data.
+			It is not measured, a job can still read the source, for ex: when the persisted blocks were evicted
+			Sample Output::
+				{
+					"storage_level": "Disk Memory Deserialized 1x Replicated",
+					"spark_jobs": 12,
+					"jobs_on_persisted_data": 11
+				}
+		"""
+		return self._persist_stats
+
+	def get_projected_columns(self) -> List[str]:
 		"""
-		final_checks: List[Dict[str, Any]] = []
-		# TODO: Add feature of automatic column detection, if config is not present
+		Returns:
+			:obj:`List[str]`: The union of the configured column names and the columns referenced by their constraints,
+			in the order of the config
+		"""
+		column_names: List[str] = []
 		for column_config in self._config:
-			# TODO:: checks for key existence
-			column_name = column_config.get("name")
-			column_data_type = column_config.get("datatype")
+			column_names.append(column_config.get("name"))
+			for constraint in self.get_profiler(self._data, column_config).build_constraints():
+				column_names.extend(constraint.get_referenced_columns())
+		return list(dict.fromkeys(column_names))
 
-			if isinstance(self._data, spark_df):
-				column_data = self._data.select(F.col(column_name))
+	def prepare_data(self) -> Union[spark_df, pandas_df]:
+		"""
+		Returns:
+			:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`: The data projected to the columns
+			required by the config, persisted as per the ``storage_level`` for a Spark dataframe. Projecting the data
+			once lets columnar sources like Parquet/ORC read only these columns
+		"""
+		if not isinstance(self._data, spark_df):
+			return self._data
 
-			if isinstance(self._data, pandas_df):
-				column_data = self._data[column_name]
+		data = self._data.select(*[F.col(column_name) for column_name in self.get_projected_columns()])
+		if self._persist:
+			data = data.persist(self._storage_level)
+		return data
 
-			if column_data_type == "string":
-				profiler = StringProfiler(column_data, column_config)
-			elif column_data_type == "number":
-				profiler = NumberProfiler(column_data, column_config)
-			else:
-				raise NotImplementedError
-			output = profiler.run()
-			final_checks.append({
-				"col_name": column_name,
-				**output
+	def release_data(self, data: Union[spark_df, pandas_df]) -> None:
+		"""
+		Unpersists the data persisted by :meth:`prepare_data`
+
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data returned by
+			:meth:`prepare_data`
+		"""
+		if isinstance(data, spark_df) and self._persist:
+			data.unpersist()
+
+	def get_footer_stats(self) -> Optional[ParquetFooterStats]:
+		"""
+		Returns:
+			:obj:`ParquetFooterStats`: The footer stats of the ``parquet_source``, read once per analyzer, ``None`` if
+			there is no source or its footers can not be read
+		"""
+		if self._footer_stats is None and self._parquet_source is not None:
+			self._footer_stats = ParquetFooterStats.load(self._parquet_source)
+		return self._footer_stats
+
+	def get_footer_metrics(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The metrics of each of the configured column answered by the Parquet footer
+			stats, empty dicts if the data is not a Spark dataframe or there are no footer stats
+		"""
+		footer_stats = self.get_footer_stats() if isinstance(self._data, spark_df) else None
+		if footer_stats is None:
+			return [{} for _ in self._config]
+		return [
+			footer_stats.get_column_metrics(column_config.get("name"), column_config.get("datatype"))
+			for column_config in self._config
+		]
+
+	def compute_row_group_constraints(self, profilers: List[ColumnProfiler]) -> None:
+		"""
+		Evaluates the range constraints of all the profilers on the Parquet row groups which can contain invalid
+		values as per their statistics, and sets the outputs on each profiler. The row groups are read through the
+		dataframe of the analyzer rather than the persisted data, so that the Parquet reader can skip them
+
+		Args:
+			profilers (:obj:`List[ColumnProfiler]`): The profilers of the columns to be analyzed
+		"""
+		footer_stats = self.get_footer_stats() if isinstance(self._data, spark_df) else None
+		if footer_stats is None:
+			return
+		profiler_constraints = [
+			[
+				constraint for constraint in profiler.build_constraints()
+				if RowGroupConstraintEngine.supports(footer_stats, constraint)
+			]
+			for profiler in profilers
+		]
+		results = iter(RowGroupConstraintEngine(
+			footer_stats,
+			[constraint for constraints in profiler_constraints for constraint in constraints],
+			self._data
+		).execute())
+		for profiler, constraints in zip(profilers, profiler_constraints):
+			profiler.set_metrics({
+				"constraint_results": {constraint.constraint_name(): next(results) for constraint in constraints}
 			})
+
+	def get_profiler(self, data: Union[spark_df, pandas_df], column_config: Dict[str, Any]) -> ColumnProfiler:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data containing the column
+			column_config (:obj:`Dict[str, Any]`): The config of a single column
+
+		Returns:
+			:obj:`ColumnProfiler`: The profiler instance as per the datatype of the column
+		"""
+		# TODO:: checks for key existence
+		column_name = column_config.get("name")
+		column_data_type = column_config.get("datatype")
+
+		if isinstance(data, spark_df):
+			column_data = data.select(F.col(column_name))
+
+		if isinstance(data, pandas_df):
+			column_data = data[column_name]
+
+		if column_data_type == "string":
+			return StringProfiler(column_data, column_config)
+		elif column_data_type == "number":
+			return NumberProfiler(column_data, column_config)
+		else:
+			raise NotImplementedError
+
+	def compute_fused_metrics(self, data: spark_df, profilers: List[ColumnProfiler]) -> None:
+		"""
+		Computes the scalar metrics and the constraint checks of all the profilers in a single Spark aggregation job,
+		followed by one bounded job for the sample invalid values, and sets them on each profiler
+
+		Args:
+			data (:obj:`pyspark.sql.DataFrame`): The data containing the columns of all the profilers
+			profilers (:obj:`List[ColumnProfiler]`): The profilers of the columns to be analyzed
+		"""
+		metric_names: List[List[str]] = []
+		profiler_constraints: List[List[Constraint]] = []
+		exprs = []
+		for profiler in profilers:
+			profiler_exprs = profiler.get_metric_exprs()
+			metric_names.append(list(profiler_exprs.keys()))
+			exprs.extend(profiler_exprs.values())
+			profiler_constraints.append(profiler.build_constraints())
+
+		engine = ConstraintEngine(data, [c for constraints in profiler_constraints for c in constraints])
+		exprs.extend(engine.get_invalid_count_exprs())
+		if not exprs:
+			return
+		values = iter(engine.get_data().agg(*exprs).first())
+		for profiler, names in zip(profilers, metric_names):
+			profiler.set_metrics({name: next(values) for name in names})
+
+		results = iter(engine.execute(invalid_counts=[int(count) for count in values]))
+		for profiler, constraints in zip(profilers, profiler_constraints):
+			profiler.set_metrics({"constraints": [next(results) for _ in constraints]})
+
+	def get_cache_key(self) -> Optional[str]:
+		"""
+		Returns:
+			:obj:`str`: The key of the result of :meth:`analyze` in the cache, ``None`` without a cache, with ``states``
+			or if the data can not be fingerprinted. The key covers the options which change the output: the config
+			(along with ``null_tokens`` and ``fail_fast``, which are applied to it), ``fused``, ``sampling``, the use of
+			``parquet_source``, ``executor``, ``profile`` and ``trace_memory``. The options which only change how the
+			output is computed (``persist``, ``storage_level``, ``max_concurrency``) are excluded
+		"""
+		if self._cache is None or self._states:
+			return None
+		return self._cache.get_key(self._data, {
+			"config": self._config,
+			"fail_fast": self._fail_fast,
+			"fused": self._fused,
+			"sampling": self._sampling,
+			"footer_stats": self._parquet_source is not None,
+			"executor": self._executor,
+			"profile": self._profile,
+			"trace_memory": self._trace_memory
+		})
+
+	@contextmanager
+	def job_group(self, job_group: str) -> Iterator[None]:
+		"""
+		Runs the Spark jobs of the context in the given job group, the job group, the description and the
+		interruptOnCancel flag of the calling thread are restored afterwards
+
+		Args:
+			job_group (:obj:`str`): The id of the job group
+		"""
+		spark_context = SparkContext.getOrCreate()
+		parent_properties = {key: spark_context.getLocalProperty(key) for key in self._job_properties}
+		spark_context.setJobGroup(job_group, "dq_whistler analyze")
+		try:
+			yield
+		finally:
+			for key, value in parent_properties.items():
+				spark_context.setLocalProperty(key, value)
+
+	def analyze(self, as_objects: bool = False) -> Union[str, AnalysisResult]:
+		"""
+		Args:
+			as_objects (:obj:`bool`): If ``True``, the stats are returned as :obj:`dq_whistler.result.AnalysisResult`
+				instead of a :obj:`JSON` string, the counts can then be read without serializing and parsing the
+				output, which is converted only on ``to_dict``, ``to_json`` or ``to_arrow``
+
+		Returns:
+			:obj:`str` | :obj:`dq_whistler.result.AnalysisResult`: :obj:`JSON` string containing stats for multiple
+			columns, from the cache if present there, in which case the keys of the top values are strings even for
+			``as_objects``
+		"""
+		cache_key = self.get_cache_key()
+		if cache_key is not None:
+			cached_output = self._cache.get(cache_key)
+			if cached_output is not None:
+				logging.info(f"Analyzed {len(self._config)} columns from the cache")
+				return AnalysisResult(json.loads(cached_output)) if as_objects else cached_output
+
+		if isinstance(self._data, spark_df):
+			spark_context = SparkContext.getOrCreate()
+			job_group = f"dq_whistler_{uuid.uuid4().hex}"
+			with self.job_group(job_group):
+				final_checks = self.run_profilers()
+			spark_jobs = len(spark_context.statusTracker().getJobIdsForGroup(job_group))
+			if self._instrumentation is not None:
+				# the jobs of the measured metrics and constraints run in their own job groups
+				spark_jobs += self._instrumentation.get_job_count()
+			self._persist_stats = {
+				"storage_level": str(self._storage_level) if self._persist else None,
+				"spark_jobs": spark_jobs,
+				"jobs_on_persisted_data": max(spark_jobs - 1, 0) if self._persist else 0
+			}
+			logging.info(f"Analyzed {len(final_checks)} columns, persist stats: {self._persist_stats}")
+		else:
+			final_checks = self.run_profilers()
+		output = json.dumps(final_checks, cls=NpEncoder) if cache_key is not None or not as_objects else None
+		if cache_key is not None:
+			self._cache.put(cache_key, output)
+		if as_objects:
+			return AnalysisResult(final_checks)
+		return output
+
+	def analyze_iter(
+			self,
+			as_objects: bool = False,
+			ordered: bool = True
+	) -> Iterator[Union[Dict[str, Any], ColumnResult]]:
+		"""
+		Same as :meth:`analyze`, but yields the stats of each column once its profiler finishes instead of building
+		the stats of all the columns in memory, to be used for configs with many columns along with
+		:obj:`dq_whistler.writer.ResultWriter`. On Spark the jobs run in the job group of the analyzer only while the
+		next column is computed, the job group of the caller is restored before each ``yield``
+
+		Args:
+			as_objects (:obj:`bool`): If ``True``, the stats of each column are yielded as
+				:obj:`dq_whistler.result.ColumnResult` instead of a dict
+			ordered (:obj:`bool`): If ``True``, the stats are yielded in the order of the config, so with
+				``max_concurrency`` above 1 a column finished early is held until the previous columns finish. If
+				``False``, they are yielded in the order the profilers finish
+
+		Returns:
+			:obj:`Iterator[Dict[str, Any]]` | :obj:`Iterator[dq_whistler.result.ColumnResult]`: The stats of each of the
+			configured column
+		"""
+		outputs = self.iter_profilers(ordered)
+		if not isinstance(self._data, spark_df):
+			for output in outputs:
+				yield ColumnResult(output) if as_objects else output
+			return
+		job_group = f"dq_whistler_{uuid.uuid4().hex}"
+		try:
+			while True:
+				with self.job_group(job_group):
+					output = next(outputs, None)
+				if output is None:
+					return
+				yield ColumnResult(output) if as_objects else output
+		finally:
+			with self.job_group(job_group):
+				outputs.close()
+
+	def check(self, as_objects: bool = False) -> Union[str, AnalysisResult]:
+		"""
+		Evaluates only the constraints of the columns, in the order of the config, without computing the metrics.
+		Along with ``fail_fast`` this can be used as a quick gate in a pipeline
+
+		Args:
+			as_objects (:obj:`bool`): If ``True``, the output is returned as :obj:`dq_whistler.result.AnalysisResult`
+
+		Returns:
+			:obj:`str` | :obj:`dq_whistler.result.AnalysisResult`: :obj:`JSON` string containing the output of the
+			constraints of each column
+			Sample Output::
+				[
+					{
+						"col_name": "col_name",
+						"constraints": [
+							{
+								"name": "gt_eq",
+								"values": 5,
+								"mode": "exists",
+								"blocking": true,
+								"constraint_status": "failed",
+								"invalid_count": null,
+								"invalid_values": [1]
+							}
+						]
+					}
+				]
+		"""
+		data = self.prepare_data()
+		try:
+			gate = threading.Event()
+			final_checks = []
+			for column_config in self._config:
+				profiler = self.get_profiler(data, column_config)
+				profiler.set_gate(gate)
+				final_checks.append({
+					"col_name": column_config.get("name"),
+					"constraints": profiler.check_constraints()
+				})
+		finally:
+			self.release_data(data)
+		if as_objects:
+			return AnalysisResult(final_checks)
 		return json.dumps(final_checks, cls=NpEncoder)
+
+	def run_profiler(
+			self,
+			profiler: ColumnProfiler,
+			column_config: Dict[str, Any],
+			local_properties: Optional[Dict[str, str]] = None
+	) -> Dict[str, Any]:
+		"""
+		Args:
+			profiler (:obj:`ColumnProfiler`): The profiler of the column
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+			local_properties (:obj:`Dict[str, str]`, optional): Spark local properties to be set for the current thread,
+				for ex: ``spark.scheduler.pool``
+
+		Returns:
+			:obj:`Dict[str, Any]`: The stats of the column
+		"""
+		if local_properties:
+			spark_context = SparkContext.getOrCreate()
+			for key, value in local_properties.items():
+				spark_context.setLocalProperty(key, value)
+		output = {
+			"col_name": column_config.get("name"),
+			**profiler.run()
+		}
+		if self._states:
+			self._column_states[column_config.get("name")] = profiler.get_run_state(output)
+		profile = profiler.get_profile()
+		if profile is not None and self._profile:
+			output["_profile"] = profile
+		return output
+
+	def run_profilers(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each of the configured column, in the order of the config
+		"""
+		return list(self.iter_profilers())
+
+	def iter_profilers(self, ordered: bool = True) -> Iterator[Dict[str, Any]]:
+		"""
+		Yields the stats of each column once its profiler finishes, the data is released once the iteration is
+		over. The metrics shared by the columns (the ``fused`` job, the Parquet footers) are computed before the first
+		column. The sampling mode and the ``process`` executor compute all the columns before yielding the first one
+
+		Args:
+			ordered (:obj:`bool`): If ``False``, with ``max_concurrency`` above 1 the stats are yielded in the order
+				the profilers finish instead of the order of the config
+
+		Returns:
+			:obj:`Iterator[Dict[str, Any]]`: The stats of each of the configured column
+		"""
+		if self._sampling is not None:
+			yield from self.run_profilers_on_sample()
+			return
+		if self._executor == "process":
+			yield from self.run_profilers_in_processes()
+			return
+
+		data = self.prepare_data()
+		try:
+			# TODO: Add feature of automatic column detection, if config is not present
+			profilers = [self.get_profiler(data, column_config) for column_config in self._config]
+			gate = threading.Event()
+			self._column_states = {}
+			self._instrumentation = None
+			if self._profile or self._on_profile is not None:
+				self._instrumentation = Instrumentation(
+					isinstance(data, spark_df), self._on_profile, self._trace_memory
+				)
+				self._instrumentation.start()
+			for profiler, footer_metrics in zip(profilers, self.get_footer_metrics()):
+				profiler.set_metrics(footer_metrics)
+				profiler.set_gate(gate)
+				profiler.set_emit_state(self._states)
+				if self._instrumentation is not None:
+					profiler.set_instrumentation(self._instrumentation)
+			if self._fused and isinstance(data, spark_df):
+				self.compute_fused_metrics(data, profilers)
+			else:
+				self.compute_row_group_constraints(profilers)
+			if self._max_concurrency <= 1:
+				for column_config, profiler in zip(self._config, profilers):
+					yield self.run_profiler(profiler, column_config)
+				return
+
+			local_properties = [None] * len(profilers)
+			if isinstance(data, spark_df):
+				# threads do not inherit the local properties of the parent thread, so the job group is set again
+				spark_context = SparkContext.getOrCreate()
+				parent_properties = {
+					key: spark_context.getLocalProperty(key)
+					for key in self._job_properties
+					if spark_context.getLocalProperty(key) is not None
+				}
+				# the pools only take effect with the FAIR mode, in the FIFO mode the jobs submitted first go first
+				fair = spark_context.getConf().get("spark.scheduler.mode", "FIFO").upper() == "FAIR"
+				if not fair:
+					logging.warning(
+						"spark.scheduler.mode is not FAIR, the jobs of the concurrent columns are scheduled in FIFO order"
+					)
+				local_properties = [
+					{
+						**parent_properties,
+						"spark.job.description": f"dq_whistler analyze {column_config.get('name')}",
+						**({"spark.scheduler.pool": f"dq_whistler_{index % self._max_concurrency}"} if fair else {})
+					}
+					for index, column_config in enumerate(self._config)
+				]
+			with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+				if ordered:
+					yield from executor.map(self.run_profiler, profilers, self._config, local_properties)
+				else:
+					futures = [
+						executor.submit(self.run_profiler, profiler, column_config, properties)
+						for profiler, column_config, properties in zip(profilers, self._config, local_properties)
+					]
+					for future in as_completed(futures):
+						yield future.result()
+		finally:
+			if self._instrumentation is not None:
+				self._instrumentation.stop()
+			self.release_data(data)
+
+	def get_sample_counts(self, sample: Union[spark_df, pandas_df], key: Optional[str]) -> List[Tuple[Any, int, List[int]]]:
+		"""
+		Args:
+			sample (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The sample of the data
+			key (:obj:`str`, optional): The key column of the strata
+
+		Returns:
+			:obj:`List[Tuple[Any, int, List[int]]]`: For each stratum of the sample, its key, row count and the null
+			count of each column followed by the invalid count of each constraint, in the order of the config
+		"""
+		if isinstance(sample, spark_df):
+			profilers = [self.get_profiler(sample, column_config) for column_config in self._config]
+			constraints = [constraint for profiler in profilers for constraint in profiler.build_constraints()]
+			stratum = F.col(key) if key else F.lit(None)
+			engine = ConstraintEngine(sample, constraints)
+			rows = engine.get_data().groupBy(stratum.alias("stratum")).agg(
+				F.count(F.lit(1)),
+				*[profiler.get_null_count_expr() for profiler in profilers],
+				*engine.get_invalid_count_exprs()
+			).collect()
+			return [(row[0], int(row[1]), [int(count) for count in row[2:]]) for row in rows]
+
+		strata = sample.groupby(key, dropna=False) if key else [(None, sample)]
+		sample_counts = []
+		for stratum, stratum_sample in strata:
+			null_counts = []
+			invalid_counts = []
+			for column_config in self._config:
+				profiler = self.get_profiler(stratum_sample, column_config)
+				profiler.prepare_df_for_constraints()
+				null_counts.append(profiler.get_null_count())
+				invalid_counts.extend(profiler.get_invalid_counts(profiler.build_constraints()))
+			sample_counts.append((stratum, len(stratum_sample), null_counts + invalid_counts))
+		return sample_counts
+
+	def run_profilers_on_sample(self) -> List[Dict[str, Any]]:
+		"""
+		Runs the profilers on a sample of the data, the total count, null counts and invalid counts in the output are
+		estimates for the whole data with confidence intervals, the rest of the metrics are of the sample
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each of the configured column, in the order of the config
+		"""
+		sampler = Sampler(self._sampling)
+		key = sampler.get_key()
+		data = self._data
+		total_count = None
+		if isinstance(data, spark_df):
+			data = data.select(*[F.col(column_name) for column_name in dict.fromkeys([
+				*self.get_projected_columns(), *([key] if key else [])
+			])])
+			footer_stats = self.get_footer_stats()
+			total_count = footer_stats.get_total_count() if footer_stats is not None else None
+		sample = sampler.sample(data, total_count=total_count)
+		if isinstance(sample, spark_df) and self._persist:
+			sample = sample.persist(self._storage_level)
+		try:
+			results = DataQualityAnalyzer(
+				sample,
+				self._config,
+				fused=self._fused,
+				persist=False,
+				max_concurrency=self._max_concurrency,
+				executor=self._executor
+			).run_profilers()
+			sample_counts = self.get_sample_counts(sample, key)
+		finally:
+			self.release_data(sample)
+
+		sample_count = sum(count for _, count, _ in sample_counts)
+		total = sampler.get_total([(stratum, count) for stratum, count, _ in sample_counts])
+		offset = len(self._config)
+		for index, result in enumerate(results):
+			null_estimates = sampler.get_estimates(
+				[(stratum, count, counts[index]) for stratum, count, counts in sample_counts], total
+			)
+			result.update({
+				"total_count": int(round(total)),
+				"null_count": null_estimates["count"],
+				"null_count_ci": null_estimates["count_ci"],
+				"sample_count": sample_count,
+				"confidence": sampler.get_confidence()
+			})
+			for constraint in result["constraints"]:
+				invalid_estimates = sampler.get_estimates(
+					[(stratum, count, counts[offset]) for stratum, count, counts in sample_counts], total
+				)
+				constraint.update({
+					"invalid_count": invalid_estimates["count"],
+					"invalid_count_ci": invalid_estimates["count_ci"],
+					"invalid_rate": invalid_estimates["rate"],
+					"invalid_rate_ci": invalid_estimates["rate_ci"]
+				})
+				offset += 1
+		return results
+
+	def run_profilers_in_processes(self) -> List[Dict[str, Any]]:
+		"""
+		Profiles the columns of a pandas dataframe on a pool of worker processes, each column is shared with the
+		workers through shared memory instead of being pickled
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each of the configured column, in the order of the config
+		"""
+		if not isinstance(self._data, pandas_df):
+			raise NotImplementedError
+		shared_columns: List[SharedColumn] = []
+		try:
+			for column_config in self._config:
+				shared_columns.append(SharedColumn(self._data[column_config.get("name")]))
+			with ProcessPoolExecutor(
+					max_workers=max(self._max_concurrency, 1),
+					mp_context=multiprocessing.get_context("spawn")
+			) as executor:
+				return list(executor.map(profile_shared_column, shared_columns, self._config))
+		finally:
+			for shared_column in shared_columns:
+				shared_column.unlink()
+
+	def compute_states(self) -> List[ColumnState]:
+		"""
+		Computes the mergeable state of each configured column, for ex: of the new partition of a table
+
+		Returns:
+			:obj:`List[ColumnState]`: The state of each of the configured column, in the order of the config
+		"""
+		data = self.prepare_data()
+		try:
+			return [self.get_profiler(data, column_config).get_state() for column_config in self._config]
+		finally:
+			self.release_data(data)
+
+	def get_states(self) -> Optional[List[ColumnState]]:
+		"""
+		Returns:
+			:obj:`List[ColumnState]`: The state of each of the configured column built by the last run of the profilers
+			with ``states``, in the order of the config, ``None`` if not all the columns were profiled
+		"""
+		if not self._states or len(self._column_states) < len(self._config):
+			return None
+		return [self._column_states[column_config.get("name")] for column_config in self._config]
+
+	def merge_states(self, states: List[List[Union[ColumnState, Dict[str, Any]]]]) -> List[ColumnState]:
+		"""
+		Args:
+			states (:obj:`List[List[ColumnState | Dict[str, Any]]]`): The states of multiple partitions, each as
+				returned by :meth:`compute_states` or serialized with :meth:`ColumnState.to_dict`
+
+		Returns:
+			:obj:`List[ColumnState]`: The merged state of each of the configured column
+		"""
+		merged_states = [ColumnState() for _ in self._config]
+		for partition_states in states:
+			if len(partition_states) != len(self._config):
+				raise ValueError("The number of states does not match the number of configured columns")
+			for merged_state, state in zip(merged_states, partition_states):
+				merged_state.merge(state if isinstance(state, ColumnState) else ColumnState.from_dict(state))
+		return merged_states
+
+	def get_state_result(self, states: List[ColumnState]) -> List[Dict[str, Any]]:
+		"""
+		Args:
+			states (:obj:`List[ColumnState]`): The state of each of the configured column
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each column computed from its state, the unique count and top
+			values are estimated from the sketches and the constraints do not contain sample invalid values
+		"""
+		return [state.get_result(column_config) for column_config, state in zip(self._config, states)]
+
+	def detect_drift(
+			self,
+			baseline_states: List[Union[ColumnState, Dict[str, Any]]],
+			current_states: Optional[List[Union[ColumnState, Dict[str, Any]]]] = None,
+			bins: int = 10,
+			thresholds: Optional[Dict[str, float]] = None
+	) -> List[Dict[str, Any]]:
+		"""
+		Args:
+			baseline_states (:obj:`List[ColumnState | Dict[str, Any]]`): The states of a previous run of
+				:meth:`compute_states`, possibly serialized with :meth:`ColumnState.to_dict`
+			current_states (:obj:`List[ColumnState | Dict[str, Any]]`, optional): The states of the current run,
+				if missing the states of the last :meth:`analyze` with ``states`` are used, else they are computed
+				with :meth:`compute_states` in another pass over the data
+			bins (:obj:`int`): The number of bins of the numeric distributions
+			thresholds (:obj:`Dict[str, float]`, optional): The values of the drift metrics above which a column has
+				drifted, see :obj:`dq_whistler.drift.DriftDetector`
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The drift of each configured column computed from the sketches of the states,
+			see :meth:`dq_whistler.drift.DriftDetector.compare_column`
+		"""
+		if current_states is None:
+			current_states = self.get_states() or self.compute_states()
+		return DriftDetector(self._config, bins=bins, thresholds=thresholds).compare(baseline_states, current_states)
+
+	def analyze_incremental(
+			self,
+			stored_states: List[List[Dict[str, Any]]]
+	) -> Tuple[str, List[Dict[str, Any]]]:
+		"""
+		Scans only the data of the analyzer, usually the newly added partition, and merges its state with the stored
+		states of the previous partitions
+
+		Args:
+			stored_states (:obj:`List[List[Dict[str, Any]]]`): The serialized states of the previous partitions
+
+		Returns:
+			:obj:`Tuple[str, List[Dict[str, Any]]]`: The :obj:`JSON` string containing the stats for the whole table
+			and the serialized state of the scanned data, to be stored along with the previous states
+		"""
+		states = self.compute_states()
+		merged_states = self.merge_states([*stored_states, states])
+		serialized_states = [state.to_dict() for state in states]
+		return json.dumps(self.get_state_result(merged_states), cls=NpEncoder), serialized_states
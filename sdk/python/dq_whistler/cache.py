@@ -0,0 +1,268 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, List, Any, Union, Optional, Tuple
+import numpy as np
+import pandas as pd
+from py4j.protocol import Py4JError, Py4JJavaError
+from pyspark import SparkContext
+from pandas.core.frame import DataFrame as pandas_df
+from pandas.core.series import Series as pandas_series
+from pyspark.sql.dataframe import DataFrame as spark_df
+
+
+class ResultCache:
+	"""
+	On-disk cache of the results of :meth:`dq_whistler.analyzer.DataQualityAnalyzer.analyze`, keyed by a hash of the
+	config of the columns along with a fingerprint of the data, so that re-running the analyzer on unchanged data (for
+	retries and backfills) returns the stored result without profiling again. The fingerprint of a Spark dataframe is
+	its input files with the sizes and modification times listed by its file index, the format and the read options
+	along with the canonical string of its plan, so it is stable across sessions. Dataframes not read from files (for
+	ex: created from local data or read through a data source V2) are not cached, nor is any dataframe whose plan or
+	file index can not be read through the JVM. The fingerprint of a pandas dataframe is a hash of its content. The
+	least recently used results are evicted beyond ``max_entries`` results or ``max_bytes`` bytes
+
+	Args:
+		directory (:obj:`str`): The directory of the cache, created if missing, it can be shared by multiple processes
+		max_entries (:obj:`int`, optional): The max number of results kept, unbounded if ``None``
+		max_bytes (:obj:`int`, optional): The max total size of the results kept, unbounded if ``None``
+	"""
+	_directory: str
+	_max_entries: Optional[int]
+	_max_bytes: Optional[int]
+	_lock: threading.Lock
+	_hits: int
+	_misses: int
+
+	_suffix = ".json"
+
+	def __init__(self, directory: str, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None):
+		"""
+		Creates an instance of :obj:`ResultCache`
+		"""
+		if (max_entries is not None and max_entries < 1) or (max_bytes is not None and max_bytes < 1):
+			raise ValueError("The limits of the cache should be positive")
+		os.makedirs(directory, exist_ok=True)
+		self._directory = directory
+		self._max_entries = max_entries
+		self._max_bytes = max_bytes
+		self._lock = threading.Lock()
+		self._hits = 0
+		self._misses = 0
+
+	@staticmethod
+	def get_fingerprint(data: Union[spark_df, pandas_df]) -> Optional[str]:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data to be analyzed
+
+		Returns:
+			:obj:`str`: The fingerprint of the data, ``None`` if the data can not be fingerprinted cheaply
+		"""
+		digest = hashlib.sha256()
+		if isinstance(data, spark_df):
+			try:
+				plan = data._jdf.queryExecution().optimizedPlan()
+				relations = []
+				leaves = plan.collectLeaves().iterator()
+				while leaves.hasNext():
+					leaf = leaves.next()
+					if leaf.getClass().getSimpleName() != "LogicalRelation":
+						return None
+					relation = leaf.relation()
+					if relation.getClass().getSimpleName() != "HadoopFsRelation":
+						return None
+					relations.append(relation)
+				if not relations:
+					return None
+				spark_context = SparkContext.getOrCreate()
+				converters = spark_context._jvm.scala.collection.JavaConverters
+				for relation in relations:
+					options = dict(converters.mapAsJavaMap(relation.options()))
+					digest.update(f"{relation.fileFormat().toString()}:{json.dumps(options, sort_keys=True)}\n".encode())
+					# the sizes and modification times listed by the file index, without a call per file
+					statuses = relation.location().allFiles().iterator()
+					files = []
+					while statuses.hasNext():
+						status = statuses.next()
+						files.append(f"{status.getPath().toString()}:{status.getLen()}:{status.getModificationTime()}\n")
+					digest.update("".join(sorted(files)).encode())
+				# the canonical plan numbers the attributes from 0, unlike the semantic hash it is stable across sessions
+				digest.update(f"{plan.canonicalized().toString()}:{data.schema.json()}".encode())
+				return f"spark-{digest.hexdigest()}"
+			except (Py4JJavaError, Py4JError):
+				# for ex: a file index not backed by a listing or a mismatch of the JVM classes, the data is profiled
+				return None
+
+		if isinstance(data, pandas_df):
+			try:
+				hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+			except TypeError:
+				# columns of unhashable values, for ex: lists
+				return None
+			digest.update(hashes.tobytes())
+			digest.update(json.dumps([[str(name), str(dtype)] for name, dtype in data.dtypes.items()]).encode())
+			return f"pandas-{digest.hexdigest()}"
+
+		raise NotImplementedError
+
+	def get_key(self, data: Union[spark_df, pandas_df], params: Dict[str, Any]) -> Optional[str]:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data to be analyzed
+			params (:obj:`Dict[str, Any]`): The config of the columns and the other params the result depends on
+
+		Returns:
+			:obj:`str`: The key of the result, ``None`` if the result can not be cached
+		"""
+		fingerprint = self.get_fingerprint(data)
+		if fingerprint is None:
+			return None
+		try:
+			params_json = json.dumps(params, sort_keys=True, default=self.encode_param)
+		except TypeError:
+			return None
+		return hashlib.sha256(f"{fingerprint}:{params_json}".encode()).hexdigest()
+
+	def encode_param(self, value: Any) -> Any:
+		"""
+		Args:
+			value (:obj:`Any`): A value of the params which is not :obj:`JSON` serializable, for ex: the dataframe of
+				the values of a value set constraint
+
+		Returns:
+			:obj:`Any`: The serializable value, dataframes are replaced by their fingerprint
+		"""
+		if isinstance(value, (np.generic, np.ndarray)):
+			return value.tolist()
+		if isinstance(value, pandas_series):
+			value = value.to_frame()
+		if isinstance(value, (spark_df, pandas_df)):
+			fingerprint = self.get_fingerprint(value)
+			if fingerprint is None:
+				raise TypeError("The dataframe in the params can not be fingerprinted")
+			return fingerprint
+		raise TypeError(f"The params can not be serialized, got {type(value)}")
+
+	def get_path(self, key: str) -> str:
+		"""
+		Args:
+			key (:obj:`str`): The key of a result
+
+		Returns:
+			:obj:`str`: The path of the file of the result
+		"""
+		return os.path.join(self._directory, key + self._suffix)
+
+	def get(self, key: str) -> Optional[str]:
+		"""
+		Args:
+			key (:obj:`str`): The key of a result
+
+		Returns:
+			:obj:`str`: The stored result, ``None`` if missing, a hit marks the result as recently used
+		"""
+		path = self.get_path(key)
+		try:
+			with open(path) as result_file:
+				result = result_file.read()
+			os.utime(path)
+		except OSError:
+			with self._lock:
+				self._misses += 1
+			return None
+		with self._lock:
+			self._hits += 1
+		return result
+
+	def put(self, key: str, result: str) -> None:
+		"""
+		Stores a result, written to a temporary file first so that a concurrent reader never sees a partial result,
+		and evicts the least recently used results beyond the limits
+
+		Args:
+			key (:obj:`str`): The key of the result
+			result (:obj:`str`): The result
+		"""
+		descriptor, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+		try:
+			with os.fdopen(descriptor, "w") as temp_file:
+				temp_file.write(result)
+			os.replace(temp_path, self.get_path(key))
+		except BaseException:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			raise
+		self.evict()
+
+	def get_entries(self) -> List[Tuple[str, int, int]]:
+		"""
+		Returns:
+			:obj:`List[Tuple[str, int, int]]`: The path, the size and the last use time (ns) of each stored result,
+			the least recently used first
+		"""
+		entries = []
+		with os.scandir(self._directory) as scan:
+			for entry in scan:
+				if not entry.name.endswith(self._suffix):
+					continue
+				try:
+					stat = entry.stat()
+				except OSError:
+					# evicted by another process
+					continue
+				entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+		return sorted(entries, key=lambda entry: entry[2])
+
+	def evict(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The number of least recently used results removed to satisfy the limits
+		"""
+		entries = self.get_entries()
+		total_bytes = sum(size for _, size, _ in entries)
+		evicted = 0
+		for path, size, _ in entries:
+			over_entries = self._max_entries is not None and len(entries) - evicted > self._max_entries
+			over_bytes = self._max_bytes is not None and total_bytes > self._max_bytes
+			if not over_entries and not over_bytes:
+				break
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+			evicted += 1
+			total_bytes -= size
+		return evicted
+
+	def clear(self) -> None:
+		"""
+		Removes all the stored results
+		"""
+		for path, _, _ in self.get_entries():
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+
+	def get_stats(self) -> Dict[str, int]:
+		"""
+		Returns:
+			:obj:`Dict[str, int]`: The hits and misses of this instance along with the stored results
+			Sample Output::
+				{
+					"hits": 3,
+					"misses": 1,
+					"entries": 4,
+					"bytes": 20480
+				}
+		"""
+		entries = self.get_entries()
+		return {
+			"hits": self._hits,
+			"misses": self._misses,
+			"entries": len(entries),
+			"bytes": sum(size for _, size, _ in entries)
+		}
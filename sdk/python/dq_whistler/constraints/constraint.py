@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Optional, Tuple
 from pandas.core.series import Series as pandas_df
+from pyspark.sql.column import Column
 from pyspark.sql.dataframe import DataFrame as spark_df
 import json
 
@@ -40,6 +41,71 @@ class Constraint(ABC):
         """
         return self._column_name
 
+    def get_mode(self) -> str:
+        """
+        Returns:
+            :obj:`str`: The execution mode of the constraint, ``count`` counts all the invalid values while ``exists``
+            stops at the first invalid value
+        """
+        mode = self._constraint.get("mode", "count")
+        if mode not in ("count", "exists"):
+            raise NotImplementedError
+        return mode
+
+    def is_blocking(self) -> bool:
+        """
+        Returns:
+            :obj:`bool`: ``True`` if the remaining constraints are to be skipped once this constraint fails
+        """
+        return bool(self._constraint.get("blocking", False))
+
+    def get_referenced_columns(self) -> List[str]:
+        """
+        Returns:
+            :obj:`List[str]`: The names of all the columns required to evaluate the constraint
+        """
+        return [self._column_name]
+
+    def get_failure_expr(self) -> Column:
+        """
+        Returns:
+            :obj:`pyspark.sql.Column`: The boolean spark expression which is ``True`` for the ``invalid cases`` of the
+            constraint, this allows multiple constraints to be evaluated together in a single aggregation
+        """
+        raise NotImplementedError
+
+    def prepare_failure_df(self, data_frame: spark_df) -> spark_df:
+        """
+        Args:
+            data_frame (:obj:`pyspark.sql.DataFrame`): Dataframe containing the column of the constraint
+
+        Returns:
+            :obj:`pyspark.sql.DataFrame`: The dataframe on which :meth:`get_failure_expr` is evaluated, with the same
+            rows, for ex: along with a column joined from another dataframe. The dataframe itself by default
+        """
+        return data_frame
+
+    def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+        """
+        Args:
+            min_value (:obj:`Any`): The min of the values, for ex: from the statistics of a Parquet row group
+            max_value (:obj:`Any`): The max of the values
+
+        Returns:
+            :obj:`bool`: ``True`` if every value in between the min and max satisfies the constraint, so the values
+            need not be read. ``False`` by default, as most constraints can not be decided from the range alone
+        """
+        return False
+
+    def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+        """
+        Returns:
+            :obj:`Tuple[str, str, bool]`: The kind of string match (``contains``, ``starts_with``, ``ends_with`` or
+            ``regex``), the pattern and whether a match is invalid, so that the patterns of multiple constraints can
+            be matched together. ``None`` for the constraints which are not a string match
+        """
+        return None
+
     @abstractmethod
     def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
         """
@@ -86,9 +152,51 @@ class Constraint(ABC):
         unmatched_df = self.get_failure_df(data_frame)
         unmatched_count = unmatched_df.count()
         sample_invalid_values = self.get_sample_invalid_values(unmatched_df)
+        return self.get_result(unmatched_count, sample_invalid_values)
+
+    def execute_exists(self, data_frame: Union[spark_df, pandas_df]) -> Dict[str, Any]:
+        """
+        Args:
+            data_frame (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.series.Series`): Column data
+
+        Returns:
+            :obj:`dict[str, Any]`: The output of the constraint checking only for the existence of an invalid value,
+            on Spark the scan stops at the first one. The ``invalid_count`` is ``None`` for a failed constraint as the
+            invalid values are not counted
+        """
+        unmatched_df = self.get_failure_df(data_frame)
+        if isinstance(unmatched_df, spark_df):
+            unmatched_df = unmatched_df.limit(1)
+        sample_invalid_values = self.get_sample_invalid_values(unmatched_df)[:1]
+        output = self.get_result(len(sample_invalid_values), sample_invalid_values)
+        if sample_invalid_values:
+            output["invalid_count"] = None
+        return output
+
+    def get_skipped_result(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`dict[str, Any]`: The output of a constraint which was not evaluated, as a blocking constraint failed
+        """
+        return {
+            **self._constraint,
+            "constraint_status": "skipped",
+            "invalid_count": None,
+            "invalid_values": []
+        }
+
+    def get_result(self, invalid_count: int, invalid_values: List) -> Dict[str, Any]:
+        """
+        Args:
+            invalid_count (:obj:`int`): Count of the invalid values as per the constraint
+            invalid_values (:obj:`list`): A list containing the sample invalid values
+
+        Returns:
+            :obj:`dict[str, Any]`: The dict containing the final output for one constraint
+        """
         return {
             **self._constraint,
-            "constraint_status": "failed" if unmatched_count > 0 else "success",
-            "invalid_count": unmatched_count,
-            "invalid_values": sample_invalid_values
+            "constraint_status": "failed" if invalid_count > 0 else "success",
+            "invalid_count": invalid_count,
+            "invalid_values": invalid_values
         }
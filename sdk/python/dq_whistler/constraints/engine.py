@@ -0,0 +1,221 @@
+import logging
+from functools import reduce
+from typing import Dict, List, Any, Optional
+import pyspark.sql.functions as f
+from pyspark.sql.column import Column
+from pyspark.sql.dataframe import DataFrame as spark_df
+from dq_whistler.constraints.constraint import Constraint
+from dq_whistler.constraints.number_type import (
+    LessThan, GreaterThan, LessThanEqualTo, GreaterThanEqualTo, Between, NotBetween
+)
+from dq_whistler.parquet_stats import ParquetFooterStats
+
+
+class ConstraintEngine:
+    """
+    Engine to evaluate multiple constraints, possibly of different columns, on a spark dataframe together.
+    The invalid counts of all the constraints are computed as conditional aggregates in a single job and the sample
+    invalid values are gathered in one more pass, which stops as soon as every failed constraint has its samples. The
+    dataframe is first prepared by each constraint, see :meth:`Constraint.prepare_failure_df`, the aggregate
+    expressions of other metrics can be computed on :meth:`get_data` as well
+
+    Args:
+        data (:obj:`pyspark.sql.DataFrame`): Dataframe containing the columns of all the constraints
+        constraints (:obj:`List[Constraint]`): The constraints to be evaluated
+        sample_size (:obj:`int`): Max number of sample invalid values per constraint
+    """
+    _data: spark_df
+    _constraints: List[Constraint]
+    _sample_size: int
+
+    def __init__(self, data: spark_df, constraints: List[Constraint], sample_size: int = 10):
+        """
+        Creates an instance of :obj:`ConstraintEngine`
+        """
+        self._data = reduce(lambda data_frame, constraint: constraint.prepare_failure_df(data_frame), constraints, data)
+        self._constraints = constraints
+        self._sample_size = sample_size
+
+    def get_data(self) -> spark_df:
+        """
+        Returns:
+            :obj:`pyspark.sql.DataFrame`: The dataframe prepared for the failure expressions of the constraints, with
+            the same rows as the given dataframe
+        """
+        return self._data
+
+    def get_invalid_count_exprs(self) -> List[Column]:
+        """
+        Returns:
+            :obj:`List[pyspark.sql.Column]`: Aggregate expressions for the invalid count of each constraint, these can
+            be combined with other aggregate expressions on the same dataframe
+        """
+        return [
+            f.count(f.when(constraint.get_failure_expr(), True))
+            for constraint in self._constraints
+        ]
+
+    def get_invalid_counts(self) -> List[int]:
+        """
+        Returns:
+            :obj:`List[int]`: The invalid count of each constraint, computed in a single job
+        """
+        if not self._constraints:
+            return []
+        return [int(count) for count in self._data.agg(*self.get_invalid_count_exprs()).first()]
+
+    def get_sample_invalid_values(self, invalid_counts: List[int]) -> List[List]:
+        """
+        Args:
+            invalid_counts (:obj:`List[int]`): The invalid count of each constraint
+
+        Returns:
+            :obj:`List[list]`: The sample invalid values of each constraint
+        """
+        samples: List[List] = [[] for _ in self._constraints]
+        failed = [index for index, count in enumerate(invalid_counts) if count > 0]
+        if not failed:
+            return samples
+
+        predicates = [self._constraints[index].get_failure_expr() for index in failed]
+        # Each failed value is wrapped in a struct, so that a null struct means the row is valid for that constraint
+        sample_columns = [
+            f.when(predicate, f.struct(f.col(self._constraints[index].get_column_name())))
+            for index, predicate in zip(failed, predicates)
+        ]
+        rows = self._data \
+            .filter(reduce(lambda left, right: left | right, predicates)) \
+            .select(*sample_columns) \
+            .toLocalIterator()
+
+        remaining = {
+            index: min(self._sample_size, invalid_counts[index])
+            for index in failed
+        }
+        for row in rows:
+            for position, index in enumerate(failed):
+                if row[position] is not None and remaining[index] > 0:
+                    samples[index].append(row[position][0])
+                    remaining[index] -= 1
+            if not any(remaining.values()):
+                break
+        return samples
+
+    def execute(self, invalid_counts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Args:
+            invalid_counts (:obj:`List[int]`, optional): Precomputed invalid count of each constraint
+
+        Returns:
+            :obj:`List[Dict[str, Any]]`: The output of each of the constraint, in the order of the constraints
+        """
+        if invalid_counts is None:
+            invalid_counts = self.get_invalid_counts()
+        samples = self.get_sample_invalid_values(invalid_counts)
+        return [
+            constraint.get_result(count, sample)
+            for constraint, count, sample in zip(self._constraints, invalid_counts, samples)
+        ]
+
+
+class RowGroupConstraintEngine:
+    """
+    Engine to evaluate range constraints on Parquet files using the min/max statistics of each row group. A row group
+    whose range can not contain an invalid value is skipped, a constraint skipping every row group is valid without
+    reading any data. The remaining constraints are evaluated together on the Spark dataframe filtered by their
+    failure predicates, which Spark pushes down to the Parquet reader so that it skips the same row groups, see
+    :obj:`ConstraintEngine`
+
+    Args:
+        footer_stats (:obj:`ParquetFooterStats`): The footer stats of the Parquet files
+        constraints (:obj:`List[Constraint]`): The constraints to be evaluated, see :meth:`supports`
+        data (:obj:`pyspark.sql.DataFrame`): Dataframe read from the Parquet files, containing the columns of all the
+            constraints
+        sample_size (:obj:`int`): Max number of sample invalid values per constraint
+    """
+    _footer_stats: ParquetFooterStats
+    _constraints: List[Constraint]
+    _data: spark_df
+    _sample_size: int
+
+    range_constraints = (LessThan, GreaterThan, LessThanEqualTo, GreaterThanEqualTo, Between, NotBetween)
+
+    def __init__(
+            self,
+            footer_stats: ParquetFooterStats,
+            constraints: List[Constraint],
+            data: spark_df,
+            sample_size: int = 10
+    ):
+        """
+        Creates an instance of :obj:`RowGroupConstraintEngine`
+        """
+        self._footer_stats = footer_stats
+        self._constraints = constraints
+        self._data = data
+        self._sample_size = sample_size
+
+    @classmethod
+    def supports(cls, footer_stats: ParquetFooterStats, constraint: Constraint) -> bool:
+        """
+        Args:
+            footer_stats (:obj:`ParquetFooterStats`): The footer stats of the Parquet files
+            constraint (:obj:`Constraint`): The constraint
+
+        Returns:
+            :obj:`bool`: ``True`` if the constraint is a range constraint on an integer column having stats in every
+            row group, the constraints in the ``exists`` mode are left to the profiler, which stops at the first
+            invalid value and honours the gate of ``fail_fast``
+        """
+        return isinstance(constraint, cls.range_constraints) \
+            and constraint.get_mode() != "exists" \
+            and footer_stats.has_numeric_stats(constraint.get_column_name())
+
+    def can_skip(self, constraint: Constraint, row_group: Dict[str, Any]) -> bool:
+        """
+        Args:
+            constraint (:obj:`Constraint`): The constraint
+            row_group (:obj:`Dict[str, Any]`): The row group, as returned by :meth:`ParquetFooterStats.get_row_groups`
+
+        Returns:
+            :obj:`bool`: ``True`` if the row group can not contain an invalid value for the constraint, nulls never
+            fail a range constraint
+        """
+        column = row_group["columns"][constraint.get_column_name()]
+        if column["null_count"] == row_group["num_rows"]:
+            return True
+        if column["min"] is None or column["max"] is None:
+            return False
+        return constraint.is_valid_for_range(column["min"], column["max"])
+
+    def execute(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            :obj:`List[Dict[str, Any]]`: The output of each of the constraint, in the order of the constraints, along
+            with the number of row groups skipped for it
+        """
+        row_groups = self._footer_stats.get_row_groups()
+        scanned = [
+            [index for index, row_group in enumerate(row_groups) if not self.can_skip(constraint, row_group)]
+            for constraint in self._constraints
+        ]
+        remaining = [position for position, indexes in enumerate(scanned) if indexes]
+        outputs: List[Optional[Dict[str, Any]]] = [None] * len(self._constraints)
+        if remaining:
+            constraints = [self._constraints[position] for position in remaining]
+            predicate = reduce(lambda left, right: left | right, [c.get_failure_expr() for c in constraints])
+            engine = ConstraintEngine(self._data.filter(predicate), constraints, self._sample_size)
+            for position, output in zip(remaining, engine.execute()):
+                outputs[position] = output
+
+        results = []
+        for constraint, indexes, output in zip(self._constraints, scanned, outputs):
+            results.append({
+                **(output if output is not None else constraint.get_result(0, [])),
+                "skipped_row_groups": len(row_groups) - len(indexes)
+            })
+        logging.info(
+            f"Skipped {sum(result['skipped_row_groups'] for result in results)} of "
+            f"{len(row_groups) * len(results)} row group checks using the Parquet statistics"
+        )
+        return results
@@ -0,0 +1,123 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple, Pattern
+import numpy as np
+from pandas.core.series import Series as pandas_df
+
+try:
+	import ahocorasick
+except ImportError:
+	ahocorasick = None
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> Pattern:
+	"""
+	Args:
+		pattern (:obj:`str`): The regular expression
+
+	Returns:
+		:obj:`re.Pattern`: The compiled expression, cached so that a pattern is compiled once per process
+	"""
+	return re.compile(pattern)
+
+
+class StringMatcher:
+	"""
+	Evaluates multiple ``contains``, ``starts_with``, ``ends_with`` and ``regex`` patterns on a pandas column and
+	returns a match bitmap with a column per pattern. For python backed strings with many literal patterns, all the
+	literals are matched in a single scan of each value through an Aho-Corasick automaton if ``pyahocorasick`` is
+	installed. Arrow backed strings are matched with the vectorized Arrow kernels, one per pattern, which are faster
+	than any scan in python. The regular expressions are compiled once
+
+	Args:
+		patterns (:obj:`List[Tuple[str, str]]`): The kind of match and the pattern, for ex: ``("contains", "abc")``
+	"""
+	_patterns: List[Tuple[str, str]]
+
+	_kinds = ("contains", "starts_with", "ends_with", "regex")
+	_literal_kinds = ("contains", "starts_with", "ends_with")
+	# below this the vectorized per pattern scans are faster than the automaton
+	_automaton_min_patterns = 4
+
+	def __init__(self, patterns: List[Tuple[str, str]]):
+		"""
+		Creates an instance of :obj:`StringMatcher`
+		"""
+		for kind, _ in patterns:
+			if kind not in self._kinds:
+				raise NotImplementedError
+		self._patterns = patterns
+
+	def use_automaton(self, values: pandas_df) -> bool:
+		"""
+		Args:
+			values (:obj:`pandas.core.series.Series`): The string values
+
+		Returns:
+			:obj:`bool`: ``True`` if the literal patterns are to be matched with the Aho-Corasick automaton
+		"""
+		literals = [kind for kind, _ in self._patterns if kind in self._literal_kinds]
+		arrow_backed = getattr(values.dtype, "storage", None) == "pyarrow"
+		return ahocorasick is not None and not arrow_backed and len(literals) >= self._automaton_min_patterns
+
+	def match_literals(self, values: pandas_df, bitmap: np.ndarray) -> None:
+		"""
+		Matches all the literal patterns with an Aho-Corasick automaton, in a single scan of each value
+
+		Args:
+			values (:obj:`pandas.core.series.Series`): The string values
+			bitmap (:obj:`numpy.ndarray`): The match bitmap to be filled
+		"""
+		automaton = ahocorasick.Automaton()
+		literals: Dict[str, List[int]] = {}
+		for index, (kind, pattern) in enumerate(self._patterns):
+			if kind not in self._literal_kinds:
+				continue
+			if pattern == "":
+				bitmap[:, index] = values.notna().to_numpy(dtype=bool)
+				continue
+			literals.setdefault(pattern, []).append(index)
+		if not literals:
+			return
+		for pattern, indexes in literals.items():
+			automaton.add_word(pattern, (pattern, indexes))
+		automaton.make_automaton()
+
+		for position, value in enumerate(values.tolist()):
+			if not isinstance(value, str):
+				continue
+			for end, (pattern, indexes) in automaton.iter(value):
+				for index in indexes:
+					kind = self._patterns[index][0]
+					if kind == "contains" \
+							or (kind == "starts_with" and end == len(pattern) - 1) \
+							or (kind == "ends_with" and end == len(value) - 1):
+						bitmap[position, index] = True
+
+	def match(self, values: pandas_df) -> np.ndarray:
+		"""
+		Args:
+			values (:obj:`pandas.core.series.Series`): The string values
+
+		Returns:
+			:obj:`numpy.ndarray`: The boolean bitmap of shape ``(len(values), len(patterns))``, ``True`` where a value
+			matches a pattern, the rows of null values are all ``False``
+		"""
+		bitmap = np.zeros((len(values), len(self._patterns)), dtype=bool)
+		use_automaton = self.use_automaton(values)
+		if use_automaton:
+			self.match_literals(values, bitmap)
+		for index, (kind, pattern) in enumerate(self._patterns):
+			if kind == "regex":
+				matches = values.str.match(compile_pattern(pattern))
+			elif use_automaton:
+				continue
+			elif kind == "contains":
+				matches = values.str.contains(pattern, regex=False)
+			elif kind == "starts_with":
+				matches = values.str.startswith(pattern)
+			else:
+				matches = values.str.endswith(pattern)
+			bitmap[:, index] = matches.fillna(False).to_numpy(dtype=bool)
+		return bitmap
@@ -1,7 +1,9 @@
 from dq_whistler.constraints.constraint import Constraint
-from typing import Dict, Union
+from dq_whistler.constraints.value_set import ValueSetConstraint
+from typing import Dict, Union, Any
 import pyspark.sql.functions as f
 from pandas.core.series import Series as pandas_df
+from pyspark.sql.column import Column
 from pyspark.sql.dataframe import DataFrame as spark_df
 
 
@@ -22,6 +24,14 @@ class Equal(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``!=`` the constraint value
+		"""
+		return f.col(self._column_name) != self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -33,9 +43,7 @@ class Equal(Constraint):
 			values are ``!= 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) != self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame != self._values]
@@ -58,6 +66,14 @@ class NotEqual(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``==`` the constraint value
+		"""
+		return f.col(self._column_name) == self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -69,9 +85,7 @@ class NotEqual(Constraint):
 			values are ``= 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) == self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame == self._values]
@@ -94,6 +108,25 @@ class LessThan(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``>=`` the constraint value
+		"""
+		return f.col(self._column_name) >= self._values
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if all the values are ``<`` the constraint value
+		"""
+		return max_value < self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -105,9 +138,7 @@ class LessThan(Constraint):
 			will have rows where values are ``>= 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) >= self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame >= self._values]
@@ -130,6 +161,25 @@ class GreaterThan(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``<=`` the constraint value
+		"""
+		return f.col(self._column_name) <= self._values
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if all the values are ``>`` the constraint value
+		"""
+		return min_value > self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -141,9 +191,7 @@ class GreaterThan(Constraint):
 			are ``<= 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) <= self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame <= self._values]
@@ -166,6 +214,25 @@ class LessThanEqualTo(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``>`` the constraint value
+		"""
+		return f.col(self._column_name) > self._values
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if all the values are ``<=`` the constraint value
+		"""
+		return max_value <= self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -177,9 +244,7 @@ class LessThanEqualTo(Constraint):
 			the values are ``> 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) > self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame > self._values]
@@ -202,6 +267,25 @@ class GreaterThanEqualTo(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``<`` the constraint value
+		"""
+		return f.col(self._column_name) < self._values
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if all the values are ``>=`` the constraint value
+		"""
+		return min_value >= self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -213,9 +297,7 @@ class GreaterThanEqualTo(Constraint):
 			values are ``< 5`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) < self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame < self._values]
@@ -238,6 +320,25 @@ class Between(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is not in between the constraint values
+		"""
+		return ~f.col(self._column_name).between(*self._values)
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if all the values are in between the constraint values
+		"""
+		return self._values[0] <= min_value and max_value <= self._values[1]
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -250,12 +351,10 @@ class Between(Constraint):
 		"""
 
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).between(*self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[~data_frame.between(self._values)]
+			return data_frame[~data_frame.between(*self._values)]
 
 
 class NotBetween(Constraint):
@@ -275,6 +374,25 @@ class NotBetween(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is in between the constraint values
+		"""
+		return f.col(self._column_name).between(*self._values)
+
+	def is_valid_for_range(self, min_value: Any, max_value: Any) -> bool:
+		"""
+		Args:
+			min_value (:obj:`Any`): The min of the values
+			max_value (:obj:`Any`): The max of the values
+
+		Returns:
+			:obj:`bool`: ``True`` if no value is in between the constraint values
+		"""
+		return max_value < self._values[0] or min_value > self._values[1]
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -286,17 +404,15 @@ class NotBetween(Constraint):
 			where values ``are in between [2, 8]`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).between(*self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[data_frame.between(self._values)]
+			return data_frame[data_frame.between(*self._values)]
 
 
-class IsIn(Constraint):
+class IsIn(ValueSetConstraint):
 	"""
-	IsIn constraint class that extends the base Constraint class
+	IsIn constraint class that extends the ValueSetConstraint class
 
 	Args:
 		constraint (:obj:`Dict[str, str]`): The dict representing a constraint config
@@ -307,10 +423,19 @@ class IsIn(Constraint):
 				}
 		column_name (:obj:`str`): The name of the column for constraint check
 	"""
+	_value_type = float
 
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is not in the constraint values
+		"""
+		return ~self.get_membership_expr()
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -322,17 +447,17 @@ class IsIn(Constraint):
 			values ``are in [1, 2, 3]`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).isin(*self._values)
-			)
+			if self.is_large():
+				return self.get_join_failure_df(data_frame, "left_anti")
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[~data_frame.isin(self._values)]
+			return data_frame[~data_frame.isin(self.get_value_index()) & data_frame.notna()]
 
 
-class NotIn(Constraint):
+class NotIn(ValueSetConstraint):
 	"""
-	NotIn constraint class that extends the base Constraint class
+	NotIn constraint class that extends the ValueSetConstraint class
 
 	Args:
 		constraint (:obj:`Dict[str, str]`): The dict representing a constraint config
@@ -343,10 +468,19 @@ class NotIn(Constraint):
 				}
 		column_name (:obj:`str`): The name of the column for constraint check
 	"""
+	_value_type = float
 
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is in the constraint values
+		"""
+		return self.get_membership_expr()
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -358,9 +492,9 @@ class NotIn(Constraint):
 			values are in [1, 2, 3] (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).isin(*self._values)
-			)
+			if self.is_large():
+				return self.get_join_failure_df(data_frame, "left_semi")
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[data_frame.isin(self._values)]
+			return data_frame[data_frame.isin(self.get_value_index())]
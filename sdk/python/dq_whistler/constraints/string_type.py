@@ -1,6 +1,9 @@
 from dq_whistler.constraints.constraint import Constraint
-from typing import Dict, Union
+from dq_whistler.constraints.value_set import ValueSetConstraint
+from dq_whistler.constraints.matcher import compile_pattern
+from typing import Dict, Union, Optional, Tuple
 from pandas.core.series import Series as pandas_df
+from pyspark.sql.column import Column
 from pyspark.sql.dataframe import DataFrame as spark_df
 import pyspark.sql.functions as f
 
@@ -22,6 +25,14 @@ class Equal(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``!=`` the constraint value
+		"""
+		return f.col(self._column_name) != self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -33,9 +44,7 @@ class Equal(Constraint):
 			values are ``!= "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) != self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame != self._values]
@@ -58,6 +67,14 @@ class NotEqual(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is ``==`` the constraint value
+		"""
+		return f.col(self._column_name) == self._values
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -69,9 +86,7 @@ class NotEqual(Constraint):
 			values are ``== "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name) == self._values
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame == self._values]
@@ -94,6 +109,21 @@ class Contains(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value does not contain the constraint value
+		"""
+		return ~f.col(self._column_name).contains(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``False`` as no match is invalid
+		"""
+		return "contains", self._values, False
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -105,12 +135,10 @@ class Contains(Constraint):
 			values ``does not contains "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).contains(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[~data_frame.str.contains(self._values)]
+			return data_frame[~data_frame.str.contains(self._values, regex=False)]
 
 
 class NotContains(Constraint):
@@ -130,6 +158,21 @@ class NotContains(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value contains the constraint value
+		"""
+		return f.col(self._column_name).contains(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``True`` as a match is invalid
+		"""
+		return "contains", self._values, True
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -141,12 +184,10 @@ class NotContains(Constraint):
 			values ``contains "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).contains(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[data_frame.str.contains(self._values)]
+			return data_frame[data_frame.str.contains(self._values, regex=False)]
 
 
 class StartsWith(Constraint):
@@ -166,6 +207,21 @@ class StartsWith(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value does not start with the constraint value
+		"""
+		return ~f.col(self._column_name).startswith(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``False`` as no match is invalid
+		"""
+		return "starts_with", self._values, False
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -177,9 +233,7 @@ class StartsWith(Constraint):
 			values ``does not starts with "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).startswith(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[~data_frame.str.startswith(self._values)]
@@ -202,6 +256,21 @@ class NotStartsWith(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value starts with the constraint value
+		"""
+		return f.col(self._column_name).startswith(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``True`` as a match is invalid
+		"""
+		return "starts_with", self._values, True
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -213,9 +282,7 @@ class NotStartsWith(Constraint):
 			values ``starts with "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).startswith(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame.str.startswith(self._values)]
@@ -238,6 +305,21 @@ class EndsWith(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value does not end with the constraint value
+		"""
+		return ~f.col(self._column_name).endswith(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``False`` as no match is invalid
+		"""
+		return "ends_with", self._values, False
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -250,9 +332,7 @@ class EndsWith(Constraint):
 		"""
 
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).endswith(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[~data_frame.str.endswith(self._values)]
@@ -275,6 +355,21 @@ class NotEndsWith(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value ends with the constraint value
+		"""
+		return f.col(self._column_name).endswith(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``True`` as a match is invalid
+		"""
+		return "ends_with", self._values, True
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -286,17 +381,15 @@ class NotEndsWith(Constraint):
 			values ``ends with "abc"`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).endswith(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
 			return data_frame[data_frame.str.endswith(self._values)]
 
 
-class IsIn(Constraint):
+class IsIn(ValueSetConstraint):
 	"""
-	IsIn constraint class that extends the base Constraint class
+	IsIn constraint class that extends the ValueSetConstraint class
 
 	Args:
 		constraint (:obj:`Dict[str, str]`): The dict representing a constraint config
@@ -311,6 +404,14 @@ class IsIn(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is not in the constraint values
+		"""
+		return ~self.get_membership_expr()
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -322,17 +423,17 @@ class IsIn(Constraint):
 			values ``are not in ["abc", "xyz"]`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).isin(*self._values)
-			)
+			if self.is_large():
+				return self.get_join_failure_df(data_frame, "left_anti")
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[~data_frame.isin(self._values)]
+			return data_frame[~data_frame.isin(self.get_value_index()) & data_frame.notna()]
 
 
-class NotIn(Constraint):
+class NotIn(ValueSetConstraint):
 	"""
-	NotIn constraint class that extends the base Constraint class
+	NotIn constraint class that extends the ValueSetConstraint class
 
 	Args:
 		constraint (:obj:`Dict[str, str]`): The dict representing a constraint config
@@ -347,6 +448,14 @@ class NotIn(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value is in the constraint values
+		"""
+		return self.get_membership_expr()
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -358,12 +467,12 @@ class NotIn(Constraint):
 			values ``are in ["abc", "xyz"]`` (i.e only invalid cases)
 		"""
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				f.col(self._column_name).isin(*self._values)
-			)
+			if self.is_large():
+				return self.get_join_failure_df(data_frame, "left_semi")
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[data_frame.isin(self._values)]
+			return data_frame[data_frame.isin(self.get_value_index())]
 
 
 class Regex(Constraint):
@@ -383,6 +492,21 @@ class Regex(Constraint):
 	def __init__(self, constraint: Dict[str, str], column_name: str):
 		super().__init__(constraint, column_name)
 
+	def get_failure_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where
+			the value does not satisfy the constraint regex
+		"""
+		return ~f.col(self._column_name).rlike(self._values)
+
+	def get_match_pattern(self) -> Optional[Tuple[str, str, bool]]:
+		"""
+		Returns:
+			:obj:`Tuple[str, str, bool]`: The kind of match, the pattern and ``False`` as no match is invalid
+		"""
+		return "regex", self._values, False
+
 	def get_failure_df(self, data_frame: Union[spark_df, pandas_df]) -> Union[spark_df, pandas_df]:
 		"""
 		Args:
@@ -395,9 +519,7 @@ class Regex(Constraint):
 		"""
 
 		if isinstance(data_frame, spark_df):
-			return data_frame.filter(
-				~f.col(self._column_name).rlike(self._values)
-			)
+			return data_frame.filter(self.get_failure_expr())
 
 		if isinstance(data_frame, pandas_df):
-			return data_frame[~data_frame.str.match(pat=self._values)]
+			return data_frame[~data_frame.str.match(pat=compile_pattern(self._values))]
@@ -0,0 +1,229 @@
+import os
+import threading
+import uuid
+import weakref
+from typing import Dict, List, Any, Optional, Set, Tuple
+import pandas as pd
+import pyspark.sql.functions as f
+from pyspark.sql.column import Column
+from pandas.core.series import Series as pandas_df
+from pyspark.sql.dataframe import DataFrame as spark_df
+from dq_whistler.constraints.constraint import Constraint
+
+# the values of each ``values_file`` by its path and the type of the values, along with the modification time it was
+# read at, the profilers build their constraints multiple times per run
+_file_values: Dict[Tuple[str, type], Tuple[int, List[Any]]] = {}
+# the distinct count of each Spark dataframe of values, dropped along with the dataframe
+_values_df_counts: "weakref.WeakKeyDictionary[spark_df, int]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+
+def read_values_file(path: str, value_type: type) -> List[Any]:
+	"""
+	Args:
+		path (:obj:`str`): The path of the text file with one value per line
+		value_type (:obj:`type`): The type the values are converted to
+
+	Returns:
+		:obj:`List[Any]`: The values of the non empty lines, cached so that a file is read once per process until it
+		is modified
+	"""
+	modified_time = os.stat(path).st_mtime_ns
+	with _cache_lock:
+		cached = _file_values.get((path, value_type))
+	if cached is not None and cached[0] == modified_time:
+		return cached[1]
+	with open(path) as values_file:
+		values = [value_type(line.rstrip("\n")) for line in values_file if line.rstrip("\n")]
+	with _cache_lock:
+		_file_values[(path, value_type)] = (modified_time, values)
+	return values
+
+
+def count_values_df(values_df: spark_df) -> int:
+	"""
+	Args:
+		values_df (:obj:`pyspark.sql.DataFrame`): The dataframe of values, its first column
+
+	Returns:
+		:obj:`int`: The number of distinct values, counted by a Spark job once per dataframe
+	"""
+	with _cache_lock:
+		count = _values_df_counts.get(values_df)
+	if count is None:
+		count = int(values_df.select(values_df.columns[0]).distinct().count())
+		with _cache_lock:
+			_values_df_counts[values_df] = count
+	return count
+
+
+class ValueSetConstraint(Constraint):
+	"""
+	Base class for the constraints checking the membership of a value in a set of values. The values are either a list
+	in ``values``, a Spark/pandas dataframe (its first column) in ``values`` or a text file with one value per line in
+	``values_file``, read once until it is modified. Up to ``large_set_threshold`` values are inlined in the Spark plan
+	with ``isin``, which Catalyst turns into a hash set lookup (``InSet``). Larger sets, and sets given as a Spark
+	dataframe, stay distributed: the invalid rows are found with a broadcast join and the aggregate expressions read a
+	membership column added by a broadcast left join, see :meth:`prepare_failure_df`. On pandas the values are looked
+	up in a :obj:`pandas.Index`
+
+	Args:
+		constraint (:obj:`Dict[str, Any]`): The dict representing a constraint config
+			::
+				{
+					"name": "is_in",
+					"values_file": "/data/valid_codes.txt",
+					"large_set_threshold": 10000
+				}
+		column_name (:obj:`str`): The name of the column for constraint check
+	"""
+	_value_index: Optional[pd.Index]
+	_values_count: Optional[int]
+	_member_column: str
+
+	# the type of the values read from a ``values_file``
+	_value_type = str
+	_default_large_set_threshold = 100000
+	_join_column = "__dq_whistler_value"
+
+	def __init__(self, constraint: Dict[str, Any], column_name: str):
+		super().__init__(constraint, column_name)
+		if constraint.get("values_file") is not None:
+			self._values = read_values_file(constraint.get("values_file"), self._value_type)
+		self._value_index = None
+		self._values_count = None
+		# the membership column of each constraint is distinct, as multiple constraints prepare the same dataframe
+		self._member_column = f"__dq_whistler_member_{uuid.uuid4().hex}"
+
+	def is_values_df(self) -> bool:
+		"""
+		Returns:
+			:obj:`bool`: ``True`` if the values are given as a Spark dataframe
+		"""
+		return isinstance(self._values, spark_df)
+
+	def get_value_list(self) -> List[Any]:
+		"""
+		Returns:
+			:obj:`List[Any]`: The values as a list, a Spark dataframe of values is collected to the driver, which is
+			only required to look up the values of a pandas column
+		"""
+		if self.is_values_df():
+			return [row[0] for row in self._values.select(self._values.columns[0]).distinct().collect()]
+		if isinstance(self._values, pd.DataFrame):
+			return self._values.iloc[:, 0].tolist()
+		if isinstance(self._values, (pandas_df, pd.Index)):
+			return self._values.tolist()
+		return list(self._values)
+
+	def get_value_set(self) -> Set[Any]:
+		"""
+		Returns:
+			:obj:`Set[Any]`: The values as a hashed set
+		"""
+		return set(self.get_value_list())
+
+	def get_value_index(self) -> pd.Index:
+		"""
+		Returns:
+			:obj:`pandas.Index`: The unique values as an index, built once for the hashed lookups of ``isin``
+		"""
+		if self._value_index is None:
+			self._value_index = pd.Index(self.get_value_list()).unique()
+		return self._value_index
+
+	def is_large(self) -> bool:
+		"""
+		Returns:
+			:obj:`bool`: ``True`` if the values are not to be inlined in the Spark plan
+		"""
+		if self.is_values_df():
+			return True
+		threshold = self._constraint.get("large_set_threshold", self._default_large_set_threshold)
+		return len(self.get_value_list()) > threshold
+
+	def get_values_count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The number of distinct values, counted by Spark once for a Spark dataframe of values, see
+			:func:`count_values_df`
+		"""
+		if self._values_count is None:
+			if self.is_values_df():
+				self._values_count = count_values_df(self._values)
+			else:
+				self._values_count = len(self.get_value_index())
+		return self._values_count
+
+	def get_membership_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression which is ``True`` for the rows where the value is in the values
+			and ``null`` for the null values, for a large set it reads the membership column of
+			:meth:`prepare_failure_df`
+		"""
+		if not self.is_large():
+			return f.col(self._column_name).isin(*self.get_value_list())
+		return f.when(f.col(self._column_name).isNotNull(), f.col(self._member_column).isNotNull())
+
+	def prepare_failure_df(self, data_frame: spark_df) -> spark_df:
+		"""
+		Args:
+			data_frame (:obj:`pyspark.sql.DataFrame`): Dataframe containing the column of the constraint
+
+		Returns:
+			:obj:`pyspark.sql.DataFrame`: The dataframe along with the membership column of a large set, non null for the
+			rows whose value is in the values, joined with the broadcast distinct values so that the rows are kept
+		"""
+		if not self.is_large():
+			return data_frame
+		values_df = self.get_values_df(data_frame)
+		values_df = f.broadcast(values_df.select(f.col(self._join_column).alias(self._member_column)))
+		return data_frame.join(values_df, f.col(self._column_name) == f.col(self._member_column), "left")
+
+	def get_values_df(self, data_frame: spark_df) -> spark_df:
+		"""
+		Args:
+			data_frame (:obj:`pyspark.sql.DataFrame`): The column data, the values are cast to the type of the column
+
+		Returns:
+			:obj:`pyspark.sql.DataFrame`: The distinct values in a single column dataframe
+		"""
+		if self.is_values_df():
+			values_df = self._values.select(f.col(self._values.columns[0]).alias(self._join_column))
+		else:
+			values_df = data_frame.sparkSession.createDataFrame(
+				[(value,) for value in self.get_value_set()], [self._join_column]
+			)
+		data_type = data_frame.schema[self._column_name].dataType
+		return values_df.select(f.col(self._join_column).cast(data_type).alias(self._join_column)).distinct()
+
+	def get_join_failure_df(self, data_frame: spark_df, how: str) -> spark_df:
+		"""
+		Args:
+			data_frame (:obj:`pyspark.sql.DataFrame`): The column data
+			how (:obj:`str`): ``left_anti`` for the rows not in the values or ``left_semi`` for the rows in the values
+
+		Returns:
+			:obj:`pyspark.sql.DataFrame`: The non null rows of the column data joined with the broadcast values
+		"""
+		values_df = f.broadcast(self.get_values_df(data_frame))
+		return data_frame \
+			.filter(f.col(self._column_name).isNotNull()) \
+			.join(values_df, f.col(self._column_name) == values_df[self._join_column], how)
+
+	def get_result(self, invalid_count: int, invalid_values: List) -> Dict[str, Any]:
+		"""
+		Args:
+			invalid_count (:obj:`int`): Count of the invalid values as per the constraint
+			invalid_values (:obj:`list`): A list containing the sample invalid values
+
+		Returns:
+			:obj:`dict[str, Any]`: The output of the constraint, a large set or a dataframe of values is replaced by
+			``values_count`` in the output
+		"""
+		output = super(ValueSetConstraint, self).get_result(invalid_count, invalid_values)
+		if self.is_large() or not isinstance(self._values, (list, tuple, set)):
+			output.pop("values", None)
+			output["values_count"] = self.get_values_count()
+		return output
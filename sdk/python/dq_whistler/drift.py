@@ -0,0 +1,299 @@
+from typing import Dict, List, Any, Union, Optional, Tuple
+import numpy as np
+from dq_whistler.profiler.column_state import ColumnState
+from dq_whistler.sketches.space_saving import SpaceSaving
+from dq_whistler.sketches.tdigest import TDigest
+
+
+def get_psi(expected: List[float], actual: List[float], epsilon: float = 1e-4) -> float:
+	"""
+	Args:
+		expected (:obj:`List[float]`): The fraction of the baseline values in each bin
+		actual (:obj:`List[float]`): The fraction of the current values in each bin
+		epsilon (:obj:`float`): The lower bound of the fractions, so that empty bins do not give infinite values
+
+	Returns:
+		:obj:`float`: The population stability index, ``sum((actual - expected) * ln(actual / expected))``
+	"""
+	expected = np.maximum(np.asarray(expected, dtype="float64"), epsilon)
+	actual = np.maximum(np.asarray(actual, dtype="float64"), epsilon)
+	return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def get_kl_divergence(expected: List[float], actual: List[float], epsilon: float = 1e-4) -> float:
+	"""
+	Args:
+		expected (:obj:`List[float]`): The fraction of the baseline values in each bin
+		actual (:obj:`List[float]`): The fraction of the current values in each bin
+		epsilon (:obj:`float`): The lower bound of the fractions, so that empty bins do not give infinite values
+
+	Returns:
+		:obj:`float`: The Kullback-Leibler divergence of the current distribution from the baseline one,
+		``sum(actual * ln(actual / expected))``
+	"""
+	expected = np.maximum(np.asarray(expected, dtype="float64"), epsilon)
+	actual = np.maximum(np.asarray(actual, dtype="float64"), epsilon)
+	return float(np.sum(actual * np.log(actual / expected)))
+
+
+def get_ks_statistic(baseline: TDigest, current: TDigest) -> Optional[float]:
+	"""
+	Args:
+		baseline (:obj:`TDigest`): The quantile sketch of the baseline values
+		current (:obj:`TDigest`): The quantile sketch of the current values
+
+	Returns:
+		:obj:`float`: The Kolmogorov-Smirnov statistic, the largest difference between the cumulative distributions
+		of the sketches evaluated at the centroids of both, ``None`` if either sketch is empty
+	"""
+	if not baseline.count() or not current.count():
+		return None
+	points = np.unique(np.concatenate([baseline.get_breakpoints(), current.get_breakpoints()]))
+	return float(np.max(np.abs(np.asarray(baseline.cdf(points)) - np.asarray(current.cdf(points)))))
+
+
+def get_bin_fractions(sketch: TDigest, edges: List[float]) -> List[float]:
+	"""
+	Args:
+		sketch (:obj:`TDigest`): The quantile sketch of the values
+		edges (:obj:`List[float]`): The inner edges of the bins, the first and the last bins are unbounded
+
+	Returns:
+		:obj:`List[float]`: The estimated fraction of the values in each of the ``len(edges) + 1`` bins
+	"""
+	return np.diff(np.r_[0.0, sketch.cdf(list(edges)), 1.0]).tolist()
+
+
+def get_top_fractions(sketch: SpaceSaving, values: List[Any]) -> List[float]:
+	"""
+	Args:
+		sketch (:obj:`SpaceSaving`): The top values sketch
+		values (:obj:`List[Any]`): The values
+
+	Returns:
+		:obj:`List[float]`: The fraction of each value followed by the fraction of all the other values
+	"""
+	total_count = sketch.get_total_count()
+	if not total_count:
+		return [0.0] * (len(values) + 1)
+	fractions = [sketch.get_count(value) / total_count for value in values]
+	return fractions + [max(1.0 - sum(fractions), 0.0)]
+
+
+class DriftDetector:
+	"""
+	Compares the states of the columns of a current run with the stored states of a baseline run, as returned by
+	:meth:`dq_whistler.analyzer.DataQualityAnalyzer.compute_states` or
+	:meth:`dq_whistler.analyzer.DataQualityAnalyzer.get_states`, using the sketches of the states alone so that
+	neither dataset is scanned again. For a numeric column the PSI and the KL divergence are computed on ``bins`` equi
+	depth bins of the baseline quantile sketch and the KS statistic on the cumulative distributions, a numeric column
+	whose states have no quantile sketch has an ``unknown`` drift status. For the other columns the PSI and the KL
+	divergence are computed on the top values of both the runs, the rest of the values being a bin of their own
+
+	Args:
+		config (:obj:`List[Dict[str, Any]]`): The config of the columns, same as the analyzer's
+		bins (:obj:`int`): The number of bins of the numeric distributions
+		top_values (:obj:`int`): The number of top values compared
+		thresholds (:obj:`Dict[str, float]`, optional): The values of the drift metrics above which a column has
+			drifted, ``psi`` defaults to ``0.2`` and ``ks_statistic`` to ``0.1``
+	"""
+	_config: List[Dict[str, Any]]
+	_bins: int
+	_top_values: int
+	_thresholds: Dict[str, float]
+
+	_default_thresholds = {"psi": 0.2, "ks_statistic": 0.1}
+
+	def __init__(
+			self,
+			config: List[Dict[str, Any]],
+			bins: int = 10,
+			top_values: int = 10,
+			thresholds: Optional[Dict[str, float]] = None
+	):
+		"""
+		Creates an instance of :obj:`DriftDetector`
+		"""
+		if bins < 2 or top_values < 1:
+			raise ValueError("The drift needs at least two bins and one top value")
+		self._config = config
+		self._bins = bins
+		self._top_values = top_values
+		self._thresholds = {**self._default_thresholds, **(thresholds or {})}
+
+	def get_distribution_drift(
+			self,
+			column_config: Dict[str, Any],
+			baseline: ColumnState,
+			current: ColumnState
+	) -> Dict[str, Any]:
+		"""
+		Args:
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+			baseline (:obj:`ColumnState`): The state of the column in the baseline run
+			current (:obj:`ColumnState`): The state of the column in the current run
+
+		Returns:
+			:obj:`Dict[str, Any]`: The PSI, the KL divergence and the KS statistic of the distributions, ``None`` if
+			they can not be computed from the sketches
+		"""
+		baseline_sketch, current_sketch = baseline.quantile_sketch, current.quantile_sketch
+		if baseline_sketch is not None and current_sketch is not None:
+			if not baseline_sketch.count() or not current_sketch.count():
+				return {"psi": None, "kl_divergence": None, "ks_statistic": None}
+			probabilities = np.linspace(0, 1, self._bins + 1)[1:-1].tolist()
+			edges = np.unique(baseline_sketch.quantile(probabilities)).tolist()
+			expected = get_bin_fractions(baseline_sketch, edges)
+			actual = get_bin_fractions(current_sketch, edges)
+			ks_statistic = get_ks_statistic(baseline_sketch, current_sketch)
+		elif column_config.get("datatype") == "number":
+			# the top values of a numeric column do not tell its distribution
+			return {"psi": None, "kl_divergence": None, "ks_statistic": None}
+		elif baseline.topn_sketch is not None and current.topn_sketch is not None:
+			if not baseline.topn_sketch.get_total_count() or not current.topn_sketch.get_total_count():
+				return {"psi": None, "kl_divergence": None, "ks_statistic": None}
+			values = self.get_top_union(baseline.topn_sketch, current.topn_sketch)
+			expected = get_top_fractions(baseline.topn_sketch, values)
+			actual = get_top_fractions(current.topn_sketch, values)
+			ks_statistic = None
+		else:
+			return {"psi": None, "kl_divergence": None, "ks_statistic": None}
+		return {
+			"psi": get_psi(expected, actual),
+			"kl_divergence": get_kl_divergence(expected, actual),
+			"ks_statistic": ks_statistic
+		}
+
+	def get_top_union(self, baseline: SpaceSaving, current: SpaceSaving) -> List[Any]:
+		"""
+		Args:
+			baseline (:obj:`SpaceSaving`): The top values sketch of the baseline run
+			current (:obj:`SpaceSaving`): The top values sketch of the current run
+
+		Returns:
+			:obj:`List[Any]`: The top values of both the runs, baseline values first
+		"""
+		values = [value for value, _, _ in baseline.top(self._top_values)]
+		return values + [value for value, _, _ in current.top(self._top_values) if value not in values]
+
+	def get_topn_shift(self, baseline: ColumnState, current: ColumnState) -> Optional[Dict[str, Any]]:
+		"""
+		Args:
+			baseline (:obj:`ColumnState`): The state of the column in the baseline run
+			current (:obj:`ColumnState`): The state of the column in the current run
+
+		Returns:
+			:obj:`Dict[str, Any]`: The total variation distance between the fractions of the top values of both the
+			runs (the rest of the values being a value of their own), with the top values added and removed in the
+			current run, ``None`` without the top values sketches
+			Sample Output::
+				{
+					"distance": 0.12,
+					"added": ["xyz"],
+					"removed": ["abc"]
+				}
+		"""
+		if baseline.topn_sketch is None or current.topn_sketch is None:
+			return None
+		baseline_values = [value for value, _, _ in baseline.topn_sketch.top(self._top_values)]
+		current_values = [value for value, _, _ in current.topn_sketch.top(self._top_values)]
+		values = self.get_top_union(baseline.topn_sketch, current.topn_sketch)
+		expected = np.asarray(get_top_fractions(baseline.topn_sketch, values))
+		actual = np.asarray(get_top_fractions(current.topn_sketch, values))
+		return {
+			"distance": float(np.abs(actual - expected).sum() / 2),
+			"added": [value for value in current_values if value not in baseline_values],
+			"removed": [value for value in baseline_values if value not in current_values]
+		}
+
+	@staticmethod
+	def get_rates(baseline: ColumnState, current: ColumnState) -> Tuple[Optional[float], Optional[float]]:
+		"""
+		Args:
+			baseline (:obj:`ColumnState`): The state of the column in the baseline run
+			current (:obj:`ColumnState`): The state of the column in the current run
+
+		Returns:
+			:obj:`Tuple[float, float]`: The change of the null rate and the relative change of the estimated unique
+			count, ``None`` if not available
+		"""
+		null_rate_change = None
+		if baseline.total_count and current.total_count:
+			null_rate_change = current.null_count / current.total_count - baseline.null_count / baseline.total_count
+		unique_count_change = None
+		baseline_unique_count, current_unique_count = baseline.get_unique_count(), current.get_unique_count()
+		if baseline_unique_count and current_unique_count is not None:
+			unique_count_change = current_unique_count / baseline_unique_count - 1
+		return null_rate_change, unique_count_change
+
+	def compare_column(
+			self,
+			column_config: Dict[str, Any],
+			baseline: ColumnState,
+			current: ColumnState
+	) -> Dict[str, Any]:
+		"""
+		Args:
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+			baseline (:obj:`ColumnState`): The state of the column in the baseline run
+			current (:obj:`ColumnState`): The state of the column in the current run
+
+		Returns:
+			:obj:`Dict[str, Any]`: The drift of the column, ``drift_status`` is ``failed`` if a drift metric is above its
+			threshold, else ``unknown`` if the distributions could not be compared, else ``success``
+			Sample Output::
+				{
+					"col_name": "number_col",
+					"null_rate_change": 0.01,
+					"unique_count_change": -0.05,
+					"psi": 0.03,
+					"kl_divergence": 0.015,
+					"ks_statistic": 0.04,
+					"topn_shift": {"distance": 0.12, "added": [7.0], "removed": [3.0]},
+					"drift_status": "success"
+				}
+		"""
+		null_rate_change, unique_count_change = self.get_rates(baseline, current)
+		drift = {
+			"col_name": column_config.get("name"),
+			"null_rate_change": null_rate_change,
+			"unique_count_change": unique_count_change,
+			**self.get_distribution_drift(column_config, baseline, current),
+			"topn_shift": self.get_topn_shift(baseline, current)
+		}
+		drifted = any(
+			drift.get(name) is not None and drift[name] > threshold for name, threshold in self._thresholds.items()
+		)
+		if drifted:
+			drift["drift_status"] = "failed"
+		elif drift["psi"] is None:
+			drift["drift_status"] = "unknown"
+		else:
+			drift["drift_status"] = "success"
+		return drift
+
+	def compare(
+			self,
+			baseline_states: List[Union[ColumnState, Dict[str, Any]]],
+			current_states: List[Union[ColumnState, Dict[str, Any]]]
+	) -> List[Dict[str, Any]]:
+		"""
+		Args:
+			baseline_states (:obj:`List[ColumnState | Dict[str, Any]]`): The state of each configured column in the
+				baseline run, possibly serialized with :meth:`ColumnState.to_dict`
+			current_states (:obj:`List[ColumnState | Dict[str, Any]]`): The state of each configured column in the
+				current run
+
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The drift of each configured column, see :meth:`compare_column`
+		"""
+		if len(baseline_states) != len(self._config) or len(current_states) != len(self._config):
+			raise ValueError("The number of states does not match the number of configured columns")
+		return [
+			self.compare_column(
+				column_config,
+				baseline if isinstance(baseline, ColumnState) else ColumnState.from_dict(baseline),
+				current if isinstance(current, ColumnState) else ColumnState.from_dict(current)
+			)
+			for column_config, baseline, current in zip(self._config, baseline_states, current_states)
+		]
@@ -0,0 +1,170 @@
+import logging
+from typing import Dict, List, Any, Union, Optional
+
+try:
+	import pyarrow.dataset as ds
+	import pyarrow.parquet as pq
+except ImportError:
+	ds = None
+	pq = None
+
+
+class ParquetFooterStats:
+	"""
+	Row group statistics read from the footers of Parquet files with ``pyarrow``, these answer the row count and for
+	some columns the null count, min and max without scanning the data
+
+	Args:
+		source (:obj:`str` | :obj:`List[str]` | :obj:`pyarrow.dataset.FileSystemDataset`): The Parquet file or
+			directory, a list of them, or a Parquet dataset
+	"""
+	_row_groups: List[Dict[str, Any]]
+
+	# the physical and logical types for which the footer stats match the metrics computed by Spark, the stats of
+	# FLOAT/DOUBLE columns exclude NaN which is counted as null (and is the max for Spark)
+	_numeric_physical_types = ("INT32", "INT64")
+	_numeric_logical_types = ("NONE", "INT")
+
+	def __init__(self, source: Union[str, List[str], Any]):
+		"""
+		Creates an instance of :obj:`ParquetFooterStats`
+		"""
+		if ds is None:
+			raise ImportError("pyarrow is required to read the Parquet footer statistics")
+		dataset = source if isinstance(source, ds.FileSystemDataset) else ds.dataset(source, format="parquet")
+		self._row_groups = []
+		for path in dataset.files:
+			with dataset.filesystem.open_input_file(path) as file:
+				metadata = pq.read_metadata(file)
+			column_types = {
+				metadata.schema.column(index).path: (
+					metadata.schema.column(index).physical_type,
+					metadata.schema.column(index).logical_type.type
+				)
+				for index in range(metadata.num_columns)
+			}
+			for row_group_index in range(metadata.num_row_groups):
+				row_group = metadata.row_group(row_group_index)
+				columns = {}
+				for column_index in range(row_group.num_columns):
+					column = row_group.column(column_index)
+					statistics = column.statistics
+					physical_type, logical_type = column_types[column.path_in_schema]
+					columns[column.path_in_schema] = {
+						"physical_type": physical_type,
+						"logical_type": logical_type,
+						"null_count": statistics.null_count if statistics is not None and statistics.has_null_count
+						else None,
+						"min": statistics.min if statistics is not None and statistics.has_min_max else None,
+						"max": statistics.max if statistics is not None and statistics.has_min_max else None
+					}
+				self._row_groups.append({
+					"path": path,
+					"index": row_group_index,
+					"num_rows": row_group.num_rows,
+					"columns": columns
+				})
+
+	@classmethod
+	def load(cls, source: Optional[Union[str, List[str], Any]]) -> Optional["ParquetFooterStats"]:
+		"""
+		Args:
+			source (:obj:`str` | :obj:`List[str]` | :obj:`pyarrow.dataset.FileSystemDataset`, optional): The Parquet
+				source
+
+		Returns:
+			:obj:`ParquetFooterStats`: The footer stats of the source, ``None`` if there is no source or the footers
+			can not be read, in which case the metrics are computed by scanning the data
+		"""
+		if source is None:
+			return None
+		try:
+			return cls(source)
+		except (ImportError, OSError, ValueError) as error:
+			logging.warning(f"Parquet footer statistics are not used: {error}")
+			return None
+
+	def get_row_groups(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each row group, the ``null_count``, ``min`` and ``max`` of a
+			column are ``None`` when missing from the footer
+			Sample Output::
+				[
+					{
+						"path": "/data/part-00000.parquet",
+						"index": 0,
+						"num_rows": 1000,
+						"columns": {
+							"col_name": {
+								"physical_type": "INT64",
+								"logical_type": "NONE",
+								"null_count": 2,
+								"min": 1,
+								"max": 23
+							}
+						}
+					}
+				]
+		"""
+		return self._row_groups
+
+	def get_total_count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: Count of the rows of all the row groups
+		"""
+		return sum(row_group["num_rows"] for row_group in self._row_groups)
+
+	def get_column_metrics(self, column_name: str, data_type: str) -> Dict[str, Any]:
+		"""
+		Args:
+			column_name (:obj:`str`): The name of the column
+			data_type (:obj:`str`): The datatype of the column as per the config
+
+		Returns:
+			:obj:`Dict[str, Any]`: The metrics answered by the footer stats, the ``null_count``, ``min`` and ``max``
+			are present only for integer columns having stats in every row group, as the null count of a string column
+			also considers values like ``""`` and ``"NULL"``
+			Sample Output::
+				{
+					"total_count": 1000,
+					"null_count": 2,
+					"min": 1.0,
+					"max": 23.0
+				}
+		"""
+		metrics: Dict[str, Any] = {"total_count": self.get_total_count()}
+		if data_type != "number" or not self.has_numeric_stats(column_name):
+			return metrics
+
+		columns = [row_group["columns"][column_name] for row_group in self._row_groups]
+		metrics["null_count"] = sum(column["null_count"] for column in columns)
+		values = []
+		for row_group, column in zip(self._row_groups, columns):
+			if column["min"] is None:
+				if column["null_count"] != row_group["num_rows"]:
+					return metrics
+				# a row group of only nulls has no min/max
+				continue
+			values.append(column)
+		metrics["min"] = float(min(column["min"] for column in values)) if values else None
+		metrics["max"] = float(max(column["max"] for column in values)) if values else None
+		return metrics
+
+	def has_numeric_stats(self, column_name: str) -> bool:
+		"""
+		Args:
+			column_name (:obj:`str`): The name of the column
+
+		Returns:
+			:obj:`bool`: ``True`` if the column is an integer column with a null count in every row group
+		"""
+		for row_group in self._row_groups:
+			column = row_group["columns"].get(column_name)
+			if column is None \
+					or column["physical_type"] not in self._numeric_physical_types \
+					or column["logical_type"] not in self._numeric_logical_types \
+					or column["null_count"] is None:
+				return False
+		return True
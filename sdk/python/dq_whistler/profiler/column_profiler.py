@@ -1,14 +1,77 @@
-import numpy as np
+import threading
+from contextlib import nullcontext
+import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Union
+from collections import Counter
+from itertools import islice
+from typing import Dict, Any, List, Union, Callable, Iterable, Iterator, Tuple, Optional, ContextManager
 from pandas.core.series import Series as pandas_df
+from pyspark.sql.column import Column
 from pyspark.sql.dataframe import DataFrame as spark_df
 import pyspark.sql.functions as f
-from pyspark.sql.types import StringType, DoubleType, IntegerType
+from pyspark.sql.types import StringType, DoubleType, IntegerType, FloatType
 from dq_whistler.constraints.constraint import Constraint
+from dq_whistler.constraints.engine import ConstraintEngine
+from dq_whistler.profiler.column_state import ColumnState
+from dq_whistler.profiler.instrumentation import Instrumentation
+from dq_whistler.sketches.hyperloglog import HyperLogLog
+from dq_whistler.sketches.space_saving import SpaceSaving
+from dq_whistler.sketches.tdigest import TDigest
 import json
 
 
+def build_partition_sketches(
+        rows: Iterable[Tuple[Any, bool]],
+        relative_error: float,
+        capacity: int,
+        batch_size: int = 10000,
+        compression: Optional[float] = None
+) -> Iterator[Tuple[HyperLogLog, SpaceSaving, Optional[TDigest]]]:
+    """
+    Builds the distinct and the top values sketches of a Spark partition in batches of ``batch_size`` rows
+
+    Args:
+        rows (:obj:`Iterable[Tuple[Any, bool]]`): The value of each row and whether it is counted for the top values
+        relative_error (:obj:`float`): The relative error of the :obj:`HyperLogLog` sketch
+        capacity (:obj:`int`): The capacity of the :obj:`SpaceSaving` sketch
+        batch_size (:obj:`int`): The number of rows added to the sketches at once
+        compression (:obj:`float`, optional): The compression of the :obj:`TDigest` sketch of the numeric values, no
+            quantile sketch is built if ``None``
+
+    Returns:
+        :obj:`Iterator[Tuple[HyperLogLog, SpaceSaving, TDigest]]`: The sketches of the partition
+    """
+    unique_sketch = HyperLogLog(relative_error)
+    topn_sketch = SpaceSaving(capacity)
+    quantile_sketch = TDigest(compression) if compression is not None else None
+    rows = iter(rows)
+    batch = list(islice(rows, batch_size))
+    while batch:
+        values = pd.Series([row[0] for row in batch], dtype=object)
+        unique_sketch.update(values)
+        topn_sketch.update_counts(Counter(row[0] for row in batch if row[1]))
+        if quantile_sketch is not None:
+            quantile_sketch.update(values)
+        batch = list(islice(rows, batch_size))
+    yield unique_sketch, topn_sketch, quantile_sketch
+
+
+def merge_sketches(
+        left: Tuple[HyperLogLog, SpaceSaving, Optional[TDigest]],
+        right: Tuple[HyperLogLog, SpaceSaving, Optional[TDigest]]
+) -> Tuple[HyperLogLog, SpaceSaving, Optional[TDigest]]:
+    """
+    Args:
+        left (:obj:`Tuple[HyperLogLog, SpaceSaving, TDigest]`): The sketches of some partitions
+        right (:obj:`Tuple[HyperLogLog, SpaceSaving, TDigest]`): The sketches of other partitions
+
+    Returns:
+        :obj:`Tuple[HyperLogLog, SpaceSaving, TDigest]`: The merged sketches
+    """
+    quantile_sketch = left[2].merge(right[2]) if left[2] is not None else right[2]
+    return left[0].merge(right[0]), left[1].merge(right[1]), quantile_sketch
+
+
 class ColumnProfiler(ABC):
     """
     Base class for column profiler
@@ -17,6 +80,14 @@ class ColumnProfiler(ABC):
     _column_data: Union[spark_df, pandas_df]
     _config: Dict[str, Any]
     _constraints: List[Constraint]
+    _metrics: Dict[str, Any]
+    _metric_sources: Dict[str, str]
+    _gate: Optional[threading.Event]
+    _instrumentation: Optional[Instrumentation]
+    _emit_state: bool
+
+    # the values of a string column counted as null, unless set by ``null_tokens`` in the config
+    _default_null_tokens = ("", "None", "NULL")
 
     def __init__(self, column_data: Union[spark_df, pandas_df], config: Dict[str, Any]):
         """
@@ -46,6 +117,11 @@ class ColumnProfiler(ABC):
         self._column_name = config.get("name")
         self._data_type = config.get("datatype")
         self._constraints = []
+        self._metrics = {}
+        self._metric_sources = {}
+        self._gate = None
+        self._instrumentation = None
+        self._emit_state = False
 
     def prepare_df_for_constraints(self) -> None:
         """
@@ -61,14 +137,20 @@ class ColumnProfiler(ABC):
             else:
                 raise NotImplementedError
         elif isinstance(self._column_data, pandas_df):
+            # vectorized casts to the nullable extension dtypes, values which can not be cast become <NA>
+            column_data = self._column_data
             if self._data_type == "string":
-                self._column_data = self._column_data.apply(np.str)
+                self._column_data = column_data.astype("string")
             elif self._data_type == "number":
-                self._column_data = self._column_data.apply(np.float)
+                self._column_data = pd.to_numeric(column_data, errors="coerce").astype("Float64")
             elif self._data_type == "integer":
-                self._column_data = self._column_data.apply(np.int)
+                numeric_data = pd.to_numeric(column_data, errors="coerce").astype("Float64")
+                self._column_data = numeric_data.where(numeric_data % 1 == 0).astype("Int64")
             else:
                 raise NotImplementedError
+            self.set_metrics({
+                "coercion_failure_count": int((column_data.notna() & self._column_data.isna()).sum())
+            })
         else:
             raise NotImplementedError
 
@@ -120,39 +202,167 @@ class ColumnProfiler(ABC):
         """
         return self._config
 
+    def get_null_tokens(self) -> List[str]:
+        """
+        Returns:
+            :obj:`List[str]`: The values of the column counted as null along with the actual nulls, these are matched
+            exactly and only against string values, set by ``null_tokens`` in the config of the column (or of its
+            datatype in the analyzer)
+        """
+        null_tokens = self._config.get("null_tokens")
+        return list(self._default_null_tokens if null_tokens is None else null_tokens)
+
+    def get_null_expr(self) -> Column:
+        """
+        Returns:
+            :obj:`pyspark.sql.Column`: The expression which is ``True`` for the null values, the check depends on the
+            Spark type of the column: the null tokens for strings, ``NaN`` for floating point numbers and only the
+            actual nulls for the rest
+        """
+        column = f.col(self._column_name)
+        data_type = self._column_data.schema[self._column_name].dataType
+        if isinstance(data_type, StringType):
+            null_tokens = self.get_null_tokens()
+            return column.isNull() | column.isin(*null_tokens) if null_tokens else column.isNull()
+        if isinstance(data_type, (FloatType, DoubleType)):
+            return column.isNull() | f.isnan(column)
+        return column.isNull()
+
+    def get_null_count_expr(self) -> Column:
+        """
+        Returns:
+            :obj:`pyspark.sql.Column`: Aggregate expression for the count of null values in a column data
+        """
+        return f.count(f.when(self.get_null_expr(), True))
+
+    def get_null_mask(self) -> pandas_df:
+        """
+        Returns:
+            :obj:`pandas.core.series.Series`: The boolean mask of the null values of a pandas column, with the same
+            semantics as :meth:`get_null_expr`
+        """
+        column_data = self._column_data
+        null_mask = column_data.isna()
+        null_tokens = self.get_null_tokens()
+        if null_tokens and (pd.api.types.is_string_dtype(column_data.dtype) or column_data.dtype == object):
+            null_mask = null_mask | column_data.isin(null_tokens).astype(bool)
+        return null_mask
+
     def get_null_count(self) -> int:
         """
         Returns:
             :obj:`int`: Count of null values in a column data
         """
-        col_name = self._column_name
         if isinstance(self._column_data, spark_df):
             return int(self._column_data.select(
-                f.count(
-                    f.when(
-                        f.col(col_name).contains("None") |
-                        f.col(col_name).contains("NULL") |
-                        (f.col(col_name) == "") |
-                        f.col(col_name).isNull() |
-                        f.isnan(col_name), col_name
-                    )
-                ).alias("null_count")
+                self.get_null_count_expr().alias("null_count")
             ).first()[0])
 
         if isinstance(self._column_data, pandas_df):
-            return int(self._column_data.isnull().sum(axis=0))
+            return int(self.get_null_mask().sum())
+
+    def compute_scalar_metrics(self) -> None:
+        """
+        Computes the scalar metrics of a Spark column which are not precomputed, except the unique count, in a single
+        ``agg`` job and sets them as precomputed. The job is measured as the ``scalar_metrics`` metric, the profile of
+        each metric computed by it refers to it with ``computed_in`` and reports its Spark jobs without any time of its
+        own. A no-op on pandas
+        """
+        if not isinstance(self._column_data, spark_df):
+            return
+        exprs = {
+            name: expr for name, expr in self.get_metric_exprs().items()
+            if name != "unique_count" and name not in self._metrics
+        }
+        if not exprs:
+            return
+        with self.measure("metrics", "scalar_metrics"):
+            row = self._column_data.agg(*[expr.alias(name) for name, expr in exprs.items()]).first()
+        self.set_metrics({name: row[name] for name in exprs})
+        self._metric_sources.update({name: "scalar_metrics" for name in exprs})
+
+    def get_unique_count_config(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The config for the unique count of the column, ``mode`` is either ``exact`` or
+            ``approx``, for ``approx`` the count is estimated by a HyperLogLog sketch with the given ``relative_error``
+            Sample Dict::
+                {
+                    "mode": "approx",
+                    "relative_error": 0.05
+                }
+        """
+        unique_count_config = {"mode": "exact", "relative_error": 0.05, **(self._config.get("unique_count") or {})}
+        if unique_count_config["mode"] not in ("exact", "approx"):
+            raise NotImplementedError
+        return unique_count_config
+
+    def get_unique_count_expr(self) -> Column:
+        """
+        Returns:
+            :obj:`pyspark.sql.Column`: Aggregate expression for the count of unique values in a column data, null and
+            ``NaN`` are not counted as values, same as pandas ``nunique`` and the distinct values sketch
+        """
+        column = f.col(self._column_name)
+        if isinstance(self._column_data.schema[self._column_name].dataType, (FloatType, DoubleType)):
+            # count(DISTINCT) counts NaN as a value, dropna and pandas do not
+            column = f.when(~f.isnan(column), column)
+        unique_count_config = self.get_unique_count_config()
+        if unique_count_config["mode"] == "approx":
+            return f.approx_count_distinct(column, unique_count_config["relative_error"])
+        return f.countDistinct(column)
 
     def get_unique_count(self) -> int:
         """
         Returns:
-            :obj:`int`: Count of unique values in a column data
+            :obj:`int`: Count of unique non null values in a column data
         """
+        approx = self.get_unique_count_config()["mode"] == "approx"
         if isinstance(self._column_data, spark_df):
-            return int(self._column_data.distinct().count())
+            if approx:
+                return int(self._column_data.select(self.get_unique_count_expr()).first()[0])
+            return int(self._column_data.dropna().distinct().count())
 
         if isinstance(self._column_data, pandas_df):
+            if approx:
+                return HyperLogLog(self.get_unique_count_config()["relative_error"]).update(self._column_data).count()
             return int(self._column_data.nunique(dropna=True))
 
+    def get_optional_metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The metrics which are present in the output only for some configs or backends,
+            for ex: the count of pandas values which could not be cast to the datatype of the column
+            Sample Output::
+                {
+                    "coercion_failure_count": 2,
+                    "unique_count_relative_error": 0.05
+                }
+        """
+        optional_metrics = {}
+        if "coercion_failure_count" in self._metrics:
+            optional_metrics["coercion_failure_count"] = self._metrics["coercion_failure_count"]
+        return {**optional_metrics, **self.get_approximation_info()}
+
+    def get_approximation_info(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The error bounds of the metrics computed approximately, empty if all the metrics
+            are exact
+            Sample Output::
+                {
+                    "unique_count_relative_error": 0.05,
+                    "topn_values_max_error": 12
+                }
+        """
+        info = {}
+        unique_count_config = self.get_unique_count_config()
+        if unique_count_config["mode"] == "approx":
+            info["unique_count_relative_error"] = unique_count_config["relative_error"]
+        if "topn_values_max_error" in self._metrics:
+            info["topn_values_max_error"] = self._metrics["topn_values_max_error"]
+        return info
+
     def get_total_count(self) -> int:
         """
         Returns:
@@ -167,6 +377,57 @@ class ColumnProfiler(ABC):
         """
         return 0.0
 
+    def get_topn_config(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The config for the top values of the column, ``mode`` is either ``exact`` or
+            ``sketch``, for ``sketch`` the top values are estimated by a Space-Saving sketch with ``capacity`` counters
+            Sample Dict::
+                {
+                    "mode": "sketch",
+                    "capacity": 1000
+                }
+        """
+        topn_config = {"mode": "exact", "capacity": 1000, **(self._config.get("topn_values") or {})}
+        if topn_config["mode"] not in ("exact", "sketch"):
+            raise NotImplementedError
+        return topn_config
+
+    def get_topn_filter_expr(self) -> Column:
+        """
+        Returns:
+            :obj:`pyspark.sql.Column`: The expression which is ``True`` for the values considered for the top values
+        """
+        col_name = self._column_name
+        if self._data_type == "string":
+            return (f.col(col_name) != "") & (f.col(col_name).isNotNull()) & (f.col(col_name) != "null")
+        elif self._data_type == "number":
+            return f.col(col_name).isNotNull()
+        else:
+            raise NotImplementedError
+
+    def get_topn_sketch(self) -> SpaceSaving:
+        """
+        Returns:
+            :obj:`SpaceSaving`: The heavy hitters sketch of the column data, on Spark a sketch is built for each
+            partition and the sketches are merged on the driver, so that no shuffle or sort is required
+        """
+        capacity = self.get_topn_config()["capacity"]
+        if isinstance(self._column_data, spark_df):
+            return self._column_data \
+                .filter(self.get_topn_filter_expr()) \
+                .rdd \
+                .mapPartitions(lambda rows: [SpaceSaving(capacity).update(row[0] for row in rows)]) \
+                .fold(SpaceSaving(capacity), lambda left, right: left.merge(right))
+
+        if isinstance(self._column_data, pandas_df):
+            sketch = SpaceSaving(capacity)
+            values = self._column_data.dropna()
+            batch_size = 100 * capacity
+            for start in range(0, len(values), batch_size):
+                sketch.update_counts(values.iloc[start:start + batch_size].value_counts().to_dict())
+            return sketch
+
     def get_topn(self) -> Dict[str, Any]:
         """
         Returns:
@@ -178,26 +439,21 @@ class ColumnProfiler(ABC):
                 }
         """
         col_name = self._column_name
+        if self.get_topn_config()["mode"] == "sketch":
+            top_values = self.get_topn_sketch().top(10)
+            # the max over estimation of the reported counts
+            self.set_metrics({"topn_values_max_error": max([error for _, _, error in top_values], default=0)})
+            return {value: count for value, count, _ in top_values}
+
         if isinstance(self._column_data, spark_df):
             top_values = dict()
-            if self._data_type == "string":
-                top_values_rows = self._column_data \
-                    .filter((f.col(col_name) != "") & (f.col(col_name).isNotNull()) & (f.col(col_name) != "null")) \
-                    .groupby(col_name) \
-                    .count() \
-                    .sort(f.desc("count")) \
-                    .toJSON() \
-                    .take(10)
-            elif self._data_type == "number":
-                top_values_rows = self._column_data \
-                    .filter(f.col(col_name).isNotNull()) \
-                    .groupby(col_name) \
-                    .count() \
-                    .sort(f.desc("count")) \
-                    .toJSON() \
-                    .take(10)
-            else:
-                raise NotImplementedError
+            top_values_rows = self._column_data \
+                .filter(self.get_topn_filter_expr()) \
+                .groupby(col_name) \
+                .count() \
+                .sort(f.desc("count")) \
+                .toJSON() \
+                .take(10)
 
             [
                 top_values.update(
@@ -209,6 +465,14 @@ class ColumnProfiler(ABC):
         if isinstance(self._column_data, pandas_df):
             return json.loads(self._column_data.value_counts().iloc[:9].to_json())
 
+    def get_measured_topn(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The top values of the column, see :meth:`get_topn`, measured by the instrumentation
+        """
+        with self.measure("metrics", "topn_values"):
+            return self.get_topn()
+
     def get_custom_constraint_check(self) -> List[Dict[str, str]]:
         """
         Returns:
@@ -225,11 +489,278 @@ class ColumnProfiler(ABC):
                 ]
         """
         constraints_output = []
+        # the outputs of the constraints already evaluated elsewhere, for ex: on the Parquet row groups
+        precomputed = self._metrics.get("constraint_results") or {}
         for constraint in self._constraints:
-            output = constraint.execute_check(self._column_data)
+            output = precomputed.get(constraint.constraint_name())
+            if self._gate is not None and self._gate.is_set():
+                output = constraint.get_skipped_result()
+            elif output is None and constraint.get_mode() == "exists":
+                with self.measure("constraints", constraint.constraint_name()):
+                    output = constraint.execute_exists(self._column_data)
+            elif output is None:
+                with self.measure("constraints", constraint.constraint_name()):
+                    output = constraint.execute_check(self._column_data)
+            if self._gate is not None and constraint.is_blocking() and output["constraint_status"] == "failed":
+                self._gate.set()
             constraints_output.append(output)
         return constraints_output
 
+    def check_constraints(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            :obj:`List[Dict[str, Any]]`: The output of each of the constraint of the column, without computing any
+            of the metrics
+        """
+        self.build_constraints()
+        self.prepare_df_for_constraints()
+        return self.get_custom_constraint_check()
+
+    def set_gate(self, gate: threading.Event) -> None:
+        """
+        Sets the gate shared by the profilers of all the columns, it is set when a blocking constraint fails and the
+        constraints evaluated after that are skipped
+
+        Args:
+            gate (:obj:`threading.Event`): The gate
+        """
+        self._gate = gate
+
+    def get_metric_exprs(self) -> Dict[str, Column]:
+        """
+        Returns:
+            :obj:`Dict[str, pyspark.sql.Column]`: Spark aggregate expressions for the scalar metrics of the column,
+            these can be combined with the expressions of other columns and computed in a single ``agg`` job
+            Sample Output::
+                {
+                    "total_count": Column<'count(1)'>,
+                    "null_count": Column<'count(CASE WHEN ... END)'>,
+                    "unique_count": Column<'count(DISTINCT col_name)'>
+                }
+        """
+        return {
+            "total_count": f.count(f.lit(1)),
+            "null_count": self.get_null_count_expr(),
+            "unique_count": self.get_unique_count_expr(),
+        }
+
+    def get_state_exprs(self) -> Dict[str, Column]:
+        """
+        Returns:
+            :obj:`Dict[str, pyspark.sql.Column]`: Spark aggregate expressions for the mergeable state of the column,
+            see :obj:`dq_whistler.profiler.column_state.ColumnState`
+        """
+        return {
+            "total_count": f.count(f.lit(1)),
+            "null_count": self.get_null_count_expr(),
+        }
+
+    def get_state_metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The values of the mergeable state of a pandas column, same as the values of
+            :meth:`get_state_exprs` on Spark
+        """
+        return {
+            "total_count": self.get_total_count(),
+            "null_count": self.get_null_count(),
+        }
+
+    def get_invalid_counts(self, constraints: List[Constraint]) -> List[int]:
+        """
+        Counts the invalid values of a pandas column, prepared with :meth:`prepare_df_for_constraints`, without
+        building any sketch
+
+        Args:
+            constraints (:obj:`List[Constraint]`): The constraints of the column, see :meth:`build_constraints`
+
+        Returns:
+            :obj:`List[int]`: The invalid count of each constraint, in the order of the constraints
+        """
+        if isinstance(self._column_data, pandas_df):
+            return [int(constraint.get_failure_df(self._column_data).count()) for constraint in constraints]
+        raise NotImplementedError
+
+    def get_quantile_compression(self) -> Optional[float]:
+        """
+        Returns:
+            :obj:`float`: The compression of the quantile sketch of the mergeable state, ``None`` if the column has no
+            quantile sketch
+        """
+        return None
+
+    def get_state(self) -> ColumnState:
+        """
+        Computes the mergeable state of the column in a single scan on pandas, on Spark in one ``agg`` job for the
+        counts and the constraints and one ``mapPartitions`` job for the sketches
+
+        Returns:
+            :obj:`ColumnState`: The state of the column, containing the invalid counts of its constraints along with
+            the distinct and the top values sketches, and the quantile sketch of a numeric column
+        """
+        constraints = self.build_constraints()
+        relative_error = self.get_unique_count_config()["relative_error"]
+        capacity = self.get_topn_config()["capacity"]
+        compression = self.get_quantile_compression()
+
+        if isinstance(self._column_data, spark_df):
+            exprs = self.get_state_exprs()
+            engine = ConstraintEngine(self._column_data, constraints)
+            values = engine.get_data().agg(*exprs.values(), *engine.get_invalid_count_exprs()).first()
+            state = ColumnState.from_metrics(dict(zip(exprs.keys(), values)))
+            invalid_counts = [int(count) for count in values[len(exprs):]]
+            cast_type = DoubleType() if self._data_type == "number" else StringType()
+            unique_sketch, topn_sketch, quantile_sketch = self._column_data \
+                .select(f.col(self._column_name).cast(cast_type), self.get_topn_filter_expr()) \
+                .rdd \
+                .mapPartitions(
+                    lambda rows: build_partition_sketches(rows, relative_error, capacity, compression=compression)
+                ) \
+                .fold((HyperLogLog(relative_error), SpaceSaving(capacity), None), merge_sketches)
+        elif isinstance(self._column_data, pandas_df):
+            self.prepare_df_for_constraints()
+            state = ColumnState.from_metrics(self.get_state_metrics())
+            invalid_counts = self.get_invalid_counts(constraints)
+            unique_sketch = HyperLogLog(relative_error).update(self._column_data)
+            topn_sketch = self.get_topn_sketch()
+            quantile_sketch = TDigest(compression).update(self._column_data) if compression is not None else None
+        else:
+            raise NotImplementedError
+
+        state.invalid_counts = {
+            constraint.constraint_name(): invalid_count
+            for constraint, invalid_count in zip(constraints, invalid_counts)
+        }
+        state.unique_sketch = unique_sketch
+        state.topn_sketch = topn_sketch
+        state.quantile_sketch = quantile_sketch
+        return state
+
+    def set_emit_state(self, emit_state: bool) -> None:
+        """
+        Sets whether the mergeable state of the column is built along with its metrics, see :meth:`get_run_state`,
+        the aggregate expressions of the state are then added to :meth:`get_metric_exprs`
+
+        Args:
+            emit_state (:obj:`bool`): ``True`` if the state is built
+        """
+        self._emit_state = emit_state
+
+    def get_run_state(self, output: Dict[str, Any]) -> ColumnState:
+        """
+        Builds the mergeable state of the column from the metrics computed by :meth:`run`, without scanning a Spark
+        column again. On Spark the counts and the moments come from the scalar aggregation, the quantile sketch from
+        the quantiles computed in it, the top values sketch holds only the reported top values and the unique count is
+        kept without a distinct values sketch. On pandas the sketches are built from the column in memory
+
+        Args:
+            output (:obj:`Dict[str, Any]`): The output of :meth:`run`
+
+        Returns:
+            :obj:`ColumnState`: The state of the column, the constraints evaluated in the ``exists`` mode have no
+            invalid count and keep only their status
+        """
+        compression = self.get_quantile_compression()
+        if isinstance(self._column_data, spark_df):
+            state = ColumnState.from_metrics({**self._metrics, "unique_count": output.get("unique_count")})
+            top_values = output.get("topn_values") or {}
+            # a full sketch bounds the count of the other values by the smallest top count
+            state.topn_sketch = SpaceSaving.from_dict({
+                "capacity": max(len(top_values), 1),
+                "total_count": state.total_count - state.null_count,
+                "counters": [[value, count, 0] for value, count in top_values.items()]
+            })
+            if compression is not None:
+                state.quantile_sketch = TDigest.from_quantiles(
+                    self._metrics.get("quantile_points"), state.value_count, compression
+                )
+        elif isinstance(self._column_data, pandas_df):
+            state = ColumnState.from_metrics(self.get_state_metrics())
+            state.unique_sketch = HyperLogLog(self.get_unique_count_config()["relative_error"]).update(self._column_data)
+            state.topn_sketch = self.get_topn_sketch()
+            if compression is not None:
+                state.quantile_sketch = TDigest(compression).update(self._column_data)
+        else:
+            raise NotImplementedError
+        state.invalid_counts = {
+            constraint["name"]: int(constraint["invalid_count"])
+            for constraint in output.get("constraints") or []
+            if constraint.get("invalid_count") is not None
+        }
+        state.constraint_statuses = {
+            constraint["name"]: constraint["constraint_status"]
+            for constraint in output.get("constraints") or []
+            if constraint.get("invalid_count") is None
+        }
+        return state
+
+    def set_metrics(self, metrics: Dict[str, Any]) -> None:
+        """
+        Sets the precomputed metrics of the column, a metric present here is not computed again by the profiler
+
+        Args:
+            metrics (:obj:`Dict[str, Any]`): Dict containing the metric name and its value
+        """
+        self._metrics.update(metrics)
+
+    def get_metric(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Args:
+            name (:obj:`str`): The name of the metric, for ex: ``null_count``
+            compute (:obj:`Callable[[], Any]`): The function computing the metric, if it is not precomputed
+
+        Returns:
+            :obj:`Any`: The precomputed value of the metric if present, else the value returned by ``compute``
+        """
+        if name in self._metrics:
+            if name in self._metric_sources and self._instrumentation is not None:
+                self._instrumentation.add_reference(self._column_name, name, self._metric_sources[name])
+            return self._metrics[name]
+        with self.measure("metrics", name):
+            return compute()
+
+    def set_instrumentation(self, instrumentation: Instrumentation) -> None:
+        """
+        Sets the instrumentation recording the cost of each metric and constraint computed by the profiler
+
+        Args:
+            instrumentation (:obj:`Instrumentation`): The instrumentation shared by the profilers of all the columns
+        """
+        self._instrumentation = instrumentation
+
+    def measure(self, kind: str, name: str) -> ContextManager[None]:
+        """
+        Args:
+            kind (:obj:`str`): Either ``metrics`` or ``constraints``
+            name (:obj:`str`): The name of the metric or the constraint
+
+        Returns:
+            :obj:`ContextManager[None]`: The context measuring the code run in it, a no-op without instrumentation
+        """
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.measure(self._column_name, kind, name)
+
+    def get_profile(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            :obj:`Dict[str, Any]`: The cost of each metric and constraint computed by the profiler, ``None`` without
+            instrumentation, see :meth:`Instrumentation.finish_column`
+        """
+        if self._instrumentation is None:
+            return None
+        return self._instrumentation.finish_column(self._column_name)
+
+    @abstractmethod
+    def build_constraints(self) -> List[Constraint]:
+        """
+        Creates the instances of :obj:`Constraint` as per the constraints config of the column
+
+        Returns:
+            :obj:`List[Constraint]`: The constraints of the column
+        """
+        pass
+
     @abstractmethod
     def run(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,396 @@
+import copy
+import math
+from typing import Dict, Any, List, Optional
+import numpy as np
+from dq_whistler.sketches.hyperloglog import HyperLogLog
+from dq_whistler.sketches.space_saving import SpaceSaving
+from dq_whistler.sketches.tdigest import TDigest
+
+
+def get_quantile_config(column_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+	"""
+	Args:
+		column_config (:obj:`Dict[str, Any]`): The config of a numeric column
+
+	Returns:
+		:obj:`Dict[str, Any]`: The config for the quantiles of the column, ``None`` if the quantiles are not
+		configured. ``accuracy`` is the accuracy of Spark's ``percentile_approx`` (the relative error is
+		``1 / accuracy``), pandas quantiles are exact. ``compression`` is the compression of the :obj:`TDigest` of
+		the mergeable state
+		Sample Dict::
+			{
+				"probabilities": [0.5, 0.95, 0.99],
+				"accuracy": 10000,
+				"compression": 100
+			}
+	"""
+	if column_config.get("quantiles") is None:
+		return None
+	quantile_config = {
+		"probabilities": [0.5, 0.95, 0.99],
+		"accuracy": 10000,
+		"compression": 100,
+		**column_config["quantiles"]
+	}
+	if any(not 0 <= probability <= 1 for probability in quantile_config["probabilities"]):
+		raise ValueError("The probabilities of the quantiles should be between 0 and 1")
+	return quantile_config
+
+
+def get_histogram_config(column_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+	"""
+	Args:
+		column_config (:obj:`Dict[str, Any]`): The config of a numeric column
+
+	Returns:
+		:obj:`Dict[str, Any]`: The config for the histogram of the column, ``None`` if the histogram is not
+		configured. ``mode`` is either ``equi_width`` or ``equi_depth``, the equi width bins span the ``range`` if
+		given else the min and the max of the column, values outside the range are not counted. The equi depth edges
+		are quantiles computed with the ``accuracy`` of the quantiles
+		Sample Dict::
+			{
+				"bins": 10,
+				"mode": "equi_width",
+				"range": [0, 100]
+			}
+	"""
+	if column_config.get("histogram") is None:
+		return None
+	histogram_config = {"bins": 10, "mode": "equi_width", "range": None, **column_config["histogram"]}
+	if histogram_config["mode"] not in ("equi_width", "equi_depth"):
+		raise NotImplementedError
+	if histogram_config["mode"] == "equi_depth" and histogram_config["range"] is not None:
+		raise NotImplementedError
+	if histogram_config["bins"] < 1:
+		raise ValueError("The histogram should have at least one bin")
+	return histogram_config
+
+
+class ColumnState:
+	"""
+	Mergeable running metrics of a column, the mean and variance are combined with the parallel variant of
+	Welford's algorithm, so that the metrics of multiple batches can be merged without scanning them again. The state
+	is serializable with :meth:`to_dict`, so the state of each partition of a table can be stored and merged later
+
+	Args:
+		total_count (:obj:`int`): Count of total values
+		null_count (:obj:`int`): Count of null values
+		value_count (:obj:`int`): Count of the non null numeric values, used for the mean and variance
+		mean (:obj:`float`): Mean of the numeric values
+		m2 (:obj:`float`): Sum of squared differences of the numeric values from their mean
+		min_value (:obj:`float`, optional): Min of the numeric values
+		max_value (:obj:`float`, optional): Max of the numeric values
+		invalid_counts (:obj:`Dict[str, int]`, optional): Invalid count of each constraint by its name
+		constraint_statuses (:obj:`Dict[str, str]`, optional): The status of each constraint evaluated without an
+			invalid count by its name, for ex: in the ``exists`` mode
+		unique_sketch (:obj:`HyperLogLog`, optional): The sketch of the distinct values
+		topn_sketch (:obj:`SpaceSaving`, optional): The sketch of the most frequent values
+		quantile_sketch (:obj:`TDigest`, optional): The sketch of the distribution of the numeric values
+		unique_count (:obj:`int`, optional): The unique count of a state without a distinct values sketch, for ex:
+			emitted by :meth:`dq_whistler.analyzer.DataQualityAnalyzer.analyze` on Spark, it can not be merged
+	"""
+	total_count: int
+	null_count: int
+	value_count: int
+	mean: float
+	m2: float
+	min_value: Optional[float]
+	max_value: Optional[float]
+	invalid_counts: Dict[str, int]
+	constraint_statuses: Dict[str, str]
+	unique_sketch: Optional[HyperLogLog]
+	topn_sketch: Optional[SpaceSaving]
+	quantile_sketch: Optional[TDigest]
+	unique_count: Optional[int]
+
+	def __init__(
+			self,
+			total_count: int = 0,
+			null_count: int = 0,
+			value_count: int = 0,
+			mean: float = 0.0,
+			m2: float = 0.0,
+			min_value: Optional[float] = None,
+			max_value: Optional[float] = None,
+			invalid_counts: Optional[Dict[str, int]] = None,
+			constraint_statuses: Optional[Dict[str, str]] = None,
+			unique_sketch: Optional[HyperLogLog] = None,
+			topn_sketch: Optional[SpaceSaving] = None,
+			quantile_sketch: Optional[TDigest] = None,
+			unique_count: Optional[int] = None
+	):
+		"""
+		Creates an instance of :obj:`ColumnState`
+		"""
+		self.total_count = total_count
+		self.null_count = null_count
+		self.value_count = value_count
+		self.mean = mean
+		self.m2 = m2
+		self.min_value = min_value
+		self.max_value = max_value
+		self.invalid_counts = dict(invalid_counts or {})
+		self.constraint_statuses = dict(constraint_statuses or {})
+		self.unique_sketch = unique_sketch
+		self.topn_sketch = topn_sketch
+		self.quantile_sketch = quantile_sketch
+		self.unique_count = unique_count
+
+	@classmethod
+	def from_metrics(cls, metrics: Dict[str, Any]) -> "ColumnState":
+		"""
+		Args:
+			metrics (:obj:`Dict[str, Any]`): The values of the state expressions of a profiler
+
+		Returns:
+			:obj:`ColumnState`: The state of the column
+		"""
+		return cls(
+			total_count=int(metrics.get("total_count") or 0),
+			null_count=int(metrics.get("null_count") or 0),
+			value_count=int(metrics.get("value_count") or 0),
+			mean=float(metrics.get("mean") or 0.0),
+			m2=float(metrics.get("m2") or 0.0),
+			min_value=metrics.get("min"),
+			max_value=metrics.get("max"),
+			unique_count=metrics.get("unique_count")
+		)
+
+	def merge(self, other: "ColumnState") -> "ColumnState":
+		"""
+		Merges the state of another batch of the same column into this state, the unique count of a state without a
+		distinct values sketch is dropped, as is the sketch of this state when the other state has none
+
+		Args:
+			other (:obj:`ColumnState`): The state to be merged
+
+		Returns:
+			:obj:`ColumnState`: The merged state
+		"""
+		if other.total_count or not self.total_count:
+			if self.unique_sketch is not None and other.unique_sketch is not None:
+				self.unique_sketch.merge(other.unique_sketch)
+			elif self.total_count:
+				# the distinct values of both the states can not be combined without both the sketches
+				self.unique_sketch = None
+			else:
+				self.unique_sketch = copy.deepcopy(other.unique_sketch)
+			self.unique_count = None if self.total_count else other.unique_count
+		value_count = self.value_count + other.value_count
+		if value_count > 0:
+			delta = other.mean - self.mean
+			self.mean += delta * other.value_count / value_count
+			self.m2 += other.m2 + delta * delta * self.value_count * other.value_count / value_count
+		self.value_count = value_count
+		self.total_count += other.total_count
+		self.null_count += other.null_count
+		if other.min_value is not None:
+			self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+		if other.max_value is not None:
+			self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+		for name in {*other.invalid_counts, *other.constraint_statuses}:
+			if name not in self.constraint_statuses and name not in other.constraint_statuses:
+				self.invalid_counts[name] = self.invalid_counts.get(name, 0) + other.invalid_counts[name]
+				continue
+			# without both the counts, a constraint failed in either state is failed
+			statuses = {self.get_constraint_status(name), other.get_constraint_status(name)} - {None}
+			if "failed" in statuses:
+				self.constraint_statuses[name] = "failed"
+			elif statuses == {"success"}:
+				self.constraint_statuses[name] = "success"
+			else:
+				self.constraint_statuses[name] = "unknown"
+			self.invalid_counts.pop(name, None)
+		if other.topn_sketch is not None:
+			if self.topn_sketch is None:
+				self.topn_sketch = copy.deepcopy(other.topn_sketch)
+			else:
+				self.topn_sketch.merge(other.topn_sketch)
+		if other.quantile_sketch is not None:
+			if self.quantile_sketch is None:
+				self.quantile_sketch = copy.deepcopy(other.quantile_sketch)
+			else:
+				self.quantile_sketch.merge(other.quantile_sketch)
+		return self
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The :obj:`JSON` serializable form of the state
+			Sample Output::
+				{
+					"total_count": 100,
+					"null_count": 5,
+					"value_count": 95,
+					"mean": 18.0,
+					"m2": 2375.0,
+					"min": 2.0,
+					"max": 30.0,
+					"invalid_counts": {"gt_eq": 21},
+					"constraint_statuses": {"is_in": "failed"},
+					"unique_sketch": {"relative_error": 0.05, "registers": "..."},
+					"topn_sketch": {"capacity": 1000, "total_count": 95, "counters": [[2.0, 24, 0]]},
+					"quantile_sketch": {"compression": 100, "min": 2.0, "max": 30.0, "means": [...], "weights": [...]},
+					"unique_count": None
+				}
+		"""
+		return {
+			"total_count": self.total_count,
+			"null_count": self.null_count,
+			"value_count": self.value_count,
+			"mean": self.mean,
+			"m2": self.m2,
+			"min": self.min_value,
+			"max": self.max_value,
+			"invalid_counts": dict(self.invalid_counts),
+			"constraint_statuses": dict(self.constraint_statuses),
+			"unique_sketch": self.unique_sketch.to_dict() if self.unique_sketch is not None else None,
+			"topn_sketch": self.topn_sketch.to_dict() if self.topn_sketch is not None else None,
+			"quantile_sketch": self.quantile_sketch.to_dict() if self.quantile_sketch is not None else None,
+			"unique_count": self.unique_count
+		}
+
+	@classmethod
+	def from_dict(cls, state: Dict[str, Any]) -> "ColumnState":
+		"""
+		Args:
+			state (:obj:`Dict[str, Any]`): The state as returned by :meth:`to_dict`
+
+		Returns:
+			:obj:`ColumnState`: The state of the column
+		"""
+		instance = cls.from_metrics(state)
+		instance.invalid_counts = dict(state.get("invalid_counts") or {})
+		instance.constraint_statuses = dict(state.get("constraint_statuses") or {})
+		if state.get("unique_sketch") is not None:
+			instance.unique_sketch = HyperLogLog.from_dict(state["unique_sketch"])
+		if state.get("topn_sketch") is not None:
+			instance.topn_sketch = SpaceSaving.from_dict(state["topn_sketch"])
+		if state.get("quantile_sketch") is not None:
+			instance.quantile_sketch = TDigest.from_dict(state["quantile_sketch"])
+		return instance
+
+	def get_constraint_status(self, name: str) -> Optional[str]:
+		"""
+		Args:
+			name (:obj:`str`): The name of the constraint
+
+		Returns:
+			:obj:`str`: The status of the constraint, from its invalid count if counted, ``None`` if the state has
+			no outcome of the constraint
+		"""
+		if name in self.constraint_statuses:
+			return self.constraint_statuses[name]
+		if name in self.invalid_counts:
+			return "failed" if self.invalid_counts[name] > 0 else "success"
+		return None
+
+	def get_unique_count(self) -> Optional[int]:
+		"""
+		Returns:
+			:obj:`int`: The unique count estimated from the distinct values sketch, else the unique count of the state,
+			``None`` if unknown
+		"""
+		if self.unique_sketch is not None:
+			return self.unique_sketch.count()
+		return self.unique_count
+
+	def get_stddev(self) -> Optional[float]:
+		"""
+		Returns:
+			:obj:`float`: The sample standard deviation of the numeric values, same as Spark's ``stddev``
+		"""
+		if self.value_count < 2:
+			return None
+		return math.sqrt(self.m2 / (self.value_count - 1))
+
+	def get_metrics(self, numeric: bool) -> Dict[str, Any]:
+		"""
+		Args:
+			numeric (:obj:`bool`): Whether the min, max, mean and stddev of the column are included
+
+		Returns:
+			:obj:`Dict[str, Any]`: The metrics of the column
+		"""
+		metrics = {
+			"total_count": self.total_count,
+			"null_count": self.null_count,
+		}
+		if numeric:
+			metrics.update({
+				"min": self.min_value,
+				"max": self.max_value,
+				"mean": self.mean if self.value_count else None,
+				"stddev": self.get_stddev()
+			})
+		if self.unique_sketch is not None:
+			metrics["unique_count"] = self.unique_sketch.count()
+			metrics["unique_count_relative_error"] = self.unique_sketch.get_relative_error()
+		elif self.unique_count is not None:
+			metrics["unique_count"] = self.unique_count
+		if self.topn_sketch is not None:
+			top_values = self.topn_sketch.top(10)
+			metrics["topn_values"] = {value: count for value, count, _ in top_values}
+			metrics["topn_values_max_error"] = max([error for _, _, error in top_values], default=0)
+		return metrics
+
+	def get_distribution_metrics(self, column_config: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Args:
+			column_config (:obj:`Dict[str, Any]`): The config of a numeric column
+
+		Returns:
+			:obj:`Dict[str, Any]`: The configured quantiles and histogram of the column estimated from the quantile
+			sketch, the counts of the bins are estimated from the cumulative distribution of the sketch
+		"""
+		metrics: Dict[str, Any] = {}
+		if self.quantile_sketch is None:
+			return metrics
+		quantile_config = get_quantile_config(column_config)
+		if quantile_config is not None:
+			probabilities = quantile_config["probabilities"]
+			metrics["quantiles"] = {
+				str(probability): value
+				for probability, value in zip(probabilities, self.quantile_sketch.quantile(probabilities))
+			}
+		histogram_config = get_histogram_config(column_config)
+		if histogram_config is not None:
+			bins = histogram_config["bins"]
+			edges = []
+			if self.quantile_sketch.count():
+				if histogram_config["mode"] == "equi_depth":
+					edges = self.quantile_sketch.quantile(np.linspace(0, 1, bins + 1).tolist())
+				else:
+					edges = np.linspace(
+						*(histogram_config["range"] or (self.min_value, self.max_value)), bins + 1
+					).tolist()
+			counts = []
+			if edges:
+				cumulative_counts = np.round(np.asarray(self.quantile_sketch.cdf(edges)) * self.quantile_sketch.count())
+				counts = np.diff(cumulative_counts).astype(int).tolist()
+			metrics["histogram"] = {"mode": histogram_config["mode"], "edges": edges, "counts": counts}
+		return metrics
+
+	def get_result(self, column_config: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Args:
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+
+		Returns:
+			:obj:`Dict[str, Any]`: The metrics of the column along with the status of its constraints, the sample
+			invalid values are not part of the state
+		"""
+		constraints: List[Dict[str, Any]] = []
+		for constraint in column_config.get("constraints") or []:
+			status = self.get_constraint_status(constraint.get("name"))
+			constraints.append({
+				**constraint,
+				"constraint_status": "unknown" if status is None else status,
+				"invalid_count": self.invalid_counts.get(constraint.get("name"))
+			})
+		return {
+			"col_name": column_config.get("name"),
+			**self.get_metrics(numeric=column_config.get("datatype") == "number"),
+			"constraints": constraints,
+			**self.get_distribution_metrics(column_config)
+		}
@@ -0,0 +1,257 @@
+import json
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Iterator, Optional
+from urllib.request import urlopen
+from pyspark import SparkContext
+
+
+class Instrumentation:
+	"""
+	Records the cost of each metric and constraint of the columns profiled during a run of the analyzer: the wall
+	time, the CPU time of the calling thread and, for pandas with ``trace_memory``, the peak of the memory allocated
+	through ``tracemalloc``. Tracing the allocations slows down the python code, so the times taken along with the
+	memory are inflated. On Spark each measurement runs in its own job group, its jobs and stages are read from the status
+	tracker and the input rows and shuffle bytes of the stages from the REST API of the Spark UI (``None`` when the UI
+	is disabled). The memory and the Spark jobs of concurrently profiled columns can not be told apart, so they are
+	approximate with ``max_concurrency`` above 1
+
+	Args:
+		spark (:obj:`bool`): ``True`` if the data is a Spark dataframe
+		on_profile (:obj:`Callable[[str, Dict[str, Any]], None]`, optional): Called with the name and the profile of
+			each column once its profiler finishes, for ex: to forward the numbers to a metrics system
+		trace_memory (:obj:`bool`): If ``True``, the memory allocations of pandas are traced
+	"""
+	_spark: bool
+	_on_profile: Optional[Callable[[str, Dict[str, Any]], None]]
+	_trace_memory: bool
+	_profiles: Dict[str, Dict[str, Any]]
+	_local: threading.local
+	_lock: threading.Lock
+	_job_ids: List[int]
+	_started_tracing: bool
+
+	_stage_metrics = {
+		"input_rows": "inputRecords",
+		"input_bytes": "inputBytes",
+		"shuffle_read_bytes": "shuffleReadBytes",
+		"shuffle_write_bytes": "shuffleWriteBytes"
+	}
+
+	def __init__(
+			self,
+			spark: bool,
+			on_profile: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+			trace_memory: bool = False
+	):
+		"""
+		Creates an instance of :obj:`Instrumentation`
+		"""
+		self._spark = spark
+		self._on_profile = on_profile
+		self._trace_memory = trace_memory
+		self._profiles = {}
+		self._local = threading.local()
+		self._lock = threading.Lock()
+		self._job_ids = []
+		self._started_tracing = False
+
+	def start(self) -> None:
+		"""
+		Starts tracing the memory allocations for pandas with ``trace_memory``, unless already traced
+		"""
+		if self._trace_memory and not self._spark and not tracemalloc.is_tracing():
+			tracemalloc.start()
+			self._started_tracing = True
+
+	def stop(self) -> None:
+		"""
+		Stops tracing the memory allocations, if started by :meth:`start`
+		"""
+		if self._started_tracing:
+			tracemalloc.stop()
+			self._started_tracing = False
+
+	def get_job_count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The number of Spark jobs run in the job groups of the measurements
+		"""
+		return len(self._job_ids)
+
+	def get_stack(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The measurements in progress on the current thread, the innermost last
+		"""
+		if not hasattr(self._local, "stack"):
+			self._local.stack = []
+		return self._local.stack
+
+	@contextmanager
+	def measure(self, column_name: str, kind: str, name: str) -> Iterator[None]:
+		"""
+		Measures the code run in the context, nested measurements are included in the outer one
+
+		Args:
+			column_name (:obj:`str`): The name of the column
+			kind (:obj:`str`): Either ``metrics`` or ``constraints``
+			name (:obj:`str`): The name of the metric or the constraint
+		"""
+		stack = self.get_stack()
+		frame: Dict[str, Any] = {"job_ids": [], "memory_peak": 0}
+		tracing = self._trace_memory and tracemalloc.is_tracing()
+		if tracing:
+			current, peak = tracemalloc.get_traced_memory()
+			if stack:
+				stack[-1]["memory_peak"] = max(stack[-1]["memory_peak"], peak - stack[-1]["memory_start"])
+			if hasattr(tracemalloc, "reset_peak"):
+				tracemalloc.reset_peak()
+			frame["memory_start"] = current
+
+		spark_context = None
+		parent_job_group = None
+		if self._spark:
+			spark_context = SparkContext.getOrCreate()
+			parent_job_group = spark_context.getLocalProperty("spark.jobGroup.id")
+			frame["job_group"] = f"dq_whistler_profile_{uuid.uuid4().hex}"
+			spark_context.setLocalProperty("spark.jobGroup.id", frame["job_group"])
+
+		stack.append(frame)
+		wall_start = time.perf_counter()
+		cpu_start = time.thread_time()
+		try:
+			yield
+		finally:
+			stats: Dict[str, Any] = {
+				"wall_time": time.perf_counter() - wall_start,
+				"cpu_time": time.thread_time() - cpu_start
+			}
+			stack.pop()
+			if tracing:
+				peak = max(frame["memory_peak"], tracemalloc.get_traced_memory()[1] - frame["memory_start"])
+				stats["memory_peak_bytes"] = peak
+				if stack:
+					stack[-1]["memory_peak"] = max(
+						stack[-1]["memory_peak"], peak + frame["memory_start"] - stack[-1]["memory_start"]
+					)
+			if spark_context is not None:
+				spark_context.setLocalProperty("spark.jobGroup.id", parent_job_group)
+				job_ids = list(spark_context.statusTracker().getJobIdsForGroup(frame["job_group"]))
+				with self._lock:
+					self._job_ids.extend(job_ids)
+				job_ids.extend(frame["job_ids"])
+				if stack:
+					stack[-1]["job_ids"].extend(job_ids)
+				stats["job_ids"] = job_ids
+			self.add_stats(column_name, kind, name, stats)
+
+	def add_stats(self, column_name: str, kind: str, name: str, stats: Dict[str, Any]) -> None:
+		"""
+		Args:
+			column_name (:obj:`str`): The name of the column
+			kind (:obj:`str`): Either ``metrics`` or ``constraints``
+			name (:obj:`str`): The name of the metric or the constraint
+			stats (:obj:`Dict[str, Any]`): The numbers of the measurement
+		"""
+		with self._lock:
+			profile = self._profiles.setdefault(column_name, {"metrics": {}, "constraints": []})
+			if kind == "constraints":
+				profile["constraints"].append({"name": name, **stats})
+			else:
+				profile["metrics"][name] = stats
+
+	def add_reference(self, column_name: str, name: str, source: str) -> None:
+		"""
+		Records a metric computed by the measurement of another metric, for ex: the null count computed in the
+		``scalar_metrics`` aggregation, with no time of its own and the Spark jobs of the source, unless already
+		recorded
+
+		Args:
+			column_name (:obj:`str`): The name of the column
+			name (:obj:`str`): The name of the metric
+			source (:obj:`str`): The name of the measured metric which computed it
+		"""
+		with self._lock:
+			profile = self._profiles.setdefault(column_name, {"metrics": {}, "constraints": []})
+			source_stats = profile["metrics"].get(source)
+			if source_stats is None or name in profile["metrics"]:
+				return
+			stats: Dict[str, Any] = {"wall_time": 0.0, "cpu_time": 0.0, "computed_in": source}
+			if "job_ids" in source_stats:
+				stats["job_ids"] = list(source_stats["job_ids"])
+			profile["metrics"][name] = stats
+
+	def get_spark_stats(self, job_ids: List[int]) -> Dict[str, Any]:
+		"""
+		Args:
+			job_ids (:obj:`List[int]`): The ids of the Spark jobs of a measurement
+
+		Returns:
+			:obj:`Dict[str, Any]`: The number of jobs and stages and the totals of the input and shuffle metrics of
+			the stages, the totals are ``None`` when the REST API of the Spark UI is not available
+			Sample Output::
+				{
+					"spark_jobs": 2,
+					"spark_stages": 3,
+					"input_rows": 1000,
+					"input_bytes": 24000,
+					"shuffle_read_bytes": 1200,
+					"shuffle_write_bytes": 1200
+				}
+		"""
+		spark_context = SparkContext.getOrCreate()
+		status_tracker = spark_context.statusTracker()
+		stage_ids = set()
+		for job_id in job_ids:
+			job_info = status_tracker.getJobInfo(job_id)
+			if job_info is not None:
+				stage_ids.update(job_info.stageIds)
+		stats: Dict[str, Any] = {"spark_jobs": len(job_ids), "spark_stages": len(stage_ids)}
+		totals = {name: 0 for name in self._stage_metrics}
+		url = spark_context.uiWebUrl
+		try:
+			if url is None:
+				raise OSError("The Spark UI is disabled")
+			for stage_id in stage_ids:
+				# the skipped stages of the jobs are not present in the UI
+				with urlopen(f"{url}/api/v1/applications/{spark_context.applicationId}/stages/{stage_id}") as response:
+					attempts = json.loads(response.read())
+				for attempt in attempts:
+					for name, key in self._stage_metrics.items():
+						totals[name] += attempt.get(key, 0)
+		except (OSError, ValueError):
+			totals = {name: None for name in self._stage_metrics}
+		return {**stats, **totals}
+
+	def finish_column(self, column_name: str) -> Dict[str, Any]:
+		"""
+		Resolves the Spark numbers of the measurements of a column, once all its jobs are over, and calls the
+		``on_profile`` callback
+
+		Args:
+			column_name (:obj:`str`): The name of the column
+
+		Returns:
+			:obj:`Dict[str, Any]`: The profile of the column
+			Sample Output::
+				{
+					"metrics": {
+						"null_count": {"wall_time": 0.21, "cpu_time": 0.01, "spark_jobs": 1, "spark_stages": 2, ...}
+					},
+					"constraints": [
+						{"name": "regex", "wall_time": 0.35, "cpu_time": 0.01, "spark_jobs": 2, ...}
+					]
+				}
+		"""
+		with self._lock:
+			profile = self._profiles.pop(column_name, {"metrics": {}, "constraints": []})
+		for stats in [*profile["metrics"].values(), *profile["constraints"]]:
+			if "job_ids" in stats:
+				stats.update(self.get_spark_stats(stats.pop("job_ids")))
+		if self._on_profile is not None:
+			self._on_profile(column_name, profile)
+		return profile
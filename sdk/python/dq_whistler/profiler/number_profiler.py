@@ -3,7 +3,11 @@ from dq_whistler.constraints.number_type import *
 from pandas.core.series import Series as pandas_df
 from pyspark.sql.dataframe import DataFrame as spark_df
 import pyspark.sql.functions as f
-from typing import Dict, Any
+from pyspark.sql.column import Column
+from dq_whistler.constraints.constraint import Constraint
+from dq_whistler.profiler.column_state import get_quantile_config, get_histogram_config
+from typing import Dict, Any, List, Optional
+import numpy as np
 import json
 
 
@@ -99,34 +103,250 @@ class NumberProfiler(ColumnProfiler):
 		if isinstance(self._column_data, pandas_df):
 			return float(self._column_data.std())
 
-	def run(self) -> Dict[str, Any]:
+	def get_quantile_config(self) -> Optional[Dict[str, Any]]:
 		"""
 		Returns:
-			:obj:`Dict[str, Any]`: The final dict with all the metrics of a numeric column
-			Example Output::
+			:obj:`Dict[str, Any]`: The config for the quantiles of the column, ``None`` if the quantiles are not
+			configured, see :func:`dq_whistler.profiler.column_state.get_quantile_config`
+		"""
+		return get_quantile_config(self._config)
+
+	def get_histogram_config(self) -> Optional[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The config for the histogram of the column, ``None`` if the histogram is not
+			configured, see :func:`dq_whistler.profiler.column_state.get_histogram_config`
+		"""
+		return get_histogram_config(self._config)
+
+	def get_depth_probabilities(self) -> List[float]:
+		"""
+		Returns:
+			:obj:`List[float]`: The probabilities of the edges of the equi depth histogram
+		"""
+		return np.linspace(0, 1, self.get_histogram_config()["bins"] + 1).tolist()
+
+	def get_percentile_expr(self, probabilities: List[float]) -> Column:
+		"""
+		Args:
+			probabilities (:obj:`List[float]`): The probabilities of the quantiles
+
+		Returns:
+			:obj:`pyspark.sql.Column`: Aggregate expression for the approximate quantiles of the column
+		"""
+		quantile_config = self.get_quantile_config() or {"accuracy": 10000}
+		return f.percentile_approx(
+			f.col(self._column_name).cast("double"), probabilities, quantile_config["accuracy"]
+		)
+
+	def get_histogram_count_expr(self, edges: List[float]) -> Column:
+		"""
+		Args:
+			edges (:obj:`List[float]`): The edges of the bins, each bin includes its lower edge and the last bin
+				includes its upper edge as well
+
+		Returns:
+			:obj:`pyspark.sql.Column`: Aggregate expression for the array of the count of values in each bin
+		"""
+		column = f.col(self._column_name).cast("double")
+		last = len(edges) - 2
+		return f.array(*[
+			f.count(f.when(
+				(column >= lower) & ((column <= upper) if index == last else (column < upper)), True
+			))
+			for index, (lower, upper) in enumerate(zip(edges[:-1], edges[1:]))
+		])
+
+	def get_exact_quantiles(self, probabilities: List[float]) -> List[Optional[float]]:
+		"""
+		Args:
+			probabilities (:obj:`List[float]`): The probabilities of the quantiles
+
+		Returns:
+			:obj:`List[float]`: The quantiles of a pandas column, the smallest value such that the given fraction of the
+			values are below or equal to it, same as the definition of Spark's ``percentile_approx``
+		"""
+		values = self._column_data.dropna().to_numpy(dtype="float64")
+		if not len(values):
+			return [None] * len(probabilities)
+		indexes = np.clip(np.ceil(np.asarray(probabilities) * len(values)).astype(int) - 1, 0, len(values) - 1)
+		return np.partition(values, np.unique(indexes))[indexes].tolist()
+
+	def get_quantile_values(self) -> List[Optional[float]]:
+		"""
+		Returns:
+			:obj:`List[float]`: The quantile of each configured probability
+		"""
+		probabilities = self.get_quantile_config()["probabilities"]
+		if isinstance(self._column_data, spark_df):
+			return self._column_data.select(self.get_percentile_expr(probabilities)).first()[0]
+
+		if isinstance(self._column_data, pandas_df):
+			return self.get_exact_quantiles(probabilities)
+
+	def get_quantiles(self) -> Dict[str, Optional[float]]:
+		"""
+		Returns:
+			:obj:`Dict[str, float]`: The quantile of each configured probability, keyed by the probability
+			Sample Output::
 				{
-					"total_count": 100,
-					"null_count": 50,
-					"unique_count": 20,
-					"topn_values": {"1": 24, "2": 25},
-					"min": 2.0,
-					"max": 30.0,
-					"mean": 18.0,
-					"stddev": 5.0,
-					"quality_score": 0,
-					"constraints": [
-						{
-							"name": "eq",
-							"values", 5,
-							"constraint_status": "failed/success",
-							"invalid_count": 21,
-							"invalid_values": [4, 6, 7, 1]
-						}
-					]
+					"0.5": 12.0,
+					"0.95": 28.0,
+					"0.99": 30.0
 				}
 		"""
+		probabilities = self.get_quantile_config()["probabilities"]
+		values = self.get_metric("quantiles", self.get_quantile_values) or [None] * len(probabilities)
+		return {str(probability): value for probability, value in zip(probabilities, values)}
+
+	def get_histogram_edges(self) -> List[float]:
+		"""
+		Returns:
+			:obj:`List[float]`: The edges of the bins of the histogram, empty if the column has no values
+		"""
+		histogram_config = self.get_histogram_config()
+		if histogram_config["mode"] == "equi_depth":
+			def compute() -> List[Optional[float]]:
+				if isinstance(self._column_data, spark_df):
+					expr = self.get_percentile_expr(self.get_depth_probabilities())
+					return self._column_data.select(expr).first()[0]
+				return self.get_exact_quantiles(self.get_depth_probabilities())
+
+			edges = self.get_metric("histogram_edges", compute) or []
+			return [] if any(edge is None for edge in edges) else edges
+		if histogram_config["range"] is not None:
+			return np.linspace(*histogram_config["range"], histogram_config["bins"] + 1).tolist()
+		min_value = self.get_metric("min", self.get_min_value)
+		max_value = self.get_metric("max", self.get_max_value)
+		if min_value is None or np.isnan(min_value):
+			return []
+		return np.linspace(min_value, max_value, histogram_config["bins"] + 1).tolist()
+
+	def get_histogram(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The edges of the bins of the histogram and the count of values in each bin, each
+			bin includes its lower edge and the last bin includes its upper edge as well
+			Sample Output::
+				{
+					"mode": "equi_width",
+					"edges": [0.0, 50.0, 100.0],
+					"counts": [12, 8]
+				}
+		"""
+		histogram_config = self.get_histogram_config()
+		edges = self.get_histogram_edges()
+
+		def compute() -> List[int]:
+			if not edges:
+				return []
+			if isinstance(self._column_data, spark_df):
+				return list(self._column_data.select(self.get_histogram_count_expr(edges)).first()[0])
+			values = self._column_data.dropna().to_numpy(dtype="float64")
+			values = values[(values >= edges[0]) & (values <= edges[-1])]
+			indexes = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 2)
+			return np.bincount(indexes, minlength=len(edges) - 1).tolist()
+
+		counts = self.get_metric("histogram_counts", compute) if edges else []
+		return {"mode": histogram_config["mode"], "edges": edges, "counts": [int(count) for count in counts]}
+
+	def get_distribution_metrics(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The quantiles and the histogram of the column, each only if configured
+		"""
+		metrics = {}
+		if self.get_quantile_config() is not None:
+			metrics["quantiles"] = self.get_quantiles()
+		if self.get_histogram_config() is not None:
+			metrics["histogram"] = self.get_histogram()
+		return metrics
+
+	def get_quantile_compression(self) -> Optional[float]:
+		"""
+		Returns:
+			:obj:`float`: The compression of the quantile sketch of the mergeable state, the sketch is always built
+			for a numeric column so that its distribution can be compared by the drift detection
+		"""
+		return (self.get_quantile_config() or {"compression": 100})["compression"]
+
+	def get_metric_exprs(self) -> Dict[str, Column]:
+		"""
+		Returns:
+			:obj:`Dict[str, pyspark.sql.Column]`: Spark aggregate expressions for the scalar metrics of a numeric column,
+			along with the configured quantiles, the edges of an equi depth histogram and the counts of an equi width
+			histogram with a fixed range. With :meth:`set_emit_state`, the count and the sum of squared differences of the
+			values, and the quantiles at ``compression + 1`` evenly spaced probabilities for the quantile sketch
+		"""
+		exprs = super(NumberProfiler, self).get_metric_exprs()
+		column = f.col(self._column_name).cast("double")
+		exprs.update({
+			"min": f.min(column),
+			"max": f.max(column),
+			"mean": f.mean(column),
+			"stddev": f.stddev(column)
+		})
+		quantile_config = self.get_quantile_config()
+		if quantile_config is not None:
+			exprs["quantiles"] = self.get_percentile_expr(quantile_config["probabilities"])
+		histogram_config = self.get_histogram_config()
+		if histogram_config is not None:
+			if histogram_config["mode"] == "equi_depth":
+				exprs["histogram_edges"] = self.get_percentile_expr(self.get_depth_probabilities())
+			elif histogram_config["range"] is not None:
+				exprs["histogram_counts"] = self.get_histogram_count_expr(self.get_histogram_edges())
+		if self._emit_state:
+			exprs.update({
+				"value_count": f.count(column),
+				"m2": f.var_pop(column) * f.count(column),
+				"quantile_points": self.get_percentile_expr(
+					np.linspace(0, 1, int(self.get_quantile_compression()) + 1).tolist()
+				)
+			})
+		return exprs
+
+	def get_state_exprs(self) -> Dict[str, Column]:
+		"""
+		Returns:
+			:obj:`Dict[str, pyspark.sql.Column]`: Spark aggregate expressions for the mergeable state of a numeric column
+		"""
+		exprs = super(NumberProfiler, self).get_state_exprs()
+		column = f.col(self._column_name).cast("double")
+		exprs.update({
+			"value_count": f.count(column),
+			"mean": f.mean(column),
+			"m2": f.var_pop(column) * f.count(column),
+			"min": f.min(column),
+			"max": f.max(column)
+		})
+		return exprs
+
+	def get_state_metrics(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The values of the mergeable state of a numeric pandas column
+		"""
+		metrics = super(NumberProfiler, self).get_state_metrics()
+		values = self._column_data.dropna().astype("float64")
+		if len(values):
+			mean = float(values.mean())
+			metrics.update({
+				"value_count": len(values),
+				"mean": mean,
+				"m2": float(((values - mean) ** 2).sum()),
+				"min": float(values.min()),
+				"max": float(values.max())
+			})
+		return metrics
+
+	def build_constraints(self) -> List[Constraint]:
+		"""
+		Returns:
+			:obj:`List[Constraint]`: The numeric constraints of the column created from its config
+		"""
 		column_name = self._column_name
-		for constraint in self._config.get("constraints"):
+		self._constraints = []
+		for constraint in self.get_constraints_config():
 			name = constraint.get("name")
 			if name == "eq":
 				self.add_constraint(
@@ -170,19 +390,53 @@ class NumberProfiler(ColumnProfiler):
 				)
 			else:
 				raise NotImplementedError
+		return self._constraints
+
+	def run(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The final dict with all the metrics of a numeric column
+			Example Output::
+				{
+					"total_count": 100,
+					"null_count": 50,
+					"unique_count": 20,
+					"topn_values": {"1": 24, "2": 25},
+					"min": 2.0,
+					"max": 30.0,
+					"mean": 18.0,
+					"stddev": 5.0,
+					"quality_score": 0,
+					"quantiles": {"0.5": 17.0, "0.95": 29.0},
+					"histogram": {"mode": "equi_width", "edges": [2.0, 16.0, 30.0], "counts": [20, 30]},
+					"constraints": [
+						{
+							"name": "eq",
+							"values", 5,
+							"constraint_status": "failed/success",
+							"invalid_count": 21,
+							"invalid_values": [4, 6, 7, 1]
+						}
+					]
+				}
+		"""
+		self.build_constraints()
 		# Preparing data frame for constraints execution
 		self.prepare_df_for_constraints()
 		# Get final output of constraints
-		output = self.get_custom_constraint_check()
+		output = self.get_metric("constraints", self.get_custom_constraint_check)
+		self.compute_scalar_metrics()
 		return {
-			"total_count": self.get_total_count(),
-			"null_count": self.get_null_count(),
-			"unique_count": self.get_unique_count(),
-			"topn_values": self.get_topn(),
-			"min": self.get_min_value(),
-			"max": self.get_max_value(),
-			"mean": self.get_mean_value(),
-			"stddev": self.get_stddev_value(),
+			"total_count": self.get_metric("total_count", self.get_total_count),
+			"null_count": self.get_metric("null_count", self.get_null_count),
+			"unique_count": self.get_metric("unique_count", self.get_unique_count),
+			"topn_values": self.get_measured_topn(),
+			"min": self.get_metric("min", self.get_min_value),
+			"max": self.get_metric("max", self.get_max_value),
+			"mean": self.get_metric("mean", self.get_mean_value),
+			"stddev": self.get_metric("stddev", self.get_stddev_value),
 			"quality_score": self.get_quality_score(),
-			"constraints": output
+			"constraints": output,
+			**self.get_distribution_metrics(),
+			**self.get_optional_metrics()
 		}
@@ -0,0 +1,150 @@
+import gc
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Any, Optional
+import numpy as np
+import pandas as pd
+from pandas.core.series import Series as pandas_df
+
+try:
+	import pyarrow as pa
+except ImportError:
+	pa = None
+
+
+class SharedColumn:
+	"""
+	A pandas column placed in shared memory, so that it can be profiled by a worker process without pickling the
+	values through a pipe. The column is written as an Arrow IPC stream if ``pyarrow`` is installed and can convert
+	the column, else the numeric columns are shared as raw numpy buffers and the rest, like object columns mixing
+	strings and numbers, are pickled into the shared memory
+
+	Args:
+		column_data (:obj:`pandas.core.series.Series`): The column data to be shared
+		use_arrow (:obj:`bool`, optional): Whether to use Arrow buffers, by default Arrow is used if installed
+	"""
+	_name: str
+	_size: int
+	_layout: str
+	_dtype: Optional[str]
+	_length: int
+	_column_name: Any
+	_memory: Optional[SharedMemory]
+
+	def __init__(self, column_data: pandas_df, use_arrow: Optional[bool] = None):
+		"""
+		Creates an instance of :obj:`SharedColumn`, the caller is responsible for calling :meth:`unlink`
+		"""
+		if use_arrow is None:
+			use_arrow = pa is not None
+		self._column_name = column_data.name
+		self._length = len(column_data)
+		self._dtype = None
+		payload = self.get_arrow_payload(column_data) if use_arrow else None
+		if payload is not None:
+			self._layout = "arrow"
+		elif isinstance(column_data.dtype, np.dtype) and column_data.dtype.kind in "biuf":
+			self._layout = "numpy"
+			self._dtype = column_data.dtype.str
+			payload = memoryview(np.ascontiguousarray(column_data.to_numpy())).cast("B")
+		else:
+			self._layout = "pickle"
+			payload = memoryview(pickle.dumps(column_data, protocol=pickle.HIGHEST_PROTOCOL)).cast("B")
+		self._size = payload.nbytes
+		self._memory = SharedMemory(create=True, size=max(self._size, 1))
+		self._memory.buf[:self._size] = payload
+		self._name = self._memory.name
+
+	@staticmethod
+	def get_arrow_payload(column_data: pandas_df) -> Optional[memoryview]:
+		"""
+		Args:
+			column_data (:obj:`pandas.core.series.Series`): The column data to be shared
+
+		Returns:
+			:obj:`memoryview`: The column as an Arrow IPC stream, ``None`` if Arrow can not convert the column, for
+			ex: an object column mixing strings and numbers
+		"""
+		try:
+			batch = pa.RecordBatch.from_pandas(column_data.to_frame(name="values"), preserve_index=False)
+		except pa.ArrowException:
+			return None
+		sink = pa.BufferOutputStream()
+		with pa.ipc.new_stream(sink, batch.schema) as writer:
+			writer.write_batch(batch)
+		return memoryview(sink.getvalue()).cast("B")
+
+	def __getstate__(self) -> Dict[str, Any]:
+		"""
+		Only the name and layout of the shared memory are pickled for the worker process
+		"""
+		return {**self.__dict__, "_memory": None}
+
+	def read(self, memory: SharedMemory) -> pandas_df:
+		"""
+		Args:
+			memory (:obj:`multiprocessing.shared_memory.SharedMemory`): The shared memory attached by the worker
+
+		Returns:
+			:obj:`pandas.core.series.Series`: The shared column, numeric columns are not copied so the column should
+			not be referenced once the memory is closed
+		"""
+		buffer = memory.buf[:self._size]
+		if self._layout == "arrow":
+			column_data = pa.ipc.open_stream(pa.py_buffer(buffer)).read_all().column(0).to_pandas()
+		elif self._layout == "numpy":
+			column_data = pd.Series(np.frombuffer(buffer, dtype=np.dtype(self._dtype), count=self._length), copy=False)
+		else:
+			column_data = pickle.loads(buffer)
+		column_data.name = self._column_name
+		return column_data
+
+	def get_name(self) -> str:
+		"""
+		Returns:
+			:obj:`str`: The name of the shared memory block
+		"""
+		return self._name
+
+	def unlink(self) -> None:
+		"""
+		Releases the shared memory, to be called by the process which created the column
+		"""
+		if self._memory is not None:
+			self._memory.close()
+			self._memory.unlink()
+			self._memory = None
+
+
+def _profile_column(column_data: pandas_df, column_config: Dict[str, Any]) -> Dict[str, Any]:
+	"""
+	Args:
+		column_data (:obj:`pandas.core.series.Series`): The column data
+		column_config (:obj:`Dict[str, Any]`): The config of the column
+
+	Returns:
+		:obj:`Dict[str, Any]`: The stats of the column
+	"""
+	from dq_whistler.analyzer import DataQualityAnalyzer
+
+	return DataQualityAnalyzer(column_data.to_frame(), [column_config]).run_profilers()[0]
+
+
+def profile_shared_column(shared_column: SharedColumn, column_config: Dict[str, Any]) -> Dict[str, Any]:
+	"""
+	Profiles a shared column in a worker process
+
+	Args:
+		shared_column (:obj:`SharedColumn`): The column data in shared memory
+		column_config (:obj:`Dict[str, Any]`): The config of the column
+
+	Returns:
+		:obj:`Dict[str, Any]`: The stats of the column
+	"""
+	memory = SharedMemory(name=shared_column.get_name())
+	try:
+		return _profile_column(shared_column.read(memory), column_config)
+	finally:
+		# the views on the shared memory must be released before it can be closed
+		gc.collect()
+		memory.close()
@@ -1,8 +1,12 @@
+import numpy as np
+import pandas as pd
 from dq_whistler.profiler.column_profiler import ColumnProfiler
 from dq_whistler.constraints.string_type import *
 from pandas.core.series import Series as pandas_df
 from pyspark.sql.dataframe import DataFrame as spark_df
-from typing import Dict, Any, Union
+from dq_whistler.constraints.constraint import Constraint
+from dq_whistler.constraints.matcher import StringMatcher
+from typing import Dict, Any, Union, List
 
 
 class StringProfiler(ColumnProfiler):
@@ -33,30 +37,14 @@ class StringProfiler(ColumnProfiler):
 		"""
 		super(StringProfiler, self).__init__(column_data, config)
 
-	def run(self) -> Dict[str, Any]:
+	def build_constraints(self) -> List[Constraint]:
 		"""
 		Returns:
-			:obj:`Dict[str, Any]`: The final dict with all the metrics of a string column
-			Example Output::
-				{
-					"total_count": 100,
-					"null_count": 50,
-					"unique_count": 20,
-					"topn_values": {"abc": 24, "xyz": 25},
-					"quality_score": 0,
-					"constraints": [
-						{
-							"name": "eq",
-							"values", "abc",
-							"constraint_status": "failed/success",
-							"invalid_count": 21,
-							"invalid_values": ["xy", "ab", "abcd"]
-						}
-					]
-				}
+			:obj:`List[Constraint]`: The string constraints of the column created from its config
 		"""
 		column_name = self._column_name
-		for constraint in self._config.get("constraints"):
+		self._constraints = []
+		for constraint in self.get_constraints_config():
 			name = constraint.get("name")
 			if name == "eq":
 				self.add_constraint(
@@ -104,15 +92,83 @@ class StringProfiler(ColumnProfiler):
 				)
 			else:
 				raise NotImplementedError
+		return self._constraints
+
+	def compute_string_matches(self) -> None:
+		"""
+		Evaluates all the ``contains``, ``starts_with``, ``ends_with`` and ``regex`` constraints of a pandas column
+		together with :obj:`StringMatcher`, in a single pass over the distinct values, and sets their outputs. The
+		match of each distinct value is mapped back to its rows, so repeated values are matched once
+		"""
+		precomputed = self._metrics.get("constraint_results") or {}
+		constraints = [
+			constraint for constraint in self._constraints
+			if constraint.get_match_pattern() is not None
+			and constraint.get_mode() == "count"
+			and constraint.constraint_name() not in precomputed
+		]
+		if len(constraints) < 2:
+			return
+		patterns = [constraint.get_match_pattern() for constraint in constraints]
+		codes, uniques = pd.factorize(self._column_data)
+		unique_bitmap = StringMatcher([(kind, pattern) for kind, pattern, _ in patterns]).match(pd.Series(uniques))
+		# the code of the null values is -1, which selects the appended row of no match
+		bitmap = np.vstack([unique_bitmap, np.zeros((1, len(patterns)), dtype=bool)])[codes]
+		not_null = codes >= 0
+		results = dict(precomputed)
+		for index, (constraint, (_, _, fails_on_match)) in enumerate(zip(constraints, patterns)):
+			invalid = bitmap[:, index] if fails_on_match else ~bitmap[:, index] & not_null
+			failures = self._column_data[invalid]
+			results[constraint.constraint_name()] = constraint.get_result(
+				int(failures.count()), constraint.get_sample_invalid_values(failures)
+			)
+		self.set_metrics({"constraint_results": results})
+
+	def get_custom_constraint_check(self) -> List[Dict[str, str]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, str]]`: An array containing the output of each of the constraint for a column, the
+			string matching constraints of a pandas column are evaluated together
+		"""
+		if isinstance(self._column_data, pandas_df):
+			with self.measure("metrics", "string_matches"):
+				self.compute_string_matches()
+		return super(StringProfiler, self).get_custom_constraint_check()
+
+	def run(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The final dict with all the metrics of a string column
+			Example Output::
+				{
+					"total_count": 100,
+					"null_count": 50,
+					"unique_count": 20,
+					"topn_values": {"abc": 24, "xyz": 25},
+					"quality_score": 0,
+					"constraints": [
+						{
+							"name": "eq",
+							"values", "abc",
+							"constraint_status": "failed/success",
+							"invalid_count": 21,
+							"invalid_values": ["xy", "ab", "abcd"]
+						}
+					]
+				}
+		"""
+		self.build_constraints()
 		# Preparing data frame for constraints execution
 		self.prepare_df_for_constraints()
 		# Get final output of constraints
-		output = self.get_custom_constraint_check()
+		output = self.get_metric("constraints", self.get_custom_constraint_check)
+		self.compute_scalar_metrics()
 		return {
-			"total_count": self.get_total_count(),
-			"null_count": self.get_null_count(),
-			"unique_count": self.get_unique_count(),
-			"topn_values": self.get_topn(),
+			"total_count": self.get_metric("total_count", self.get_total_count),
+			"null_count": self.get_metric("null_count", self.get_null_count),
+			"unique_count": self.get_metric("unique_count", self.get_unique_count),
+			"topn_values": self.get_measured_topn(),
 			"quality_score": self.get_quality_score(),
-			"constraints": output
+			"constraints": output,
+			**self.get_optional_metrics()
 		}
@@ -0,0 +1,348 @@
+import json
+from typing import Dict, List, Any, Union, Iterator, Tuple
+import numpy as np
+
+try:
+	import pyarrow as pa
+except ImportError:
+	pa = None
+
+
+class NpEncoder(json.JSONEncoder):
+	def default(self, obj):
+		if isinstance(obj, np.integer):
+			return int(obj)
+		if isinstance(obj, np.floating):
+			return float(obj)
+		if isinstance(obj, np.ndarray):
+			return obj.tolist()
+		return super(NpEncoder, self).default(obj)
+
+
+def to_python(value: Any) -> Any:
+	"""
+	Args:
+		value (:obj:`Any`): A metric value, possibly a numpy scalar or array, or a dict/list of them
+
+	Returns:
+		:obj:`Any`: The value with the numpy scalars and arrays replaced by python values, in a single pass
+	"""
+	if isinstance(value, np.generic):
+		return value.item()
+	if isinstance(value, np.ndarray):
+		return value.tolist()
+	if isinstance(value, dict):
+		return {key: to_python(item) for key, item in value.items()}
+	if isinstance(value, (list, tuple)):
+		return [to_python(item) for item in value]
+	return value
+
+
+def get_arrow_schema() -> "pa.Schema":
+	"""
+	Returns:
+		:obj:`pyarrow.Schema`: The schema of the results as a table, one row per constraint of a column (one row with
+		null constraint fields for a column without constraints), the values which differ in type between the
+		columns or the constraints, like the other metrics of a column, are :obj:`JSON` strings
+	"""
+	if pa is None:
+		raise ImportError("pyarrow is required to convert the results to an Arrow table")
+	return pa.schema([
+		("col_name", pa.string()),
+		("total_count", pa.int64()),
+		("null_count", pa.int64()),
+		("unique_count", pa.int64()),
+		("metrics", pa.string()),
+		("constraint_name", pa.string()),
+		("constraint_status", pa.string()),
+		("invalid_count", pa.int64()),
+		("invalid_values", pa.string()),
+		("constraint", pa.string())
+	])
+
+
+class LazyResult:
+	"""
+	Base class of the results, the output is kept as is and each value is converted by :func:`to_python` on its first
+	access, so that gating on a few fields does not convert the sample invalid values and the other metrics. The
+	values not in ``_fields`` are available as attributes as well
+
+	Args:
+		output (:obj:`Dict[str, Any]`): The output, with the keys in their original order
+	"""
+	__slots__ = ("_output", "_values")
+
+	_fields: Tuple[str, ...] = ()
+
+	def __init__(self, output: Dict[str, Any]):
+		self._output = output
+		self._values = {}
+
+	def __getattr__(self, name: str) -> Any:
+		if name.startswith("_") or name not in self._output:
+			raise AttributeError(name)
+		return self.get_value(name)
+
+	def get_value(self, key: str) -> Any:
+		"""
+		Args:
+			key (:obj:`str`): The key of the output
+
+		Returns:
+			:obj:`Any`: The value of the key with python values, converted once, ``None`` if the key is missing
+		"""
+		if key not in self._values:
+			self._values[key] = to_python(self._output.get(key))
+		return self._values[key]
+
+	def get_extra(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The values of the output which are not in ``_fields``
+		"""
+		return {key: self.get_value(key) for key in self._output if key not in self._fields}
+
+
+class ConstraintResult(LazyResult):
+	"""
+	The output of one constraint, the fields used for gating are attributes and the rest of the output (the config of
+	the constraint, the confidence intervals etc.) is kept as is until it is read, see :obj:`LazyResult`
+
+	Args:
+		output (:obj:`Dict[str, Any]`): The output of the constraint, as returned by
+			:meth:`dq_whistler.constraints.constraint.Constraint.execute_check`
+	"""
+	__slots__ = ()
+
+	_fields = ("name", "constraint_status", "invalid_count", "invalid_values")
+
+	@property
+	def name(self) -> str:
+		return self.get_value("name")
+
+	@property
+	def constraint_status(self) -> str:
+		return self.get_value("constraint_status")
+
+	@property
+	def invalid_count(self) -> int:
+		return self.get_value("invalid_count")
+
+	@property
+	def invalid_values(self) -> List[Any]:
+		return self.get_value("invalid_values")
+
+	def __repr__(self) -> str:
+		return f"ConstraintResult(name={self.name!r}, constraint_status={self.constraint_status!r}, " \
+			f"invalid_count={self.invalid_count!r})"
+
+	def is_failed(self) -> bool:
+		"""
+		Returns:
+			:obj:`bool`: ``True`` if the constraint failed
+		"""
+		return self.constraint_status == "failed"
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The output of the constraint, with the keys in their original order
+		"""
+		return {key: self.get_value(key) for key in self._output}
+
+	def to_json(self) -> str:
+		"""
+		Returns:
+			:obj:`str`: :obj:`JSON` string of the output of the constraint
+		"""
+		return json.dumps(self.to_dict())
+
+	def get_arrow_row(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The constraint fields of a row of the Arrow table, see :func:`get_arrow_schema`
+		"""
+		return {
+			"constraint_name": self.name,
+			"constraint_status": self.constraint_status,
+			"invalid_count": self.invalid_count,
+			"invalid_values": json.dumps(self.invalid_values),
+			"constraint": json.dumps(self.get_extra())
+		}
+
+	def to_arrow(self) -> "pa.Table":
+		"""
+		Returns:
+			:obj:`pyarrow.Table`: The output of the constraint as a single row table
+		"""
+		schema = get_arrow_schema()
+		return pa.Table.from_pylist([self.get_arrow_row()], schema=schema)
+
+
+class ColumnResult(LazyResult):
+	"""
+	The stats of one column, the counts and the constraints are attributes and the other metrics (``min``, ``max``,
+	``mean`` etc.) are available as attributes as well, each converted on its first access, see :obj:`LazyResult`
+
+	Args:
+		output (:obj:`Dict[str, Any]`): The stats of the column, as returned by
+			:meth:`dq_whistler.analyzer.DataQualityAnalyzer.run_profilers`
+	"""
+	__slots__ = ("_constraints",)
+
+	_fields = ("col_name", "total_count", "null_count", "unique_count", "topn_values", "constraints")
+
+	def __init__(self, output: Dict[str, Any]):
+		"""
+		Creates an instance of :obj:`ColumnResult`
+		"""
+		super(ColumnResult, self).__init__(output)
+		self._constraints = None
+
+	@property
+	def col_name(self) -> str:
+		return self.get_value("col_name")
+
+	@property
+	def total_count(self) -> int:
+		return self.get_value("total_count")
+
+	@property
+	def null_count(self) -> int:
+		return self.get_value("null_count")
+
+	@property
+	def unique_count(self) -> int:
+		return self.get_value("unique_count")
+
+	@property
+	def topn_values(self) -> Dict[Any, int]:
+		return self.get_value("topn_values")
+
+	@property
+	def constraints(self) -> List[ConstraintResult]:
+		if self._constraints is None:
+			self._constraints = [ConstraintResult(constraint) for constraint in self._output.get("constraints") or []]
+		return self._constraints
+
+	def __repr__(self) -> str:
+		return f"ColumnResult(col_name={self.col_name!r}, total_count={self.total_count!r}, " \
+			f"null_count={self.null_count!r}, constraints={len(self.constraints)})"
+
+	def get_failed_constraints(self) -> List[ConstraintResult]:
+		"""
+		Returns:
+			:obj:`List[ConstraintResult]`: The failed constraints of the column
+		"""
+		return [constraint for constraint in self.constraints if constraint.is_failed()]
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The stats of the column, with the keys in their original order
+		"""
+		return {
+			key: [constraint.to_dict() for constraint in self.constraints] if key == "constraints" else self.get_value(key)
+			for key in self._output
+		}
+
+	def to_json(self) -> str:
+		"""
+		Returns:
+			:obj:`str`: :obj:`JSON` string of the stats of the column
+		"""
+		return json.dumps(self.to_dict())
+
+	def get_arrow_rows(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The rows of the column in the Arrow table, see :func:`get_arrow_schema`
+		"""
+		column_row = {
+			"col_name": self.col_name,
+			"total_count": self.total_count,
+			"null_count": self.null_count,
+			"unique_count": self.unique_count,
+			"metrics": json.dumps({"topn_values": self.topn_values, **self.get_extra()})
+		}
+		if not self.constraints:
+			return [column_row]
+		return [{**column_row, **constraint.get_arrow_row()} for constraint in self.constraints]
+
+	def to_arrow(self) -> "pa.Table":
+		"""
+		Returns:
+			:obj:`pyarrow.Table`: The stats of the column with a row per constraint
+		"""
+		schema = get_arrow_schema()
+		return pa.Table.from_pylist(self.get_arrow_rows(), schema=schema)
+
+
+class AnalysisResult:
+	"""
+	The stats of all the configured columns, in the order of the config. The columns can be iterated or looked up by
+	position or by name
+
+	Args:
+		outputs (:obj:`List[Dict[str, Any]]`): The stats of each column
+	"""
+	__slots__ = ("columns",)
+
+	def __init__(self, outputs: List[Dict[str, Any]]):
+		"""
+		Creates an instance of :obj:`AnalysisResult`
+		"""
+		self.columns = [ColumnResult(output) for output in outputs]
+
+	def __iter__(self) -> Iterator[ColumnResult]:
+		return iter(self.columns)
+
+	def __len__(self) -> int:
+		return len(self.columns)
+
+	def __getitem__(self, key: Union[int, str]) -> ColumnResult:
+		if isinstance(key, str):
+			for column in self.columns:
+				if column.col_name == key:
+					return column
+			raise KeyError(key)
+		return self.columns[key]
+
+	def __repr__(self) -> str:
+		return f"AnalysisResult(columns={[column.col_name for column in self.columns]!r})"
+
+	def get_failed_constraints(self) -> List[Tuple[str, ConstraintResult]]:
+		"""
+		Returns:
+			:obj:`List[Tuple[str, ConstraintResult]]`: The name of the column and the failed constraint, for each
+			failed constraint of all the columns
+		"""
+		return [
+			(column.col_name, constraint)
+			for column in self.columns
+			for constraint in column.get_failed_constraints()
+		]
+
+	def to_dict(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The stats of each column, same as the parsed output of
+			:meth:`dq_whistler.analyzer.DataQualityAnalyzer.analyze` except that the top values keep the type of
+			their keys
+		"""
+		return [column.to_dict() for column in self.columns]
+
+	def to_json(self) -> str:
+		"""
+		Returns:
+			:obj:`str`: :obj:`JSON` string of the stats of each column
+		"""
+		return json.dumps(self.to_dict())
+
+	def to_arrow(self) -> "pa.Table":
+		"""
+		Returns:
+			:obj:`pyarrow.Table`: The stats of all the columns with a row per constraint
+		"""
+		schema = get_arrow_schema()
+		return pa.Table.from_pylist([row for column in self.columns for row in column.get_arrow_rows()], schema=schema)
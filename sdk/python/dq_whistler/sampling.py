@@ -0,0 +1,215 @@
+import math
+from statistics import NormalDist
+from typing import Dict, List, Any, Union, Optional, Tuple
+import pandas as pd
+import pyspark.sql.functions as f
+from pyspark.sql.column import Column
+from pandas.core.frame import DataFrame as pandas_df
+from pyspark.sql.dataframe import DataFrame as spark_df
+
+
+class Sampler:
+	"""
+	Samples the data for the sampling mode of :obj:`dq_whistler.analyzer.DataQualityAnalyzer` and estimates the
+	counts of the whole data from the counts on the sample. Each stratum (the whole data unless ``stratified``) is
+	treated as a simple random sample, the estimate of a count is ``N_h * c_h / n_h`` summed over the strata and its
+	confidence interval is the normal approximation with the finite population correction. When the row count ``N_h``
+	of a stratum is not known, the rows are treated as sampled independently with the stratum's fraction and the
+	variance is that of the Horvitz-Thompson estimate
+
+	Args:
+		config (:obj:`Dict[str, Any]`): The sampling config, ``method`` is one of ``fraction``, ``reservoir`` or
+			``stratified``. Strata missing from ``fractions`` are sampled with ``fraction``, which defaults to ``1.0``
+			for ``stratified``
+			Sample Dict::
+				{"method": "fraction", "fraction": 0.001, "seed": 42, "confidence": 0.95}
+				{"method": "reservoir", "size": 100000}
+				{"method": "stratified", "key": "country", "fractions": {"ID": 0.001, "SG": 0.1}, "fraction": 0.01}
+	"""
+	_config: Dict[str, Any]
+	_method: str
+	_confidence: float
+	_population: Optional[int]
+	_stratum_populations: Dict[Any, int]
+
+	def __init__(self, config: Dict[str, Any]):
+		"""
+		Creates an instance of :obj:`Sampler`
+		"""
+		self._config = config
+		self._method = config.get("method", "fraction")
+		if self._method not in ("fraction", "reservoir", "stratified"):
+			raise NotImplementedError
+		if self._method == "stratified" and not config.get("key"):
+			raise ValueError("The key column is required for stratified sampling")
+		self._confidence = config.get("confidence", 0.95)
+		self._population = None
+		self._stratum_populations = {}
+
+	def get_key(self) -> Optional[str]:
+		"""
+		Returns:
+			:obj:`str`: The name of the key column of the strata, ``None`` unless ``stratified``
+		"""
+		return self._config.get("key") if self._method == "stratified" else None
+
+	def get_confidence(self) -> float:
+		"""
+		Returns:
+			:obj:`float`: The confidence level of the intervals
+		"""
+		return self._confidence
+
+	def get_fraction(self, stratum: Any = None) -> float:
+		"""
+		Args:
+			stratum (:obj:`Any`, optional): The value of the key column of the stratum
+
+		Returns:
+			:obj:`float`: The fraction of the rows of the stratum included in the sample
+		"""
+		if self._method == "stratified":
+			return (self._config.get("fractions") or {}).get(stratum, self._config.get("fraction", 1.0))
+		if self._method == "reservoir":
+			return min(1.0, self._config["size"] / max(self._population or 0, 1))
+		return self._config["fraction"]
+
+	def get_fraction_expr(self) -> Column:
+		"""
+		Returns:
+			:obj:`pyspark.sql.Column`: The expression for the sampling fraction of the stratum of each row
+		"""
+		fraction_expr = f.lit(self._config.get("fraction", 1.0))
+		for stratum, fraction in (self._config.get("fractions") or {}).items():
+			fraction_expr = f.when(f.col(self.get_key()) == stratum, f.lit(fraction)).otherwise(fraction_expr)
+		return fraction_expr
+
+	def sample(self, data: Union[spark_df, pandas_df], total_count: Optional[int] = None) -> Union[spark_df, pandas_df]:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`): The data to be sampled
+			total_count (:obj:`int`, optional): The row count of the data if known, for ex: from the Parquet footers,
+				else it is estimated from the sample, for ``reservoir`` on Spark the rows are counted
+
+		Returns:
+			:obj:`pyspark.sql.DataFrame` | :obj:`pandas.core.frame.DataFrame`: The sample
+		"""
+		seed = self._config.get("seed")
+		self._population = total_count
+		self._stratum_populations = {}
+
+		if isinstance(data, spark_df):
+			if self._method == "fraction":
+				return data.sample(withReplacement=False, fraction=self.get_fraction(), seed=seed)
+			elif self._method == "reservoir":
+				# a bernoulli sample with the expected size, as an exact reservoir would need a pass over all the rows
+				self._population = total_count if total_count is not None else data.count()
+				return data.sample(withReplacement=False, fraction=self.get_fraction(), seed=seed)
+			else:
+				return data.filter(f.rand(seed) < self.get_fraction_expr())
+
+		if isinstance(data, pandas_df):
+			self._population = len(data)
+			if self._method == "fraction":
+				return data.sample(frac=self.get_fraction(), random_state=seed)
+			elif self._method == "reservoir":
+				return data.sample(n=min(self._config["size"], len(data)), random_state=seed)
+			else:
+				samples = []
+				for stratum, group in data.groupby(self.get_key(), dropna=False):
+					self._stratum_populations[stratum] = len(group)
+					samples.append(group.sample(frac=self.get_fraction(stratum), random_state=seed))
+				return pd.concat(samples) if samples else data.iloc[0:0]
+
+		raise NotImplementedError
+
+	def get_population(self, stratum: Any, sample_count: int) -> float:
+		"""
+		Args:
+			stratum (:obj:`Any`): The value of the key column of the stratum, ``None`` unless ``stratified``
+			sample_count (:obj:`int`): The number of rows of the stratum in the sample
+
+		Returns:
+			:obj:`float`: The number of rows of the stratum in the data, estimated from the sample when not known
+		"""
+		if self.is_population_known(stratum):
+			return float(self._population if self._method != "stratified" else self._stratum_populations[stratum])
+		return sample_count / self.get_fraction(stratum)
+
+	def is_population_known(self, stratum: Any) -> bool:
+		"""
+		Args:
+			stratum (:obj:`Any`): The value of the key column of the stratum, ``None`` unless ``stratified``
+
+		Returns:
+			:obj:`bool`: ``True`` if the number of rows of the stratum in the data is known
+		"""
+		if self._method != "stratified":
+			return self._population is not None
+		return stratum in self._stratum_populations
+
+	def estimate(self, strata: List[Tuple[Any, int, int]]) -> Tuple[float, float]:
+		"""
+		Args:
+			strata (:obj:`List[Tuple[Any, int, int]]`): The stratum, its row count and the count of a metric in
+				the sample, for each of the strata
+
+		Returns:
+			:obj:`Tuple[float, float]`: The estimated count of the metric in the data and the margin of error at the
+			``confidence`` level
+		"""
+		estimate = 0.0
+		variance = 0.0
+		for stratum, sample_count, count in strata:
+			if sample_count == 0:
+				continue
+			population = self.get_population(stratum, sample_count)
+			rate = count / sample_count
+			estimate += population * rate
+			if not self.is_population_known(stratum):
+				# the rows are sampled independently, the variance of the Horvitz-Thompson estimate
+				fraction = self.get_fraction(stratum)
+				variance += count * (1 - fraction) / (fraction * fraction)
+			elif sample_count > 1:
+				correction = max(1 - sample_count / population, 0.0)
+				variance += population * population * correction * rate * (1 - rate) / (sample_count - 1)
+		z = NormalDist().inv_cdf((1 + self._confidence) / 2)
+		return estimate, z * math.sqrt(variance)
+
+	def get_total(self, strata: List[Tuple[Any, int]]) -> float:
+		"""
+		Args:
+			strata (:obj:`List[Tuple[Any, int]]`): The stratum and its row count in the sample, for each of the strata
+
+		Returns:
+			:obj:`float`: The number of rows of the data, estimated from the sample when not known
+		"""
+		if self._method != "stratified" and self._population is not None:
+			return float(self._population)
+		return sum(self.get_population(stratum, sample_count) for stratum, sample_count in strata if sample_count)
+
+	def get_estimates(self, strata: List[Tuple[Any, int, int]], total: float) -> Dict[str, Any]:
+		"""
+		Args:
+			strata (:obj:`List[Tuple[Any, int, int]]`): The stratum, its row count and the count of a metric in
+				the sample, for each of the strata
+			total (:obj:`float`): The number of rows of the data
+
+		Returns:
+			:obj:`Dict[str, Any]`: The estimated count and rate of the metric along with their confidence intervals
+			Sample Output::
+				{
+					"count": 2100,
+					"count_ci": [1900, 2300],
+					"rate": 0.021,
+					"rate_ci": [0.019, 0.023]
+				}
+		"""
+		estimate, margin = self.estimate(strata)
+		lower, upper = max(estimate - margin, 0.0), min(estimate + margin, total)
+		return {
+			"count": int(round(estimate)),
+			"count_ci": [int(math.floor(lower)), int(math.ceil(upper))],
+			"rate": estimate / total if total else 0.0,
+			"rate_ci": [lower / total, upper / total] if total else [0.0, 0.0]
+		}
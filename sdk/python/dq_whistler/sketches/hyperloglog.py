@@ -0,0 +1,148 @@
+import base64
+import math
+from typing import Dict, Any
+import numpy as np
+import pandas as pd
+from pandas.core.series import Series as pandas_df
+
+
+class HyperLogLog:
+	"""
+	HyperLogLog sketch for approximate distinct counts of a pandas Series, with linear counting for small
+	cardinalities. The precision is derived from the relative error in the same way as Spark's ``approx_count_distinct``
+
+	Args:
+		relative_error (:obj:`float`): The maximum relative standard deviation of the estimated count
+	"""
+	_relative_error: float
+	_precision: int
+	_registers: np.ndarray
+
+	def __init__(self, relative_error: float = 0.05):
+		"""
+		Creates an instance of :obj:`HyperLogLog`
+		"""
+		if not 0 < relative_error < 1:
+			raise ValueError(f"The relative error should be between 0 and 1, got {relative_error}")
+		self._relative_error = relative_error
+		self._precision = min(max(math.ceil(2.0 * math.log2(1.106 / relative_error)), 4), 18)
+		self._registers = np.zeros(1 << self._precision, dtype=np.uint8)
+
+	@staticmethod
+	def _leading_zeros(values: np.ndarray) -> np.ndarray:
+		"""
+		Args:
+			values (:obj:`numpy.ndarray`): Array of ``uint64`` values
+
+		Returns:
+			:obj:`numpy.ndarray`: The count of leading zero bits of each value
+		"""
+		count = np.zeros(values.shape, dtype=np.uint64)
+		for shift in (32, 16, 8, 4, 2, 1):
+			shift = np.uint64(shift)
+			is_zero = values < (np.uint64(1) << (np.uint64(64) - shift))
+			count = np.where(is_zero, count + shift, count)
+			values = np.where(is_zero, values << shift, values)
+		return count + (values >> np.uint64(63) == 0)
+
+	@staticmethod
+	def _normalize(values: pandas_df) -> pandas_df:
+		"""
+		Args:
+			values (:obj:`pandas.core.series.Series`): The non null values
+
+		Returns:
+			:obj:`pandas.core.series.Series`: The values as ``float64`` if numeric else as python strings, so that the
+			hashes of the same value do not depend on the dtype of the batch it was added from
+		"""
+		if pd.api.types.infer_dtype(values, skipna=True) in ("integer", "floating", "mixed-integer-float", "decimal"):
+			return pd.Series(values.to_numpy(dtype="float64"))
+		return pd.Series(values.astype(str).to_numpy(dtype=object), dtype=object)
+
+	def update(self, values: pandas_df) -> "HyperLogLog":
+		"""
+		Adds the non null values of a Series to the sketch
+
+		Args:
+			values (:obj:`pandas.core.series.Series`): The values to be added
+
+		Returns:
+			:obj:`HyperLogLog`: The updated sketch
+		"""
+		values = values.dropna()
+		if values.empty:
+			return self
+		hashes = pd.util.hash_pandas_object(self._normalize(values), index=False).to_numpy()
+		precision = np.uint64(self._precision)
+		indexes = (hashes >> (np.uint64(64) - precision)).astype(np.int64)
+		ranks = np.minimum(self._leading_zeros(hashes << precision) + 1, 64 - self._precision + 1)
+		np.maximum.at(self._registers, indexes, ranks.astype(np.uint8))
+		return self
+
+	def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+		"""
+		Merges another sketch of the same precision into this sketch
+
+		Args:
+			other (:obj:`HyperLogLog`): The sketch to be merged
+
+		Returns:
+			:obj:`HyperLogLog`: The merged sketch
+		"""
+		if other._precision != self._precision:
+			raise ValueError("HyperLogLog sketches with different precisions can not be merged")
+		np.maximum(self._registers, other._registers, out=self._registers)
+		return self
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The :obj:`JSON` serializable form of the sketch
+		"""
+		return {
+			"relative_error": self._relative_error,
+			"registers": base64.b64encode(self._registers.tobytes()).decode("ascii")
+		}
+
+	@classmethod
+	def from_dict(cls, sketch: Dict[str, Any]) -> "HyperLogLog":
+		"""
+		Args:
+			sketch (:obj:`Dict[str, Any]`): The sketch as returned by :meth:`to_dict`
+
+		Returns:
+			:obj:`HyperLogLog`: The sketch
+		"""
+		instance = cls(sketch["relative_error"])
+		registers = np.frombuffer(base64.b64decode(sketch["registers"]), dtype=np.uint8)
+		if len(registers) != len(instance._registers):
+			raise ValueError("The registers do not match the relative error of the sketch")
+		instance._registers = registers.copy()
+		return instance
+
+	def get_relative_error(self) -> float:
+		"""
+		Returns:
+			:obj:`float`: The relative error the sketch was created with
+		"""
+		return self._relative_error
+
+	def count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The estimated count of distinct values added to the sketch
+		"""
+		m = len(self._registers)
+		if m == 16:
+			alpha = 0.673
+		elif m == 32:
+			alpha = 0.697
+		elif m == 64:
+			alpha = 0.709
+		else:
+			alpha = 0.7213 / (1 + 1.079 / m)
+		estimate = alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+		zero_registers = int(np.count_nonzero(self._registers == 0))
+		if estimate <= 2.5 * m and zero_registers > 0:
+			estimate = m * math.log(m / zero_registers)
+		return int(round(estimate))
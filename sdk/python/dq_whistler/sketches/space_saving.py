@@ -0,0 +1,154 @@
+import heapq
+from collections import Counter
+from itertools import islice
+from typing import Dict, Any, Iterable, List, Tuple
+
+
+class SpaceSaving:
+	"""
+	Mergeable Space-Saving sketch for the heavy hitters of a stream of values. The sketch keeps at most ``capacity``
+	counters, the count of each value is over estimated by at most its error, which is bounded by
+	``total_count / capacity`` irrespective of the cardinality of the values
+
+	Args:
+		capacity (:obj:`int`): The max number of counters kept by the sketch
+	"""
+	_capacity: int
+	_counts: Dict[Any, int]
+	_errors: Dict[Any, int]
+	_total_count: int
+
+	def __init__(self, capacity: int = 1000):
+		"""
+		Creates an instance of :obj:`SpaceSaving`
+		"""
+		if capacity < 1:
+			raise ValueError(f"The capacity of the sketch should be positive, got {capacity}")
+		self._capacity = capacity
+		self._counts = {}
+		self._errors = {}
+		self._total_count = 0
+
+	def _min_count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The upper bound of the count of a value not present in the sketch
+		"""
+		return min(self._counts.values()) if len(self._counts) >= self._capacity else 0
+
+	def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+		"""
+		Merges another sketch into this sketch, a value missing from a full sketch is assumed to have the min
+		count of that sketch as its count as well as its error
+
+		Args:
+			other (:obj:`SpaceSaving`): The sketch to be merged
+
+		Returns:
+			:obj:`SpaceSaving`: The merged sketch
+		"""
+		self_min, other_min = self._min_count(), other._min_count()
+		counts, errors = {}, {}
+		for value in set(self._counts).union(other._counts):
+			counts[value] = self._counts.get(value, self_min) + other._counts.get(value, other_min)
+			errors[value] = self._errors.get(value, self_min) + other._errors.get(value, other_min)
+		kept = heapq.nlargest(self._capacity, counts, key=counts.get)
+		self._counts = {value: counts[value] for value in kept}
+		self._errors = {value: errors[value] for value in kept}
+		self._total_count += other._total_count
+		return self
+
+	def update_counts(self, counts: Dict[Any, int]) -> "SpaceSaving":
+		"""
+		Adds exact counts of a batch of values to the sketch, only the top ``capacity`` values of the batch are kept
+
+		Args:
+			counts (:obj:`Dict[Any, int]`): Dict containing the values and their counts
+
+		Returns:
+			:obj:`SpaceSaving`: The updated sketch
+		"""
+		batch = SpaceSaving(self._capacity)
+		kept = heapq.nlargest(self._capacity, counts, key=counts.get)
+		batch._counts = {value: counts[value] for value in kept}
+		batch._errors = {value: 0 for value in kept}
+		batch._total_count = sum(counts.values())
+		# the values dropped from the batch have at most the count of the smallest kept value, which is exactly
+		# what merge assumes for the values missing from a full sketch
+		return self.merge(batch)
+
+	def update(self, values: Iterable[Any], batch_size: int = 10000) -> "SpaceSaving":
+		"""
+		Adds the values to the sketch in batches, so that the memory used is bounded by the ``batch_size``
+
+		Args:
+			values (:obj:`Iterable[Any]`): The values to be added
+			batch_size (:obj:`int`): The number of values counted exactly before being added to the sketch
+
+		Returns:
+			:obj:`SpaceSaving`: The updated sketch
+		"""
+		iterator = iter(values)
+		batch = Counter(islice(iterator, batch_size))
+		while batch:
+			self.update_counts(batch)
+			batch = Counter(islice(iterator, batch_size))
+		return self
+
+	def top(self, n: int) -> List[Tuple[Any, int, int]]:
+		"""
+		Args:
+			n (:obj:`int`): The number of heavy hitters
+
+		Returns:
+			:obj:`List[Tuple[Any, int, int]]`: The top ``n`` values along with their estimated counts and errors,
+			sorted by count in descending order
+		"""
+		return [
+			(value, self._counts[value], self._errors[value])
+			for value in heapq.nlargest(n, self._counts, key=self._counts.get)
+		]
+
+	def get_count(self, value: Any) -> int:
+		"""
+		Args:
+			value (:obj:`Any`): The value
+
+		Returns:
+			:obj:`int`: The estimated count of the value, ``0`` if the value is not counted by the sketch
+		"""
+		return self._counts.get(value, 0)
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The :obj:`JSON` serializable form of the sketch, given the values are serializable
+		"""
+		return {
+			"capacity": self._capacity,
+			"total_count": self._total_count,
+			"counters": [[value, count, error] for value, count, error in self.top(self._capacity)]
+		}
+
+	@classmethod
+	def from_dict(cls, sketch: Dict[str, Any]) -> "SpaceSaving":
+		"""
+		Args:
+			sketch (:obj:`Dict[str, Any]`): The sketch as returned by :meth:`to_dict`
+
+		Returns:
+			:obj:`SpaceSaving`: The sketch
+		"""
+		instance = cls(sketch["capacity"])
+		instance._total_count = sketch["total_count"]
+		for value, count, error in sketch["counters"]:
+			instance._counts[value] = count
+			instance._errors[value] = error
+		return instance
+
+	def get_total_count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The total count of values added to the sketch
+		"""
+		return self._total_count
@@ -0,0 +1,239 @@
+import math
+from typing import Dict, List, Any, Union, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class TDigest:
+	"""
+	t-digest sketch for approximate quantiles and cumulative distribution of numeric values, the values are kept as
+	weighted centroids which are small near the tails and larger near the median (``k1`` scale function), so the
+	extreme quantiles stay accurate. The exact min and max are kept along with the centroids. Batches are added and
+	compressed with vectorized NumPy, and sketches of different batches or runs can be merged
+
+	Args:
+		compression (:obj:`float`): The compression of the sketch, the number of centroids is at most about
+			``compression``, higher is more accurate
+	"""
+	_compression: float
+	_means: np.ndarray
+	_weights: np.ndarray
+	_min_value: Optional[float]
+	_max_value: Optional[float]
+
+	def __init__(self, compression: float = 100):
+		"""
+		Creates an instance of :obj:`TDigest`
+		"""
+		if compression < 10:
+			raise ValueError(f"The compression should be at least 10, got {compression}")
+		self._compression = compression
+		self._means = np.empty(0, dtype="float64")
+		self._weights = np.empty(0, dtype="float64")
+		self._min_value = None
+		self._max_value = None
+
+	def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+		"""
+		Replaces the centroids of the sketch by the given centroids merged along the ``k1`` scale, the centroids whose
+		mid cumulative quantile falls in the same unit of ``k1`` are merged into one
+
+		Args:
+			means (:obj:`numpy.ndarray`): The means of the centroids
+			weights (:obj:`numpy.ndarray`): The weights of the centroids
+		"""
+		order = np.argsort(means, kind="mergesort")
+		means = means[order]
+		weights = weights[order]
+		total = weights.sum()
+		mid_quantiles = (np.cumsum(weights) - weights / 2) / total
+		scale = np.floor(self._compression / math.pi * np.arcsin(2 * mid_quantiles - 1))
+		starts = np.flatnonzero(np.r_[True, scale[1:] != scale[:-1]])
+		self._weights = np.add.reduceat(weights, starts)
+		self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+	def update(self, values: Union[pd.Series, Iterable[float]]) -> "TDigest":
+		"""
+		Adds the non null values to the sketch
+
+		Args:
+			values (:obj:`pandas.core.series.Series` | :obj:`Iterable[float]`): The values to be added
+
+		Returns:
+			:obj:`TDigest`: The updated sketch
+		"""
+		values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+		values = values[~np.isnan(values)]
+		if not len(values):
+			return self
+		self._update_bounds(float(values.min()), float(values.max()))
+		self._compress(np.concatenate([self._means, values]), np.concatenate([self._weights, np.ones(len(values))]))
+		return self
+
+	def _update_bounds(self, min_value: Optional[float], max_value: Optional[float]) -> None:
+		"""
+		Args:
+			min_value (:obj:`float`, optional): The min of the added values
+			max_value (:obj:`float`, optional): The max of the added values
+		"""
+		if min_value is not None:
+			self._min_value = min_value if self._min_value is None else min(self._min_value, min_value)
+		if max_value is not None:
+			self._max_value = max_value if self._max_value is None else max(self._max_value, max_value)
+
+	def merge(self, other: "TDigest") -> "TDigest":
+		"""
+		Args:
+			other (:obj:`TDigest`): The sketch to be merged, the compression of this sketch is kept
+
+		Returns:
+			:obj:`TDigest`: This sketch with the values of both the sketches
+		"""
+		if not len(other._weights):
+			return self
+		self._update_bounds(other._min_value, other._max_value)
+		self._compress(
+			np.concatenate([self._means, other._means]), np.concatenate([self._weights, other._weights])
+		)
+		return self
+
+	def count(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The number of values added to the sketch
+		"""
+		return int(round(self._weights.sum()))
+
+	def get_min_value(self) -> Optional[float]:
+		"""
+		Returns:
+			:obj:`float`: The exact min of the values, ``None`` if empty
+		"""
+		return self._min_value
+
+	def get_max_value(self) -> Optional[float]:
+		"""
+		Returns:
+			:obj:`float`: The exact max of the values, ``None`` if empty
+		"""
+		return self._max_value
+
+	def get_breakpoints(self) -> np.ndarray:
+		"""
+		Returns:
+			:obj:`numpy.ndarray`: The min, the means of the centroids and the max, where the slope of the interpolated
+			cumulative distribution changes
+		"""
+		if not len(self._weights):
+			return np.empty(0, dtype="float64")
+		return np.r_[self._min_value, self._means, self._max_value]
+
+	def _get_points(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Returns:
+			:obj:`Tuple[numpy.ndarray, numpy.ndarray]`: The cumulative weights at the center of each centroid along with
+			the means, bounded by the min and the max, for the interpolation of the quantiles
+		"""
+		total = self._weights.sum()
+		centers = np.cumsum(self._weights) - self._weights / 2
+		return (
+			np.r_[0.0, centers, total],
+			np.r_[self._min_value, self._means, self._max_value]
+		)
+
+	def quantile(self, probabilities: Union[float, List[float]]) -> Union[Optional[float], List[Optional[float]]]:
+		"""
+		Args:
+			probabilities (:obj:`float` | :obj:`List[float]`): The probabilities between 0 and 1
+
+		Returns:
+			:obj:`float` | :obj:`List[float]`: The estimated quantile of each probability, ``None`` if the sketch is
+			empty
+		"""
+		single = np.isscalar(probabilities)
+		probabilities = np.atleast_1d(np.asarray(probabilities, dtype="float64"))
+		if np.any((probabilities < 0) | (probabilities > 1)):
+			raise ValueError("The probabilities should be between 0 and 1")
+		if not len(self._weights):
+			quantiles = [None] * len(probabilities)
+		else:
+			cumulative_weights, means = self._get_points()
+			quantiles = np.interp(probabilities * cumulative_weights[-1], cumulative_weights, means).tolist()
+		return quantiles[0] if single else quantiles
+
+	def cdf(self, values: Union[float, List[float]]) -> Union[Optional[float], List[Optional[float]]]:
+		"""
+		Args:
+			values (:obj:`float` | :obj:`List[float]`): The values
+
+		Returns:
+			:obj:`float` | :obj:`List[float]`: The estimated fraction of the values of the sketch below each value,
+			interpolated between the centroids from ``0`` at the min to ``1`` at the max, ``None`` if the sketch is
+			empty
+		"""
+		single = np.isscalar(values)
+		values = np.atleast_1d(np.asarray(values, dtype="float64"))
+		if not len(self._weights):
+			fractions = [None] * len(values)
+		else:
+			cumulative_weights, means = self._get_points()
+			fractions = np.interp(values, means, cumulative_weights) / cumulative_weights[-1]
+			fractions = np.where(values <= self._min_value, 0.0, np.where(values >= self._max_value, 1.0, fractions))
+			fractions = fractions.tolist()
+		return fractions[0] if single else fractions
+
+	@classmethod
+	def from_quantiles(cls, quantiles: List[Optional[float]], count: int, compression: float = 100) -> "TDigest":
+		"""
+		Builds a sketch from the quantiles of the values at evenly spaced probabilities from ``0`` to ``1``, for ex:
+		computed by Spark's ``percentile_approx``, each interval between consecutive quantiles becomes a centroid at
+		its middle holding an equal share of the values
+
+		Args:
+			quantiles (:obj:`List[float]`): The quantiles at the probabilities ``0, 1 / n, ..., 1``
+			count (:obj:`int`): The number of values
+			compression (:obj:`float`): The compression of the sketch
+
+		Returns:
+			:obj:`TDigest`: The sketch, empty without values
+		"""
+		instance = cls(compression)
+		quantiles = np.asarray([quantile for quantile in quantiles or [] if quantile is not None], dtype="float64")
+		if not count or not len(quantiles):
+			return instance
+		instance._update_bounds(float(quantiles[0]), float(quantiles[-1]))
+		if len(quantiles) == 1:
+			instance._compress(quantiles, np.asarray([float(count)]))
+			return instance
+		means = (quantiles[:-1] + quantiles[1:]) / 2
+		instance._compress(means, np.full(len(means), count / len(means)))
+		return instance
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The :obj:`JSON` serializable form of the sketch
+		"""
+		return {
+			"compression": self._compression,
+			"min": self._min_value,
+			"max": self._max_value,
+			"means": self._means.tolist(),
+			"weights": self._weights.tolist()
+		}
+
+	@classmethod
+	def from_dict(cls, sketch: Dict[str, Any]) -> "TDigest":
+		"""
+		Args:
+			sketch (:obj:`Dict[str, Any]`): The sketch as returned by :meth:`to_dict`
+
+		Returns:
+			:obj:`TDigest`: The sketch
+		"""
+		instance = cls(sketch["compression"])
+		instance._min_value = sketch.get("min")
+		instance._max_value = sketch.get("max")
+		instance._means = np.asarray(sketch["means"], dtype="float64")
+		instance._weights = np.asarray(sketch["weights"], dtype="float64")
+		return instance
@@ -0,0 +1,176 @@
+import threading
+from typing import Dict, List, Any, Callable, Optional
+from pyspark.sql.dataframe import DataFrame as spark_df
+from pyspark.sql.streaming import DataStreamWriter
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.profiler.column_state import ColumnState
+
+
+class StreamingDataQualityAnalyzer:
+	"""
+	Analyzer for Structured Streaming dataframes, each micro-batch is analyzed with :obj:`DataQualityAnalyzer` and the
+	counts, nulls, min/max, mean/variance and constraint invalid counts are merged into running totals, so the
+	cumulative result never requires scanning the previous batches again. The state of a batch is built from the
+	metrics of its fused aggregation, so each batch is scanned once. A batch whose id is not above the id of the last
+	merged batch is skipped, as Spark replays the last batch after a failure. The running totals are kept in memory
+	and are lost when the query restarts, unless :meth:`get_state` is stored (for ex: in ``on_batch``) and passed
+	back as ``initial_state``
+
+	Args:
+		config (:obj:`List[Dict[str, str]]`): The array of dicts containing config for each column
+		on_batch (:obj:`Callable[[int, List[Dict[str, Any]], List[Dict[str, Any]]], None]`, optional): Called after each
+			micro-batch with the batch id, the result of the batch and the cumulative result
+		storage_level (:obj:`str`): The storage level used to persist each micro-batch while it is analyzed
+		initial_state (:obj:`Dict[str, Any]`, optional): The running totals to resume from, as returned by
+			:meth:`get_state`
+	"""
+	_config: List[Dict[str, str]]
+	_on_batch: Optional[Callable[[int, List[Dict[str, Any]], List[Dict[str, Any]]], None]]
+	_storage_level: str
+	_states: List[ColumnState]
+	_batch_count: int
+	_last_batch_id: Optional[int]
+	_batch_result: List[Dict[str, Any]]
+	_lock: threading.RLock
+
+	def __init__(
+			self,
+			config: List[Dict[str, str]],
+			on_batch: Optional[Callable[[int, List[Dict[str, Any]], List[Dict[str, Any]]], None]] = None,
+			storage_level: str = "MEMORY_AND_DISK",
+			initial_state: Optional[Dict[str, Any]] = None
+	):
+		"""
+		Creates an instance of :obj:`StreamingDataQualityAnalyzer`
+		"""
+		self._config = config
+		self._on_batch = on_batch
+		self._storage_level = storage_level
+		self._states = [ColumnState() for _ in config]
+		self._batch_count = 0
+		self._last_batch_id = None
+		if initial_state is not None:
+			if len(initial_state["states"]) != len(config):
+				raise ValueError("The number of states does not match the number of configured columns")
+			self._states = [ColumnState.from_dict(state) for state in initial_state["states"]]
+			self._batch_count = initial_state["batch_count"]
+			self._last_batch_id = initial_state["last_batch_id"]
+		self._batch_result = []
+		self._lock = threading.RLock()
+
+	def attach(self, data: spark_df) -> DataStreamWriter:
+		"""
+		Args:
+			data (:obj:`pyspark.sql.DataFrame`): The streaming dataframe
+
+		Returns:
+			:obj:`pyspark.sql.streaming.DataStreamWriter`: The writer analyzing each micro-batch, the caller can set the
+			trigger, checkpoint etc. before calling ``start``
+		"""
+		return data.writeStream.foreachBatch(self.process_batch)
+
+	def process_batch(self, data: spark_df, batch_id: int) -> None:
+		"""
+		Analyzes a micro-batch and merges its state into the running totals, to be used with ``foreachBatch``
+
+		Args:
+			data (:obj:`pyspark.sql.DataFrame`): The micro-batch
+			batch_id (:obj:`int`): The id of the micro-batch
+		"""
+		with self._lock:
+			if self._last_batch_id is not None and batch_id <= self._last_batch_id:
+				# replayed after a failure, already merged
+				return
+		analyzer = DataQualityAnalyzer(data, self._config, storage_level=self._storage_level)
+		batch_data = analyzer.prepare_data()
+		try:
+			batch_analyzer = DataQualityAnalyzer(batch_data, self._config, fused=True, persist=False, states=True)
+			batch_result = batch_analyzer.run_profilers()
+			batch_states = batch_analyzer.get_states()
+		finally:
+			analyzer.release_data(batch_data)
+
+		with self._lock:
+			for state, batch_state in zip(self._states, batch_states):
+				state.merge(batch_state)
+			self._batch_count += 1
+			self._last_batch_id = batch_id
+			self._batch_result = batch_result
+			cumulative_result = self.get_cumulative_result()
+		if self._on_batch is not None:
+			self._on_batch(batch_id, batch_result, cumulative_result)
+
+	def get_state(self) -> Dict[str, Any]:
+		"""
+		Returns:
+			:obj:`Dict[str, Any]`: The :obj:`JSON` serializable running totals, to be passed as ``initial_state`` when the
+			query restarts
+			Sample Output::
+				{
+					"last_batch_id": 11,
+					"batch_count": 12,
+					"states": [{"total_count": 1200, "null_count": 50, ...}]
+				}
+		"""
+		with self._lock:
+			return {
+				"last_batch_id": self._last_batch_id,
+				"batch_count": self._batch_count,
+				"states": [state.to_dict() for state in self._states]
+			}
+
+	def get_batch_result(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The result of the last micro-batch, same as the output of
+			:meth:`DataQualityAnalyzer.analyze`
+		"""
+		return self._batch_result
+
+	def get_cumulative_result(self) -> List[Dict[str, Any]]:
+		"""
+		Returns:
+			:obj:`List[Dict[str, Any]]`: The running totals of all the micro-batches processed so far
+			Sample Output::
+				[
+					{
+						"col_name": "col_name",
+						"batch_count": 12,
+						"total_count": 1200,
+						"null_count": 50,
+						"min": 2.0,
+						"max": 30.0,
+						"mean": 18.0,
+						"stddev": 5.0,
+						"constraints": [
+							{
+								"name": "gt_eq",
+								"values": 5,
+								"constraint_status": "failed",
+								"invalid_count": 21
+							}
+						]
+					}
+				]
+		"""
+		with self._lock:
+			return [
+				self.get_column_result(column_config, state)
+				for column_config, state in zip(self._config, self._states)
+			]
+
+	def get_column_result(self, column_config: Dict[str, Any], state: ColumnState) -> Dict[str, Any]:
+		"""
+		Args:
+			column_config (:obj:`Dict[str, Any]`): The config of the column
+			state (:obj:`ColumnState`): The running state of the column
+
+		Returns:
+			:obj:`Dict[str, Any]`: The cumulative result of the column
+		"""
+		result = state.get_result(column_config)
+		return {
+			"col_name": result.pop("col_name"),
+			"batch_count": self._batch_count,
+			**result
+		}
@@ -0,0 +1,138 @@
+import json
+from typing import Dict, List, Any, Union, Iterable, Optional, IO
+from dq_whistler.result import NpEncoder, ColumnResult, get_arrow_schema
+
+try:
+	import pyarrow as pa
+	import pyarrow.parquet as pq
+except ImportError:
+	pa = None
+	pq = None
+
+
+class ResultWriter:
+	"""
+	Writes the stats of the columns incrementally, as yielded by
+	:meth:`dq_whistler.analyzer.DataQualityAnalyzer.analyze_iter`, so that the memory stays flat for configs with many
+	columns and the partial results can be read while the rest of the columns are profiled. ``jsonl`` writes a line per
+	column and flushes it, ``parquet`` writes a row per constraint (see :func:`dq_whistler.result.get_arrow_schema`)
+	in row groups of ``row_group_size`` columns
+
+	Args:
+		sink (:obj:`str` | file-like): The path of the output file or a file-like object, binary for ``parquet``
+		format (:obj:`str`): Either ``jsonl`` or ``parquet``
+		row_group_size (:obj:`int`): The number of columns buffered per Parquet row group
+	"""
+	_sink: Union[str, IO]
+	_format: str
+	_row_group_size: int
+	_file: Optional[IO]
+	_parquet_writer: Any
+	_rows: List[Dict[str, Any]]
+	_buffered_columns: int
+	_written_columns: int
+	_closed: bool
+
+	def __init__(self, sink: Union[str, IO], format: str = "jsonl", row_group_size: int = 100):
+		"""
+		Creates an instance of :obj:`ResultWriter`
+		"""
+		if format not in ("jsonl", "parquet"):
+			raise NotImplementedError
+		if format == "parquet" and pq is None:
+			raise ImportError("pyarrow is required to write the results to Parquet")
+		self._sink = sink
+		self._format = format
+		self._row_group_size = row_group_size
+		self._file = None
+		self._parquet_writer = None
+		self._rows = []
+		self._buffered_columns = 0
+		self._written_columns = 0
+		self._closed = False
+
+	def __enter__(self) -> "ResultWriter":
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	def get_written_columns(self) -> int:
+		"""
+		Returns:
+			:obj:`int`: The number of columns written so far
+		"""
+		return self._written_columns
+
+	def write(self, output: Union[Dict[str, Any], ColumnResult]) -> None:
+		"""
+		Args:
+			output (:obj:`Dict[str, Any]` | :obj:`dq_whistler.result.ColumnResult`): The stats of a column
+		"""
+		if self._closed:
+			raise ValueError("The writer is closed")
+		if self._format == "jsonl":
+			if self._file is None:
+				self._file = open(self._sink, "w") if isinstance(self._sink, str) else self._sink
+			line = output.to_json() if isinstance(output, ColumnResult) else json.dumps(output, cls=NpEncoder)
+			self._file.write(line + "\n")
+			self._file.flush()
+		else:
+			column_result = output if isinstance(output, ColumnResult) else ColumnResult(output)
+			self._rows.extend(column_result.get_arrow_rows())
+			self._buffered_columns += 1
+			if self._buffered_columns >= self._row_group_size:
+				self.flush_row_group()
+		self._written_columns += 1
+
+	def write_all(self, outputs: Iterable[Union[Dict[str, Any], ColumnResult]]) -> int:
+		"""
+		Args:
+			outputs (:obj:`Iterable[Dict[str, Any]]` | :obj:`Iterable[dq_whistler.result.ColumnResult]`): The stats of
+				the columns, for ex: ``analyzer.analyze_iter()``
+
+		Returns:
+			:obj:`int`: The number of columns written
+		"""
+		count = 0
+		for output in outputs:
+			self.write(output)
+			count += 1
+		return count
+
+	def flush_row_group(self) -> None:
+		"""
+		Writes the buffered rows as a Parquet row group
+		"""
+		if not self._rows:
+			return
+		schema = get_arrow_schema()
+		if self._parquet_writer is None:
+			self._parquet_writer = pq.ParquetWriter(self._sink, schema)
+		self._parquet_writer.write_table(pa.Table.from_pylist(self._rows, schema=schema))
+		self._rows = []
+		self._buffered_columns = 0
+
+	def close(self) -> None:
+		"""
+		Writes the remaining rows and closes the output, a file-like sink is flushed but not closed
+		"""
+		if self._closed:
+			return
+		self._closed = True
+		if self._format == "parquet":
+			self.flush_row_group()
+			if self._parquet_writer is None:
+				# no columns were written, the file still gets the schema
+				self._parquet_writer = pq.ParquetWriter(self._sink, get_arrow_schema())
+			self._parquet_writer.close()
+			self._parquet_writer = None
+		elif self._file is not None:
+			if isinstance(self._sink, str):
+				self._file.close()
+			else:
+				self._file.flush()
+			self._file = None
+		elif isinstance(self._sink, str):
+			# no columns were written, the file is still created
+			open(self._sink, "w").close()
@@ -27,5 +27,8 @@ setuptools.setup(
     py_modules=["dq_whistler"],             # Name of the python package
     install_requires=[
         "pyspark"
-    ]
+    ],
+    extras_require={
+        "automaton": ["pyahocorasick"]          # Aho-Corasick matching of many string patterns on pandas
+    }
 )
@@ -0,0 +1,53 @@
+import unittest
+from pyspark.sql.session import SparkSession
+from pyspark.sql.dataframe import DataFrame
+from dq_whistler.constraints import number_type, string_type
+from dq_whistler.constraints.engine import ConstraintEngine
+from tests.dq_whistler.resources.configuration import number_constraints, string_constraints, analyzer_data
+
+
+class ConstraintEngineTests(unittest.TestCase):
+	"""
+	Test suite for evaluating constraints of multiple columns together
+	"""
+	spark_session: SparkSession
+	_data: DataFrame
+
+	def setUp(self):
+		"""
+		"""
+		self._data = self.spark_session.createDataFrame(analyzer_data).toDF("number_col", "string_col")
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def test_engine_matches_execute_check(self):
+		constraints = [
+			number_type.GreaterThanEqualTo(constraint=number_constraints["gt_eq"], column_name="number_col"),
+			number_type.Between(constraint=number_constraints["between"], column_name="number_col"),
+			string_type.Contains(constraint=string_constraints["contains"], column_name="string_col"),
+			string_type.Regex(constraint=string_constraints["regex"], column_name="string_col")
+		]
+		expected = [
+			constraint.execute_check(self._data.select(constraint.get_column_name()))
+			for constraint in constraints
+		]
+		self.assertEqual(ConstraintEngine(self._data, constraints).execute(), expected)
+
+	def test_engine_sample_size(self):
+		constraints = [
+			number_type.GreaterThan(constraint={"name": "gt", "values": 100}, column_name="number_col")
+		]
+		output = ConstraintEngine(self._data, constraints, sample_size=3).execute()
+		self.assertEqual(output[0]["invalid_count"], 9)
+		self.assertEqual(output[0]["invalid_values"], [1, 2, 3])
+
+	def test_engine_without_failures(self):
+		constraints = [
+			number_type.LessThan(constraint={"name": "lt", "values": 100}, column_name="number_col")
+		]
+		output = ConstraintEngine(self._data, constraints).execute()
+		self.assertEqual(output[0]["constraint_status"], "success")
+		self.assertEqual(output[0]["invalid_values"], [])
@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+import pandas as pd
+from pyspark.sql.session import SparkSession
+from dq_whistler.constraints.matcher import StringMatcher, compile_pattern, ahocorasick
+from dq_whistler.profiler.string_profiler import StringProfiler
+
+
+class StringMatcherTests(unittest.TestCase):
+	"""
+	Test suite for matching multiple string patterns together
+	"""
+	spark_session: SparkSession
+	_patterns = [
+		("contains", "bc"),
+		("contains", "a.c"),
+		("starts_with", "ab"),
+		("ends_with", "bc"),
+		("ends_with", "c"),
+		("regex", "^[a-z]+$"),
+		("contains", "")
+	]
+
+	def setUp(self):
+		"""
+		"""
+		self._values = pd.Series(["abc", "abcd", None, "xabc", "a.c", "", "bcbc"], dtype=pd.StringDtype("python"))
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def get_expected(self) -> np.ndarray:
+		values = self._values.tolist()
+		expected = []
+		for value in values:
+			if value is None or value is pd.NA:
+				expected.append([False] * len(self._patterns))
+				continue
+			expected.append([
+				pattern in value if kind == "contains"
+				else value.startswith(pattern) if kind == "starts_with"
+				else value.endswith(pattern) if kind == "ends_with"
+				else compile_pattern(pattern).match(value) is not None
+				for kind, pattern in self._patterns
+			])
+		return np.array(expected)
+
+	@unittest.skipUnless(ahocorasick, "pyahocorasick is not installed")
+	def test_automaton(self):
+		matcher = StringMatcher(self._patterns)
+		self.assertTrue(matcher.use_automaton(self._values))
+		np.testing.assert_array_equal(matcher.match(self._values), self.get_expected())
+
+	def test_vectorized(self):
+		matcher = StringMatcher(self._patterns)
+		matcher._automaton_min_patterns = len(self._patterns) + 1
+		self.assertFalse(matcher.use_automaton(self._values))
+		np.testing.assert_array_equal(matcher.match(self._values), self.get_expected())
+
+	def test_profiler_matches_execute_check(self):
+		config = {
+			"name": "string_col",
+			"datatype": "string",
+			"constraints": [
+				{"name": "contains", "values": "bc"},
+				{"name": "not_contains", "values": "x"},
+				{"name": "starts_with", "values": "ab"},
+				{"name": "not_starts_with", "values": "bc"},
+				{"name": "ends_with", "values": "c"},
+				{"name": "not_ends_with", "values": "d"},
+				{"name": "regex", "values": "^[a-z]+$"},
+				{"name": "is_in", "values": ["abc"]}
+			]
+		}
+		profiler = StringProfiler(self._values, config)
+		output = profiler.check_constraints()
+		expected = [
+			constraint.execute_check(profiler._column_data)
+			for constraint in profiler.build_constraints()
+		]
+		self.assertEqual(output, expected)
+		self.assertEqual(output[0]["invalid_values"], ["a.c", ""])
+
+		# the repeated values are matched once and mapped back to their rows
+		profiler = StringProfiler(pd.concat([self._values, self._values], ignore_index=True), config)
+		output = profiler.check_constraints()
+		expected = [
+			constraint.execute_check(profiler._column_data)
+			for constraint in profiler.build_constraints()
+		]
+		self.assertEqual(output, expected)
+		self.assertEqual(output[0]["invalid_count"], 4)
@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+import pyspark.sql.functions as f
+from pyspark.sql.session import SparkSession
+from pyspark.sql.dataframe import DataFrame
+from dq_whistler.constraints import number_type, string_type
+from dq_whistler.constraints.engine import ConstraintEngine
+
+
+class ValueSetTests(unittest.TestCase):
+	"""
+	Test suite for the is_in and not_in constraints with large sets of values
+	"""
+	spark_session: SparkSession
+	_column_name: str = "col"
+
+	def setUp(self):
+		"""
+		"""
+		self._codes = [f"code_{index}" for index in range(0, 200, 2)]
+		self._data = ["code_0", "code_1", "code_2", None, "code_3", "code_198", "code_199"]
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def get_outputs(self, constraint_class, constraint, data_frame):
+		output = constraint_class(constraint=constraint, column_name=self._column_name).execute_check(data_frame)
+		return output["invalid_count"], sorted(output["invalid_values"])
+
+	def test_large_set_spark(self):
+		data_frame = self.spark_session.createDataFrame([(value,) for value in self._data]).toDF(self._column_name)
+		for constraint_class, name in ((string_type.IsIn, "is_in"), (string_type.NotIn, "not_in")):
+			small = {"name": name, "values": self._codes}
+			large = {"name": name, "values": self._codes, "large_set_threshold": 10}
+			self.assertFalse(constraint_class(small, self._column_name).is_large())
+			self.assertTrue(constraint_class(large, self._column_name).is_large())
+			self.assertEqual(
+				self.get_outputs(constraint_class, small, data_frame),
+				self.get_outputs(constraint_class, large, data_frame)
+			)
+
+		output = string_type.IsIn(
+			{"name": "is_in", "values": self._codes, "large_set_threshold": 10}, self._column_name
+		).execute_check(data_frame)
+		self.assertEqual(output["invalid_count"], 3)
+		self.assertNotIn("values", output)
+		self.assertEqual(output["values_count"], len(self._codes))
+
+	def test_large_set_expr(self):
+		data_frame = self.spark_session.createDataFrame([(value,) for value in self._data]).toDF(self._column_name)
+		constraints = [
+			string_type.IsIn({"name": "is_in", "values": self._codes, "large_set_threshold": 10}, self._column_name),
+			string_type.NotIn({"name": "not_in", "values": self._codes, "large_set_threshold": 10}, self._column_name)
+		]
+		engine = ConstraintEngine(data_frame, constraints)
+		outputs = engine.execute()
+		self.assertEqual([output["invalid_count"] for output in outputs], [3, 3])
+		self.assertEqual(engine.get_data().count(), len(self._data))
+		prepared = constraints[0].prepare_failure_df(data_frame)
+		row = prepared.agg(f.count(f.when(constraints[0].get_failure_expr(), 1))).first()
+		self.assertEqual(row[0], 3)
+		# the values are looked up by a broadcast join, not by a Python function per row
+		plan = prepared.agg(f.count(f.when(constraints[0].get_failure_expr(), 1)))._jdf.queryExecution().toString()
+		self.assertIn("BroadcastHashJoin", plan)
+		self.assertNotIn("EvalPython", plan)
+
+	def test_values_df_spark(self):
+		data_frame = self.spark_session.createDataFrame([(float(value),) for value in [1, 2, 3, 5]]) \
+			.toDF(self._column_name)
+		values_df = self.spark_session.createDataFrame([(value,) for value in [1, 2, 4]]).toDF("code")
+		output = number_type.IsIn({"name": "is_in", "values": values_df}, self._column_name).execute_check(data_frame)
+		self.assertEqual(output["invalid_count"], 2)
+		self.assertEqual(sorted(output["invalid_values"]), [3.0, 5.0])
+		self.assertEqual(output["values_count"], 3)
+		output = number_type.NotIn({"name": "not_in", "values": values_df}, self._column_name).execute_check(data_frame)
+		self.assertEqual(output["invalid_count"], 2)
+		outputs = ConstraintEngine(data_frame, [
+			number_type.IsIn({"name": "is_in", "values": values_df}, self._column_name),
+			number_type.NotIn({"name": "not_in", "values": values_df}, self._column_name)
+		]).execute()
+		self.assertEqual([output["invalid_count"] for output in outputs], [2, 2])
+		self.assertEqual(sorted(outputs[0]["invalid_values"]), [3.0, 5.0])
+		# the constraints rebuilt by the profilers do not count the same values again
+		values_df = self.spark_session.createDataFrame([(value,) for value in [1, 2, 4]]).toDF("code")
+		with mock.patch.object(DataFrame, "count", autospec=True, side_effect=DataFrame.count) as count:
+			for _ in range(3):
+				constraint = number_type.IsIn({"name": "is_in", "values": values_df}, self._column_name)
+				self.assertEqual(constraint.get_values_count(), 3)
+		self.assertEqual(count.call_count, 1)
+
+	def test_values_file(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, "codes.txt")
+			with open(path, "w") as values_file:
+				values_file.write("\n".join(["1", "2", "4"]) + "\n")
+			constraint = {"name": "is_in", "values_file": path}
+			data_frame = self.spark_session.createDataFrame([(1,), (2,), (3,)]).toDF(self._column_name)
+			output = number_type.IsIn(constraint, self._column_name).execute_check(data_frame)
+			self.assertEqual(output["invalid_count"], 1)
+			self.assertEqual(output["invalid_values"], [3])
+			output = number_type.IsIn(constraint, self._column_name).execute_check(pd.Series([1, 2, 3, None]))
+			self.assertEqual(output["invalid_count"], 1)
+			# the file is read once until it is modified
+			with mock.patch("builtins.open", side_effect=AssertionError("values_file read again")):
+				self.assertEqual(number_type.IsIn(constraint, self._column_name).get_value_list(), [1.0, 2.0, 4.0])
+			with open(path, "w") as values_file:
+				values_file.write("1\n3\n")
+			os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+			output = number_type.IsIn(constraint, self._column_name).execute_check(pd.Series([1, 2, 3, None]))
+			self.assertEqual(output["invalid_count"], 1)
+			self.assertEqual(output["invalid_values"], [2])
+
+	def test_large_set_pandas(self):
+		data = pd.Series(self._data)
+		for constraint_class, name in ((string_type.IsIn, "is_in"), (string_type.NotIn, "not_in")):
+			small = {"name": name, "values": self._codes}
+			large = {"name": name, "values": pd.DataFrame({"code": self._codes}), "large_set_threshold": 10}
+			self.assertEqual(
+				self.get_outputs(constraint_class, small, data),
+				self.get_outputs(constraint_class, large, data)
+			)
@@ -0,0 +1,88 @@
+import json
+import math
+import unittest
+import pandas as pd
+from pyspark.sql.session import SparkSession
+from dq_whistler.profiler.column_state import ColumnState
+from dq_whistler.sketches.hyperloglog import HyperLogLog
+from dq_whistler.sketches.space_saving import SpaceSaving
+
+
+class ColumnStateTests(unittest.TestCase):
+	"""
+	Test suite for the mergeable column state
+	"""
+	spark_session: SparkSession
+
+	def setUp(self):
+		"""
+		"""
+		pass
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	@staticmethod
+	def get_state(values) -> ColumnState:
+		series = pd.Series(values, dtype="float64")
+		return ColumnState(
+			total_count=len(values),
+			null_count=int(series.isna().sum()),
+			value_count=int(series.count()),
+			mean=float(series.mean()),
+			m2=float(((series.dropna() - series.mean()) ** 2).sum()),
+			min_value=float(series.min()),
+			max_value=float(series.max()),
+			invalid_counts={"gt_eq": int((series < 5).sum())},
+			unique_sketch=HyperLogLog(0.05).update(series),
+			topn_sketch=SpaceSaving(10).update(series.dropna())
+		)
+
+	def test_merge(self):
+		values = [1.0, 2.0, None, 4.0, 10.0, 12.0, 17.0, 20.0, 23.0, 1.0]
+		state = self.get_state(values[:4]).merge(self.get_state(values[4:]))
+		expected = pd.Series(values, dtype="float64")
+		metrics = state.get_metrics(numeric=True)
+		self.assertEqual(metrics["total_count"], 10)
+		self.assertEqual(metrics["null_count"], 1)
+		self.assertEqual(metrics["min"], 1.0)
+		self.assertEqual(metrics["max"], 23.0)
+		self.assertTrue(math.isclose(metrics["mean"], expected.mean()))
+		self.assertTrue(math.isclose(metrics["stddev"], expected.std()))
+		self.assertEqual(metrics["unique_count"], 8)
+		self.assertEqual(metrics["topn_values"][1.0], 2)
+		self.assertEqual(state.invalid_counts["gt_eq"], 4)
+
+	def test_merge_constraint_status(self):
+		failed = ColumnState(total_count=2, constraint_statuses={"gt_eq": "failed"})
+		merged = self.get_state([10.0, 12.0]).merge(failed)
+		self.assertEqual(merged.get_constraint_status("gt_eq"), "failed")
+		self.assertNotIn("gt_eq", merged.invalid_counts)
+		passed = ColumnState(total_count=2, constraint_statuses={"gt_eq": "success"})
+		self.assertEqual(self.get_state([10.0]).merge(passed).get_constraint_status("gt_eq"), "success")
+		self.assertEqual(self.get_state([1.0]).merge(passed).get_constraint_status("gt_eq"), "failed")
+		skipped = ColumnState(total_count=2, constraint_statuses={"gt_eq": "skipped"})
+		self.assertEqual(ColumnState().merge(passed).merge(skipped).get_constraint_status("gt_eq"), "unknown")
+		# a constraint without an outcome in the state is never reported as passed
+		result = ColumnState().get_result({"name": "col", "constraints": [{"name": "gt_eq", "values": 5}]})
+		self.assertEqual(result["constraints"][0]["constraint_status"], "unknown")
+		self.assertIsNone(result["constraints"][0]["invalid_count"])
+
+	def test_serialization(self):
+		state = self.get_state([1.0, 2.0, None, 2.0])
+		restored = ColumnState.from_dict(json.loads(json.dumps(state.to_dict())))
+		self.assertEqual(restored.to_dict(), state.to_dict())
+		self.assertEqual(restored.get_metrics(numeric=True), state.get_metrics(numeric=True))
+		restored.merge(ColumnState.from_dict(state.to_dict()))
+		self.assertEqual(restored.get_metrics(numeric=True)["unique_count"], 2)
+		self.assertEqual(restored.get_metrics(numeric=True)["topn_values"][2.0], 4)
+
+	def test_unique_count_without_sketch(self):
+		state = ColumnState(total_count=4, null_count=1, unique_count=3)
+		self.assertEqual(ColumnState().merge(state).get_metrics(numeric=False)["unique_count"], 3)
+		# the distinct values of two states can not be combined without their sketches
+		merged = self.get_state([1.0, 2.0]).merge(state)
+		self.assertIsNone(merged.get_unique_count())
+		self.assertNotIn("unique_count", merged.get_metrics(numeric=False))
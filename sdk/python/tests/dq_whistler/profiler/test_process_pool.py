@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import pandas as pd
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.profiler.process_pool import SharedColumn, profile_shared_column
+from tests.dq_whistler.resources.configuration import analyzer_config
+
+
+class ProcessPoolTests(unittest.TestCase):
+	"""
+	Test suite for profiling columns placed in shared memory
+	"""
+
+	def assertSharedProfile(self, column_data: pd.Series, column_config: dict, use_arrow: bool) -> None:
+		shared_column = SharedColumn(column_data, use_arrow=use_arrow)
+		try:
+			output = profile_shared_column(shared_column, column_config)
+		finally:
+			shared_column.unlink()
+		self.assertEqual(output["col_name"], column_data.name)
+		self.assertEqual(output["total_count"], column_data.count())
+		self.assertEqual(output["null_count"], column_data.isnull().sum())
+
+	def test_numeric_column(self):
+		column_data = pd.Series(np.arange(20, dtype=np.int64), name="number_col")
+		for use_arrow in (True, False):
+			self.assertSharedProfile(column_data, analyzer_config[0], use_arrow=use_arrow)
+
+	def test_string_column(self):
+		column_data = pd.Series(["abc", "xyz", None, "abc1"], name="string_col")
+		for use_arrow in (True, False):
+			self.assertSharedProfile(column_data, analyzer_config[1], use_arrow=use_arrow)
+
+	def test_mixed_column(self):
+		# a number column holding a value which can not be cast, Arrow can not convert it
+		column_data = pd.Series([1, 2, "bad", None, 5], dtype=object, name="number_col")
+		shared_column = SharedColumn(column_data, use_arrow=True)
+		try:
+			self.assertEqual(shared_column._layout, "pickle")
+			output = profile_shared_column(shared_column, analyzer_config[0])
+		finally:
+			shared_column.unlink()
+		# same stats as the thread executor
+		expected = DataQualityAnalyzer(column_data.to_frame(), [analyzer_config[0]]).run_profilers()[0]
+		self.assertEqual(output, expected)
+		self.assertEqual(output["coercion_failure_count"], 1)
@@ -87,3 +87,34 @@ number_constraints = {
 		"values": [5, 6, 7]
 	}
 }
+
+analyzer_config = [
+	{
+		"name": "number_col",
+		"datatype": "number",
+		"constraints": [
+			number_constraints["gt_eq"],
+			number_constraints["is_in"]
+		]
+	},
+	{
+		"name": "string_col",
+		"datatype": "string",
+		"constraints": [
+			string_constraints["regex"],
+			string_constraints["contains"]
+		]
+	}
+]
+
+analyzer_data = [
+	(1, "abc"),
+	(2, "abc1"),
+	(3, None),
+	(4, "abc4"),
+	(10, "xyz"),
+	(12, "null"),
+	(17, "abc"),
+	(20, "abc3"),
+	(23, None)
+]
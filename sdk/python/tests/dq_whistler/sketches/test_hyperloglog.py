@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+import pandas as pd
+from dq_whistler.sketches.hyperloglog import HyperLogLog
+
+
+class HyperLogLogTests(unittest.TestCase):
+	"""
+	Test suite for the HyperLogLog sketch
+	"""
+
+	def test_small_cardinality(self):
+		sketch = HyperLogLog(relative_error=0.05).update(pd.Series(["abc", "xyz", None, "abc"]))
+		self.assertEqual(sketch.count(), 2)
+
+	def test_relative_error(self):
+		sketch = HyperLogLog(relative_error=0.02).update(pd.Series(np.arange(200000)))
+		self.assertAlmostEqual(sketch.count(), 200000, delta=200000 * 0.02 * 3)
+
+	def test_merge(self):
+		left = HyperLogLog(relative_error=0.02).update(pd.Series(np.arange(0, 60000)))
+		right = HyperLogLog(relative_error=0.02).update(pd.Series(np.arange(30000, 90000)))
+		self.assertAlmostEqual(left.merge(right).count(), 90000, delta=90000 * 0.02 * 3)
+
+	def test_merge_different_precision(self):
+		with self.assertRaises(ValueError):
+			HyperLogLog(relative_error=0.02).merge(HyperLogLog(relative_error=0.1))
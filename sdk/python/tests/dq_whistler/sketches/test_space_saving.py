@@ -0,0 +1,32 @@
+import unittest
+from collections import Counter
+import numpy as np
+from dq_whistler.sketches.space_saving import SpaceSaving
+
+
+class SpaceSavingTests(unittest.TestCase):
+	"""
+	Test suite for the Space-Saving heavy hitters sketch
+	"""
+
+	def test_exact_below_capacity(self):
+		sketch = SpaceSaving(capacity=10).update(["abc", "xyz", "abc", "abc", "xyz", "pqr"])
+		self.assertEqual(sketch.top(2), [("abc", 3, 0), ("xyz", 2, 0)])
+		self.assertEqual(sketch.get_total_count(), 6)
+
+	def test_error_bounds(self):
+		values = [int(value) for value in np.random.default_rng(7).zipf(1.5, 100000)]
+		exact = Counter(values)
+		sketches = [
+			SpaceSaving(capacity=50).update(values[start:start + 25000], batch_size=1000)
+			for start in range(0, len(values), 25000)
+		]
+		sketch = sketches[0]
+		for other in sketches[1:]:
+			sketch.merge(other)
+		self.assertEqual(sketch.get_total_count(), len(values))
+		self.assertEqual([value for value, _, _ in sketch.top(5)], [value for value, _ in exact.most_common(5)])
+		for value, count, error in sketch.top(10):
+			self.assertLessEqual(count - error, exact[value])
+			self.assertGreaterEqual(count, exact[value])
+			self.assertLessEqual(error, len(values) / 50)
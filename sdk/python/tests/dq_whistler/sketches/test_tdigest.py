@@ -0,0 +1,62 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from dq_whistler.sketches.tdigest import TDigest
+
+
+class TDigestTests(unittest.TestCase):
+	"""
+	Test suite for the t-digest sketch
+	"""
+
+	def test_small_values(self):
+		sketch = TDigest().update(pd.Series([3.0, 1.0, None, 2.0, 5.0, 4.0]))
+		self.assertEqual(sketch.count(), 5)
+		self.assertEqual(sketch.quantile([0, 0.5, 1]), [1.0, 3.0, 5.0])
+		self.assertEqual(sketch.cdf(3.0), 0.5)
+		self.assertEqual(sketch.cdf([0.0, 6.0]), [0.0, 1.0])
+
+	def test_accuracy(self):
+		values = np.random.default_rng(7).normal(size=100000)
+		sketch = TDigest(compression=100).update(values)
+		self.assertLessEqual(len(sketch.to_dict()["means"]), 110)
+		for probability in (0.01, 0.5, 0.95, 0.99):
+			self.assertAlmostEqual(sketch.quantile(probability), np.quantile(values, probability), delta=0.02)
+		self.assertEqual(sketch.quantile(0), values.min())
+		self.assertEqual(sketch.quantile(1), values.max())
+
+	def test_merge(self):
+		values = np.random.default_rng(7).exponential(size=60000)
+		merged = TDigest()
+		for batch in np.array_split(values, 6):
+			merged.merge(TDigest().update(batch))
+		self.assertEqual(merged.count(), 60000)
+		for probability in (0.5, 0.95, 0.99):
+			self.assertAlmostEqual(merged.quantile(probability), np.quantile(values, probability), delta=0.05)
+
+	def test_empty(self):
+		sketch = TDigest().update(pd.Series([None, np.nan], dtype="float64"))
+		self.assertEqual(sketch.count(), 0)
+		self.assertIsNone(sketch.quantile(0.5))
+		self.assertEqual(sketch.merge(TDigest()).quantile([0.5]), [None])
+
+	def test_serialization(self):
+		sketch = TDigest().update(np.arange(1000, dtype=float))
+		restored = TDigest.from_dict(json.loads(json.dumps(sketch.to_dict())))
+		self.assertEqual(restored.quantile([0.1, 0.5, 0.9]), sketch.quantile([0.1, 0.5, 0.9]))
+		self.assertEqual(restored.get_min_value(), 0.0)
+		self.assertEqual(restored.get_max_value(), 999.0)
+
+	def test_from_quantiles(self):
+		values = np.random.default_rng(7).normal(size=10000)
+		sketch = TDigest.from_quantiles(np.quantile(values, np.linspace(0, 1, 101)).tolist(), len(values))
+		self.assertEqual(sketch.count(), 10000)
+		self.assertEqual([sketch.get_min_value(), sketch.get_max_value()], [values.min(), values.max()])
+		self.assertAlmostEqual(sketch.quantile(0.5), np.median(values), delta=0.02)
+		self.assertAlmostEqual(sketch.cdf(1.0), 0.841, delta=0.01)
+		self.assertEqual(TDigest.from_quantiles(None, 0).count(), 0)
+
+	def test_invalid_probability(self):
+		with self.assertRaises(ValueError):
+			TDigest().update([1.0]).quantile(1.5)
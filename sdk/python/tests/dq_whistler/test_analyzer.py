@@ -0,0 +1,490 @@
+import json
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+from unittest import mock
+from urllib.request import urlopen
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import unittest
+from pyspark.sql.session import SparkSession
+from pyspark.sql.dataframe import DataFrame
+from dq_whistler import result as result_module
+from dq_whistler.analyzer import DataQualityAnalyzer
+from tests.dq_whistler.resources.configuration import analyzer_config, analyzer_data
+
+
+class AnalyzerTests(unittest.TestCase):
+	"""
+	Test suite for the data quality analyzer
+	"""
+	spark_session: SparkSession
+	_data: DataFrame
+
+	def setUp(self):
+		"""
+		"""
+		self._data = self.spark_session.createDataFrame(analyzer_data).toDF("number_col", "string_col")
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def get_column_job_windows(self, since: float) -> dict:
+		"""
+		Returns the submission and completion times of the finished jobs submitted after ``since`` for each column,
+		from the REST API of the Spark UI
+		"""
+		spark_context = self.spark_session.sparkContext
+		url = f"{spark_context.uiWebUrl}/api/v1/applications/{spark_context.applicationId}/jobs"
+		parse = lambda value: datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fGMT").replace(tzinfo=timezone.utc).timestamp()
+		for _ in range(50):
+			with urlopen(url) as response:
+				jobs = [
+					job for job in json.loads(response.read())
+					if (job.get("description") or "").startswith("dq_whistler analyze ")
+					and parse(job["submissionTime"]) >= since
+				]
+			# the UI records the end of the jobs asynchronously
+			if all("completionTime" in job for job in jobs):
+				break
+			time.sleep(0.2)
+		windows = {}
+		for job in jobs:
+			windows.setdefault(job["description"][len("dq_whistler analyze "):], []).append(
+				(parse(job["submissionTime"]), parse(job["completionTime"]))
+			)
+		return windows
+
+	def test_fused_metrics(self):
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		output = json.loads(DataQualityAnalyzer(self._data, analyzer_config, fused=True).analyze())
+		self.assertEqual(output, expected)
+		self.assertEqual(output[0]["total_count"], 9)
+		self.assertEqual(output[0]["min"], 1.0)
+		self.assertEqual(output[0]["max"], 23.0)
+		self.assertEqual(output[1]["null_count"], 2)
+		self.assertEqual(output[1]["unique_count"], 6)
+
+	def test_persist(self):
+		analyzer = DataQualityAnalyzer(self._data, analyzer_config, storage_level="MEMORY_ONLY")
+		output = json.loads(analyzer.analyze())
+		self.assertEqual(output, json.loads(DataQualityAnalyzer(self._data, analyzer_config, persist=False).analyze()))
+		stats = analyzer.get_persist_stats()
+		self.assertGreater(stats["spark_jobs"], 1)
+		self.assertEqual(stats["jobs_on_persisted_data"], stats["spark_jobs"] - 1)
+		self.assertEqual(self.spark_session.sparkContext._jsc.getPersistentRDDs().size(), 0)
+
+	def test_job_properties(self):
+		spark_context = self.spark_session.sparkContext
+		spark_context.setJobGroup("parent_group", "parent description", interruptOnCancel=True)
+		try:
+			DataQualityAnalyzer(self._data, analyzer_config).analyze()
+			# the job group of the caller is in effect while a column is consumed
+			for _ in DataQualityAnalyzer(self._data, analyzer_config).analyze_iter():
+				self.assertEqual(spark_context.getLocalProperty("spark.jobGroup.id"), "parent_group")
+			self.assertEqual(spark_context.getLocalProperty("spark.jobGroup.id"), "parent_group")
+			self.assertEqual(spark_context.getLocalProperty("spark.job.description"), "parent description")
+			self.assertEqual(spark_context.getLocalProperty("spark.job.interruptOnCancel"), "true")
+		finally:
+			for key in ("spark.jobGroup.id", "spark.job.description", "spark.job.interruptOnCancel"):
+				spark_context.setLocalProperty(key, None)
+
+	def test_persist_disabled(self):
+		analyzer = DataQualityAnalyzer(self._data, analyzer_config, persist=False)
+		analyzer.analyze()
+		self.assertEqual(analyzer.get_persist_stats()["jobs_on_persisted_data"], 0)
+		self.assertIsNone(analyzer.get_persist_stats()["storage_level"])
+
+	def test_column_projection(self):
+		wide_data = self._data.withColumn("other_col", self._data["number_col"] * 2)
+		path = tempfile.mkdtemp()
+		wide_data.write.mode("overwrite").parquet(path)
+		analyzer = DataQualityAnalyzer(self.spark_session.read.parquet(path), analyzer_config, persist=False)
+		self.assertEqual(analyzer.get_projected_columns(), ["number_col", "string_col"])
+		data = analyzer.prepare_data()
+		self.assertEqual(data.columns, ["number_col", "string_col"])
+		self.assertNotIn("other_col", data._jdf.queryExecution().executedPlan().toString())
+		shutil.rmtree(path)
+
+	def test_approx_unique_count(self):
+		config = [{**analyzer_config[1], "unique_count": {"mode": "approx", "relative_error": 0.01}}]
+		for fused in (True, False):
+			output = json.loads(DataQualityAnalyzer(self._data, config, fused=fused).analyze())
+			self.assertEqual(output[0]["unique_count"], 6)
+			self.assertEqual(output[0]["unique_count_relative_error"], 0.01)
+
+	def test_topn_sketch(self):
+		config = [
+			{**column_config, "topn_values": {"mode": "sketch", "capacity": 100}}
+			for column_config in analyzer_config
+		]
+		output = json.loads(DataQualityAnalyzer(self._data, config).analyze())
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		self.assertEqual(output[1]["topn_values"]["abc"], 2)
+		self.assertEqual(output[1]["topn_values"], expected[1]["topn_values"])
+		self.assertEqual(output[0]["topn_values"], expected[0]["topn_values"])
+		self.assertEqual(output[1]["topn_values_max_error"], 0)
+
+	def test_pandas_coercion(self):
+		data = pd.DataFrame([("bad", "abc"), *analyzer_data[1:]], columns=["number_col", "string_col"])
+		output = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+		self.assertEqual(output[0]["coercion_failure_count"], 1)
+		self.assertEqual(output[0]["null_count"], 1)
+		self.assertEqual(output[0]["min"], 2.0)
+		self.assertEqual(output[0]["constraints"][0]["invalid_values"], [2.0, 3.0, 4.0])
+		self.assertEqual(output[0]["constraints"][1]["invalid_count"], 8)
+		self.assertEqual(output[1]["coercion_failure_count"], 0)
+		self.assertEqual(output[1]["constraints"][1]["invalid_values"], ["xyz", "null"])
+
+	def test_max_concurrency(self):
+		sequential = DataQualityAnalyzer(self._data, analyzer_config)
+		expected = json.loads(sequential.analyze())
+		concurrent = DataQualityAnalyzer(self._data, analyzer_config, max_concurrency=2)
+		# the REST API reports the times in milliseconds
+		since = int(time.time()) - 1
+		self.assertEqual(json.loads(concurrent.analyze()), expected)
+		if self.spark_session.sparkContext.uiWebUrl is None:
+			self.skipTest("The Spark UI is disabled")
+		windows = self.get_column_job_windows(since)
+		self.assertEqual(sorted(windows), ["number_col", "string_col"])
+		# a job of one column was submitted while a job of the other column was running
+		self.assertTrue(any(
+			number_start < string_end and string_start < number_end
+			for number_start, number_end in windows["number_col"]
+			for string_start, string_end in windows["string_col"]
+		))
+
+	def test_process_executor(self):
+		data = pd.DataFrame(analyzer_data, columns=["number_col", "string_col"])
+		expected = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+		output = DataQualityAnalyzer(data, analyzer_config, max_concurrency=2, executor="process").analyze()
+		self.assertEqual(json.loads(output), expected)
+
+	def test_incremental_states(self):
+		partitions = [analyzer_data[:4], analyzer_data[4:]]
+		stored_analyzer = DataQualityAnalyzer(
+			self.spark_session.createDataFrame(partitions[0], self._data.schema), analyzer_config
+		)
+		stored_states = json.loads(json.dumps([[state.to_dict() for state in stored_analyzer.compute_states()]]))
+		output, new_states = DataQualityAnalyzer(
+			self.spark_session.createDataFrame(partitions[1], self._data.schema), analyzer_config
+		).analyze_incremental(stored_states)
+		output = json.loads(output)
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		self.assertEqual(len(new_states), 2)
+		self.assertEqual(new_states[0]["total_count"], 5)
+		for column_output, column_expected in zip(output, expected):
+			self.assertEqual(column_output["total_count"], column_expected["total_count"])
+			self.assertEqual(column_output["null_count"], column_expected["null_count"])
+			self.assertEqual(
+				[constraint["invalid_count"] for constraint in column_output["constraints"]],
+				[constraint["invalid_count"] for constraint in column_expected["constraints"]]
+			)
+		for metric in ("min", "max", "mean", "stddev"):
+			self.assertAlmostEqual(output[0][metric], expected[0][metric])
+		self.assertEqual(output[0]["unique_count"], 9)
+		self.assertEqual(output[1]["unique_count"], 6)
+		# null is not a unique value for the exact count nor the sketch
+		self.assertEqual([column["unique_count"] for column in output], [column["unique_count"] for column in expected])
+		self.assertEqual(output[1]["topn_values"]["abc"], 2)
+
+	def test_incremental_states_pandas(self):
+		pandas_data = pd.DataFrame(analyzer_data[4:], columns=["number_col", "string_col"])
+		spark_states = DataQualityAnalyzer(
+			self.spark_session.createDataFrame(analyzer_data[:4], self._data.schema), analyzer_config
+		).compute_states()
+		analyzer = DataQualityAnalyzer(pandas_data, analyzer_config)
+		states = analyzer.merge_states([spark_states, analyzer.compute_states()])
+		output = analyzer.get_state_result(states)
+		self.assertEqual(output[0]["total_count"], 9)
+		self.assertEqual(output[0]["max"], 23.0)
+		self.assertEqual(output[0]["unique_count"], 9)
+		self.assertEqual(output[1]["unique_count"], 6)
+		self.assertEqual(output[0]["constraints"][0]["invalid_count"], 4)
+
+	def test_exists_mode_states(self):
+		config = [
+			{**analyzer_config[0], "constraints": [{**analyzer_config[0]["constraints"][0], "mode": "exists"}]},
+			analyzer_config[1]
+		]
+		analyzer = DataQualityAnalyzer(self._data, config, states=True)
+		output = json.loads(analyzer.analyze())
+		self.assertEqual(output[0]["constraints"][0]["constraint_status"], "failed")
+		stored_states = json.loads(json.dumps([state.to_dict() for state in analyzer.get_states()]))
+		passed_states = DataQualityAnalyzer(
+			self.spark_session.createDataFrame(analyzer_data[4:5], self._data.schema), config
+		).compute_states()
+		states = analyzer.merge_states([passed_states, stored_states])
+		constraint = analyzer.get_state_result(states)[0]["constraints"][0]
+		self.assertEqual(constraint["constraint_status"], "failed")
+		self.assertIsNone(constraint["invalid_count"])
+
+	def test_footer_stats(self):
+		path = tempfile.mkdtemp()
+		self._data.repartition(2).write.mode("overwrite").parquet(path)
+		data = self.spark_session.read.parquet(path)
+		scanned = DataQualityAnalyzer(data, analyzer_config)
+		expected = json.loads(scanned.analyze())
+		analyzer = DataQualityAnalyzer(data, analyzer_config, parquet_source=path)
+		self.assertEqual(
+			analyzer.get_footer_metrics()[0],
+			{"total_count": 9, "null_count": 0, "min": 1.0, "max": 23.0}
+		)
+		output = json.loads(analyzer.analyze())
+		# the row groups are read in the order of the files, unlike the partitions of Spark
+		for column_output, column_expected in zip(output, expected):
+			for constraint, constraint_expected in zip(column_output["constraints"], column_expected["constraints"]):
+				constraint.pop("skipped_row_groups", None)
+				constraint["invalid_values"].sort()
+				constraint_expected["invalid_values"].sort()
+		self.assertEqual(output, expected)
+		# the mean and stddev are still aggregated, the row groups left by the range constraints are read by Spark
+		self.assertLessEqual(analyzer.get_persist_stats()["spark_jobs"], scanned.get_persist_stats()["spark_jobs"])
+		shutil.rmtree(path)
+
+	def test_row_group_skipping(self):
+		path = tempfile.mkdtemp()
+		table = pa.table({
+			"number_col": [row[0] for row in analyzer_data],
+			"string_col": [row[1] for row in analyzer_data]
+		})
+		pq.write_table(table, f"{path}/data.parquet", row_group_size=3)
+		config = [{
+			**analyzer_config[0],
+			"constraints": [
+				{"name": "gt_eq", "values": 5},
+				{"name": "lt", "values": 30},
+				{"name": "not_between", "values": [5, 9]},
+				{"name": "is_in", "values": [5, 6, 7]}
+			]
+		}]
+		data = self.spark_session.read.parquet(path)
+		expected = json.loads(DataQualityAnalyzer(data, config).analyze())
+		output = json.loads(DataQualityAnalyzer(data, config, parquet_source=path).analyze())
+		constraints = output[0]["constraints"]
+		self.assertEqual([constraint.get("skipped_row_groups") for constraint in constraints], [1, 3, 2, None])
+		self.assertEqual(constraints[0]["invalid_values"], [1, 2, 3, 4])
+		for constraint, constraint_expected in zip(constraints, expected[0]["constraints"]):
+			constraint.pop("skipped_row_groups", None)
+			self.assertEqual(constraint, constraint_expected)
+		shutil.rmtree(path)
+
+	def test_row_group_fail_fast(self):
+		path = tempfile.mkdtemp()
+		self._data.repartition(2).write.mode("overwrite").parquet(path)
+		data = self.spark_session.read.parquet(path)
+		expected = json.loads(DataQualityAnalyzer(data, analyzer_config, fail_fast=True).analyze())
+		output = json.loads(DataQualityAnalyzer(data, analyzer_config, fail_fast=True, parquet_source=path).analyze())
+		constraints = output[0]["constraints"]
+		# the exists mode is not replaced by the full count on the row groups
+		self.assertNotIn("skipped_row_groups", constraints[0])
+		self.assertEqual(constraints[0]["constraint_status"], "failed")
+		self.assertIsNone(constraints[0]["invalid_count"])
+		# the failed blocking constraint skips the rest
+		self.assertEqual(constraints[1]["constraint_status"], "skipped")
+		for column_output, column_expected in zip(output, expected):
+			self.assertEqual(
+				[constraint["constraint_status"] for constraint in column_output["constraints"]],
+				[constraint["constraint_status"] for constraint in column_expected["constraints"]]
+			)
+		shutil.rmtree(path)
+
+	def test_exists_mode(self):
+		config = [
+			{**analyzer_config[0], "constraints": [{**analyzer_config[0]["constraints"][0], "mode": "exists"}]},
+			{**analyzer_config[1], "constraints": [{"name": "contains", "values": "a", "mode": "exists"}]}
+		]
+		for data in (self._data, self._data.toPandas()):
+			output = json.loads(DataQualityAnalyzer(data, config).analyze())
+			number_constraint, string_constraint = output[0]["constraints"][0], output[1]["constraints"][0]
+			self.assertEqual(number_constraint["constraint_status"], "failed")
+			self.assertIsNone(number_constraint["invalid_count"])
+			self.assertEqual(len(number_constraint["invalid_values"]), 1)
+			self.assertEqual(string_constraint["constraint_status"], "failed")
+			self.assertEqual(string_constraint["invalid_values"], ["xyz"])
+
+	def test_fail_fast(self):
+		for data in (self._data, self._data.toPandas()):
+			output = json.loads(DataQualityAnalyzer(data, analyzer_config, fail_fast=True).check())
+			self.assertEqual(
+				[[constraint["constraint_status"] for constraint in column["constraints"]] for column in output],
+				[["failed", "skipped"], ["skipped", "skipped"]]
+			)
+			self.assertNotIn("total_count", output[0])
+
+		config = [
+			{**analyzer_config[0], "constraints": [{"name": "gt_eq", "values": 0, "blocking": True}]},
+			{**analyzer_config[1], "constraints": [
+				{"name": "regex", "values": "^[A-Za-z]+$", "blocking": True},
+				{"name": "contains", "values": "abc"}
+			]}
+		]
+		output = json.loads(DataQualityAnalyzer(self._data, config).analyze())
+		self.assertEqual(output[0]["constraints"][0]["constraint_status"], "success")
+		self.assertEqual(output[1]["constraints"][0]["invalid_count"], 3)
+		self.assertEqual(output[1]["constraints"][1]["constraint_status"], "skipped")
+
+	def test_result_objects(self):
+		for data in (self._data, self._data.toPandas()):
+			expected = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+			result = DataQualityAnalyzer(data, analyzer_config).analyze(as_objects=True)
+			self.assertEqual(json.loads(result.to_json()), expected)
+			self.assertEqual(result.to_dict()[0]["constraints"], expected[0]["constraints"])
+			self.assertEqual(result["number_col"].total_count, 9)
+			self.assertEqual(result["number_col"].min, 1.0)
+			self.assertEqual(result[1].null_count, 2)
+			self.assertEqual(result[1].constraints[0].invalid_count, expected[1]["constraints"][0]["invalid_count"])
+			self.assertEqual(
+				[(name, constraint.name) for name, constraint in result.get_failed_constraints()],
+				[
+					(column["col_name"], constraint["name"])
+					for column in expected
+					for constraint in column["constraints"]
+					if constraint["constraint_status"] == "failed"
+				]
+			)
+
+			table = result.to_arrow()
+			self.assertEqual(table.num_rows, 4)
+			self.assertEqual(table.column("col_name").to_pylist(), ["number_col"] * 2 + ["string_col"] * 2)
+			self.assertEqual(
+				table.column("invalid_count").to_pylist(),
+				[constraint["invalid_count"] for column in expected for constraint in column["constraints"]]
+			)
+			self.assertEqual(result[0].constraints[0].to_arrow().num_rows, 1)
+
+		result = DataQualityAnalyzer(self._data, analyzer_config, fail_fast=True).check(as_objects=True)
+		self.assertTrue(result[0].constraints[0].is_failed())
+		with self.assertRaises(AttributeError):
+			result[0].total_count_typo
+
+		# the values are converted on their first access, gating does not convert the invalid values
+		column = result_module.ColumnResult({
+			"col_name": "number_col",
+			"total_count": np.int64(9),
+			"mean": np.float64(9.5),
+			"constraints": [{"name": "gt_eq", "constraint_status": "failed", "invalid_values": np.array([1.0, 2.0])}]
+		})
+		with mock.patch.object(result_module, "to_python", side_effect=result_module.to_python) as to_python:
+			self.assertEqual(column.get_failed_constraints()[0].name, "gt_eq")
+		self.assertEqual([call.args[0] for call in to_python.call_args_list], ["failed", "gt_eq"])
+		self.assertIs(type(column.total_count), int)
+		self.assertEqual(column.to_dict()["constraints"][0]["invalid_values"], [1.0, 2.0])
+		self.assertEqual(json.loads(column.to_json())["mean"], 9.5)
+
+	def test_profile(self):
+		for data in (self._data, self._data.toPandas()):
+			profiles = {}
+			expected = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+			output = json.loads(DataQualityAnalyzer(
+				data, analyzer_config, profile=True, on_profile=lambda name, profile: profiles.update({name: profile})
+			).analyze())
+			self.assertEqual([{k: v for k, v in column.items() if k != "_profile"} for column in output], expected)
+			self.assertEqual(list(profiles), ["number_col", "string_col"])
+			self.assertEqual(output[0]["_profile"], profiles["number_col"])
+
+			metrics = output[0]["_profile"]["metrics"]
+			for name in ("total_count", "null_count", "unique_count", "topn_values", "min", "max", "constraints"):
+				self.assertGreaterEqual(metrics[name]["wall_time"], 0)
+				self.assertGreaterEqual(metrics[name]["cpu_time"], 0)
+			if isinstance(data, DataFrame):
+				constraints = output[0]["_profile"]["constraints"]
+				self.assertEqual([constraint["name"] for constraint in constraints], ["gt_eq", "is_in"])
+				self.assertGreaterEqual(metrics["null_count"]["spark_jobs"], 1)
+				# the scalar metrics are computed in one measured aggregation
+				self.assertGreaterEqual(metrics["scalar_metrics"]["spark_jobs"], 1)
+				for name in ("total_count", "null_count", "min", "max"):
+					self.assertEqual(metrics[name]["computed_in"], "scalar_metrics")
+					self.assertEqual(metrics[name]["wall_time"], 0)
+				# the jobs of the constraints are included in the jobs of all the constraints
+				self.assertEqual(
+					metrics["constraints"]["spark_jobs"],
+					sum(constraint["spark_jobs"] for constraint in constraints)
+				)
+			else:
+				# the memory is traced only on request, as tracing slows down the timed code
+				self.assertNotIn("memory_peak_bytes", metrics["topn_values"])
+				output = json.loads(DataQualityAnalyzer(data, analyzer_config, profile=True, trace_memory=True).analyze())
+				self.assertIn("memory_peak_bytes", output[0]["_profile"]["metrics"]["topn_values"])
+
+			profiles.clear()
+			output = json.loads(DataQualityAnalyzer(
+				data, analyzer_config, on_profile=lambda name, profile: profiles.update({name: profile})
+			).analyze())
+			self.assertNotIn("_profile", output[0])
+			self.assertEqual(len(profiles), 2)
+
+	def test_null_tokens(self):
+		rows = [("abc", 1.0, 1), ("", float("nan"), None), ("None", None, 3), ("NULL", 4.0, 4), ("NULLABLE", 5.0, 5),
+			("N/A", 6.0, 6), (None, 7.0, 7)]
+		data = self.spark_session.createDataFrame(rows, "string_col string, double_col double, int_col long")
+		config = [
+			{"name": "string_col", "datatype": "string", "constraints": []},
+			{"name": "double_col", "datatype": "number", "constraints": []},
+			{"name": "int_col", "datatype": "number", "constraints": []}
+		]
+		for source in (data, data.toPandas()):
+			output = json.loads(DataQualityAnalyzer(source, config).analyze())
+			# the tokens are matched exactly, not as substrings
+			self.assertEqual([column["null_count"] for column in output], [4, 2, 1])
+
+			output = json.loads(DataQualityAnalyzer(source, config, null_tokens={"string": ["N/A"]}).analyze())
+			self.assertEqual(output[0]["null_count"], 2)
+
+			column_config = [{**config[0], "null_tokens": []}]
+			output = json.loads(DataQualityAnalyzer(source, column_config, null_tokens={"string": ["N/A"]}).analyze())
+			self.assertEqual(output[0]["null_count"], 1)
+
+		fused = json.loads(DataQualityAnalyzer(data, config, fused=True).analyze())
+		self.assertEqual(fused, json.loads(DataQualityAnalyzer(data, config).analyze()))
+		# null and NaN are not unique values on either backend
+		self.assertEqual(
+			[column["unique_count"] for column in fused],
+			[column["unique_count"] for column in json.loads(DataQualityAnalyzer(data.toPandas(), config).analyze())]
+		)
+
+	def test_distribution(self):
+		data = self.spark_session.createDataFrame(
+			[(float(value),) for value in [1, 2, 3, 4, 5, 7, 8, 9, 10]] + [(None,)], "number_col double"
+		)
+		quantiles = {"probabilities": [0.1, 0.5, 0.9]}
+		expected_histograms = {
+			"equi_width": ({"bins": 3}, [1.0, 4.0, 7.0, 10.0], [3, 2, 4]),
+			"equi_depth": ({"bins": 3, "mode": "equi_depth"}, [1.0, 3.0, 7.0, 10.0], [2, 3, 4]),
+			"range": ({"bins": 2, "range": [0, 6]}, [0.0, 3.0, 6.0], [2, 3])
+		}
+		for histogram, edges, counts in expected_histograms.values():
+			config = [{
+				"name": "number_col", "datatype": "number", "quantiles": quantiles, "histogram": histogram,
+				"constraints": []
+			}]
+			for source in (data, data.toPandas()):
+				output = json.loads(DataQualityAnalyzer(source, config).analyze())[0]
+				self.assertEqual(output["quantiles"], {"0.1": 1.0, "0.5": 5.0, "0.9": 10.0})
+				self.assertEqual(output["histogram"]["edges"], edges)
+				self.assertEqual(output["histogram"]["counts"], counts)
+			fused = json.loads(DataQualityAnalyzer(data, config, fused=True).analyze())[0]
+			self.assertEqual(fused["histogram"], output["histogram"])
+
+		# the mergeable state estimates the distribution from the quantile sketch, built on each backend
+		config = [{
+			"name": "number_col", "datatype": "number", "quantiles": quantiles, "histogram": {"bins": 3},
+			"constraints": []
+		}]
+		analyzer = DataQualityAnalyzer(data, config)
+		spark_states = analyzer.compute_states()
+		pandas_states = DataQualityAnalyzer(data.toPandas(), config).compute_states()
+		stored_states = json.loads(json.dumps([state.to_dict() for state in pandas_states]))
+		states = analyzer.merge_states([spark_states, stored_states])
+		output = analyzer.get_state_result(states)[0]
+		self.assertEqual(output["quantiles"]["0.5"], 5.0)
+		self.assertEqual(output["histogram"]["edges"], [1.0, 4.0, 7.0, 10.0])
+		self.assertEqual(sum(output["histogram"]["counts"]), 18)
+
+		with self.assertRaises(NotImplementedError):
+			DataQualityAnalyzer(data, [{**config[0], "histogram": {"mode": "log"}}]).analyze()
@@ -0,0 +1,51 @@
+import unittest
+from pyspark.sql.session import SparkSession
+from benchmarks.benchmark_runner import BenchmarkRunner, compare
+from benchmarks.data_generator import SyntheticDataGenerator
+
+
+class BenchmarkTests(unittest.TestCase):
+	"""
+	Test suite for the synthetic data generator and the comparison of the benchmark results
+	"""
+	spark_session: SparkSession
+
+	def setUp(self):
+		"""
+		"""
+		self._generator = SyntheticDataGenerator(rows=2000, null_rate=0.1, cardinality=50, skew=1.2, seed=7)
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def test_generator(self):
+		data = self._generator.generate()
+		self.assertTrue(data.equals(self._generator.generate()))
+		self.assertFalse(data.equals(SyntheticDataGenerator(rows=2000, cardinality=50, seed=8).generate()))
+		self.assertEqual(list(data.columns), ["number_col_0", "number_col_1", "string_col_0", "string_col_1"])
+		for column_name in data.columns:
+			self.assertAlmostEqual(data[column_name].isna().mean(), 0.1, delta=0.03)
+			self.assertLessEqual(data[column_name].nunique(), 50)
+		self.assertTrue(data["string_col_0"].dropna().str.len().eq(8).all())
+		# with the skew the most frequent value is far above the uniform frequency
+		self.assertGreater(data["number_col_0"].value_counts().iloc[0], 2000 / 50 * 3)
+
+	def test_compare(self):
+		output = BenchmarkRunner(self._generator, backends=["pandas"], repeats=1).run()
+		self.assertIn("pandas/analyze", output["results"])
+		self.assertIn("pandas/metric/number/stddev", output["results"])
+		self.assertIn("pandas/constraint/string/regex", output["results"])
+		self.assertEqual(compare(output, output), [])
+
+		slower = {
+			**output,
+			"results": {
+				**output["results"],
+				"pandas/analyze": {**output["results"]["pandas/analyze"], "median": 10.0}
+			}
+		}
+		self.assertEqual([regression["name"] for regression in compare(output, slower)], ["pandas/analyze"])
+		with self.assertRaises(ValueError):
+			compare(output, {**output, "meta": {**output["meta"], "data": {}}})
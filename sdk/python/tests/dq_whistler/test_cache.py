@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+from py4j.protocol import Py4JError
+import pandas as pd
+from pyspark.sql.session import SparkSession
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.cache import ResultCache
+from tests.dq_whistler.resources.configuration import analyzer_config, analyzer_data
+
+
+class ResultCacheTests(unittest.TestCase):
+	"""
+	Test suite for the on-disk cache of the analyzer results
+	"""
+	spark_session: SparkSession
+	_directory: str
+
+	def setUp(self):
+		"""
+		"""
+		self._directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		"""
+		"""
+		shutil.rmtree(self._directory)
+
+	def get_data(self) -> pd.DataFrame:
+		return pd.DataFrame(analyzer_data, columns=["number_col", "string_col"])
+
+	def test_pandas(self):
+		cache = ResultCache(os.path.join(self._directory, "cache"))
+		data = self.get_data()
+		output = DataQualityAnalyzer(data, analyzer_config, cache=cache).analyze()
+		self.assertEqual(cache.get_stats()["entries"], 1)
+
+		cached_output = DataQualityAnalyzer(self.get_data(), analyzer_config, cache=cache).analyze()
+		self.assertEqual(cached_output, output)
+		self.assertEqual(cache.get_stats()["hits"], 1)
+		result = DataQualityAnalyzer(data, analyzer_config, cache=cache).analyze(as_objects=True)
+		self.assertEqual(result.to_dict(), json.loads(output))
+
+		# changed data or config are not served from the cache
+		changed_data = data.copy()
+		changed_data.loc[0, "string_col"] = "changed"
+		DataQualityAnalyzer(changed_data, analyzer_config, cache=cache).analyze()
+		DataQualityAnalyzer(data, analyzer_config[:1], cache=cache).analyze()
+		self.assertEqual(cache.get_stats()["entries"], 3)
+		self.assertEqual(cache.get_stats()["hits"], 2)
+
+	def test_spark(self):
+		cache = ResultCache(self._directory)
+		path = os.path.join(self._directory, "data.parquet")
+		self.get_data().to_parquet(path)
+		output = DataQualityAnalyzer(self.spark_session.read.parquet(path), analyzer_config, cache=cache).analyze()
+		cached_output = DataQualityAnalyzer(self.spark_session.read.parquet(path), analyzer_config, cache=cache).analyze()
+		self.assertEqual(cached_output, output)
+		self.assertEqual(cache.get_stats()["hits"], 1)
+
+		filtered = self.spark_session.read.parquet(path).filter("number_col > 2")
+		self.assertNotEqual(ResultCache.get_fingerprint(filtered), ResultCache.get_fingerprint(
+			self.spark_session.read.parquet(path)
+		))
+		self.get_data().head(3).to_parquet(path)
+		self.assertIsNone(cache.get(DataQualityAnalyzer(
+			self.spark_session.read.parquet(path), analyzer_config, cache=cache
+		).get_cache_key()))
+
+		# the same key in another session of another JVM
+		script = (
+			"import sys\n"
+			"from pyspark.sql.session import SparkSession\n"
+			"from dq_whistler.cache import ResultCache\n"
+			"spark = SparkSession.builder.master('local[1]').getOrCreate()\n"
+			"print(ResultCache.get_fingerprint(spark.read.parquet(sys.argv[1]).filter('number_col > 2')))\n"
+		)
+		other_fingerprint = subprocess.run(
+			[sys.executable, "-c", script, path], capture_output=True, text=True, check=True,
+			cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+		).stdout.strip().splitlines()[-1]
+		self.assertEqual(
+			other_fingerprint,
+			ResultCache.get_fingerprint(self.spark_session.read.parquet(path).filter("number_col > 2"))
+		)
+
+		# in memory dataframes have no cheap fingerprint
+		data = self.spark_session.createDataFrame(self.get_data())
+		self.assertIsNone(DataQualityAnalyzer(data, analyzer_config, cache=cache).get_cache_key())
+
+		# the options changing the output are part of the key
+		data = self.spark_session.read.parquet(path)
+		keys = {
+			DataQualityAnalyzer(data, analyzer_config, cache=cache, **options).get_cache_key()
+			for options in ({}, {"fused": True}, {"fail_fast": True}, {"null_tokens": {"string": ["abc"]}})
+		}
+		self.assertEqual(len(keys), 4)
+		self.assertEqual(
+			DataQualityAnalyzer(data, analyzer_config, cache=cache, max_concurrency=2).get_cache_key(),
+			DataQualityAnalyzer(data, analyzer_config, cache=cache).get_cache_key()
+		)
+
+	def test_spark_fingerprint_error(self):
+		data = self.spark_session.createDataFrame(self.get_data())
+		# a JVM failure while fingerprinting skips the cache instead of failing the analysis
+		failing_plan = mock.Mock(queryExecution=mock.Mock(side_effect=Py4JError("unavailable")))
+		with mock.patch.object(data, "_jdf", failing_plan):
+			self.assertIsNone(ResultCache.get_fingerprint(data))
+
+	def test_eviction(self):
+		cache = ResultCache(self._directory, max_entries=2)
+		for key in ("a", "b"):
+			cache.put(key, "{}")
+			time.sleep(0.01)
+		self.assertEqual(cache.get("a"), "{}")
+		cache.put("c", "{}")
+		# the least recently used result is evicted
+		self.assertIsNone(cache.get("b"))
+		self.assertEqual(cache.get_stats()["entries"], 2)
+
+		cache = ResultCache(os.path.join(self._directory, "bytes"), max_entries=None, max_bytes=250)
+		for key in ("a", "b", "c"):
+			cache.put(key, "x" * 100)
+			time.sleep(0.01)
+		self.assertEqual(cache.get_stats()["bytes"], 200)
+		self.assertIsNone(cache.get("a"))
+		cache.clear()
+		self.assertEqual(cache.get_stats()["entries"], 0)
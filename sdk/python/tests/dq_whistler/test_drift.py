@@ -0,0 +1,112 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from pyspark.sql.session import SparkSession
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.drift import DriftDetector, get_psi, get_kl_divergence, get_ks_statistic
+from dq_whistler.sketches.tdigest import TDigest
+
+
+class DriftDetectorTests(unittest.TestCase):
+	"""
+	Test suite for the drift of the columns between two runs
+	"""
+	spark_session: SparkSession
+
+	_config = [
+		{"name": "number_col", "datatype": "number", "quantiles": {}, "constraints": []},
+		{"name": "string_col", "datatype": "string", "constraints": []}
+	]
+
+	def setUp(self):
+		"""
+		"""
+		pass
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	@staticmethod
+	def get_data(seed: int, shift: float, letters: str) -> pd.DataFrame:
+		rng = np.random.default_rng(seed)
+		return pd.DataFrame({
+			"number_col": rng.normal(loc=shift, size=5000),
+			"string_col": rng.choice(list(letters), size=5000)
+		})
+
+	def test_metrics(self):
+		self.assertEqual(get_psi([0.5, 0.5], [0.5, 0.5]), 0.0)
+		self.assertAlmostEqual(get_psi([0.5, 0.5], [0.9, 0.1]), 0.4 * np.log(1.8) - 0.4 * np.log(0.2))
+		self.assertAlmostEqual(get_kl_divergence([0.5, 0.5], [0.9, 0.1]), 0.9 * np.log(1.8) + 0.1 * np.log(0.2))
+		baseline = TDigest().update(np.arange(100.0))
+		self.assertEqual(get_ks_statistic(baseline, TDigest().update(np.arange(100.0))), 0.0)
+		self.assertAlmostEqual(get_ks_statistic(baseline, TDigest().update(np.arange(50.0, 150.0))), 0.5, delta=0.02)
+		self.assertIsNone(get_ks_statistic(baseline, TDigest()))
+
+	def test_drift(self):
+		baseline_states = DataQualityAnalyzer(self.get_data(1, 0.0, "abcd"), self._config).compute_states()
+		stored_states = json.loads(json.dumps([state.to_dict() for state in baseline_states]))
+
+		same = DataQualityAnalyzer(self.get_data(2, 0.0, "abcd"), self._config).detect_drift(stored_states)
+		self.assertEqual([column["drift_status"] for column in same], ["success", "success"])
+		self.assertLess(same[0]["psi"], 0.05)
+		self.assertLess(same[0]["ks_statistic"], 0.05)
+		self.assertIsNone(same[1]["ks_statistic"])
+		self.assertEqual(same[1]["topn_shift"]["added"], [])
+
+		data = self.spark_session.createDataFrame(self.get_data(3, 1.0, "abcdefgh"))
+		shifted = DataQualityAnalyzer(data, self._config).detect_drift(stored_states)
+		self.assertEqual([column["drift_status"] for column in shifted], ["failed", "failed"])
+		self.assertGreater(shifted[0]["psi"], 0.2)
+		self.assertAlmostEqual(shifted[0]["ks_statistic"], 0.38, delta=0.05)
+		self.assertGreater(shifted[0]["kl_divergence"], 0)
+		self.assertAlmostEqual(shifted[1]["unique_count_change"], 1.0, delta=0.1)
+		self.assertEqual(sorted(shifted[1]["topn_shift"]["added"]), list("efgh"))
+		self.assertAlmostEqual(shifted[1]["topn_shift"]["distance"], 0.5, delta=0.05)
+
+		# the numeric distribution is compared on the quantile sketch even without the quantiles configured
+		config = [{**self._config[0], "quantiles": None}, self._config[1]]
+		detector = DriftDetector(config)
+		states = DataQualityAnalyzer(self.get_data(1, 0.0, "abcd"), config).compute_states()
+		drift = detector.compare(states, states)
+		self.assertEqual(drift[0]["psi"], 0.0)
+		self.assertEqual(drift[0]["ks_statistic"], 0.0)
+
+		# a numeric state without a quantile sketch can not be compared
+		drift = detector.compare([{**states[0].to_dict(), "quantile_sketch": None}, states[1]], states)
+		self.assertIsNone(drift[0]["psi"])
+		self.assertEqual(drift[0]["drift_status"], "unknown")
+		self.assertEqual(drift[1]["drift_status"], "success")
+
+		with self.assertRaises(ValueError):
+			detector.compare(states[:1], states)
+
+	def test_analyze_states(self):
+		data = self.get_data(1, 0.0, "abcd")
+		baseline_states = DataQualityAnalyzer(data, self._config).compute_states()
+		for source in (data, self.spark_session.createDataFrame(data)):
+			analyzer = DataQualityAnalyzer(source, self._config, states=True)
+			self.assertIsNone(analyzer.get_states())
+			output = json.loads(analyzer.analyze())
+			states = analyzer.get_states()
+			for state, baseline_state in zip(states, baseline_states):
+				self.assertEqual(state.total_count, baseline_state.total_count)
+				self.assertEqual(state.null_count, baseline_state.null_count)
+				self.assertEqual(state.value_count, baseline_state.value_count)
+				self.assertAlmostEqual(state.mean, baseline_state.mean)
+				self.assertAlmostEqual(state.m2, baseline_state.m2, places=6)
+			self.assertEqual(states[0].quantile_sketch.count(), 5000)
+			self.assertEqual(states[1].get_unique_count(), output[1]["unique_count"])
+
+			# the drift of the same data is computed from the states of the analyze pass
+			drift = analyzer.detect_drift(baseline_states)
+			self.assertEqual(drift, analyzer.detect_drift(baseline_states, states))
+			self.assertEqual([column["drift_status"] for column in drift], ["success", "success"])
+			self.assertLess(drift[0]["ks_statistic"], 0.02)
+			self.assertLess(drift[1]["psi"], 0.01)
+
+		with self.assertRaises(NotImplementedError):
+			DataQualityAnalyzer(data, self._config, states=True, sampling={"fraction": 0.1})
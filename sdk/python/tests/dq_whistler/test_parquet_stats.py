@@ -0,0 +1,53 @@
+import shutil
+import tempfile
+import unittest
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyspark.sql.session import SparkSession
+from dq_whistler.parquet_stats import ParquetFooterStats
+
+
+class ParquetFooterStatsTests(unittest.TestCase):
+	"""
+	Test suite for the Parquet footer statistics
+	"""
+	spark_session: SparkSession
+	_path: str
+
+	def setUp(self):
+		"""
+		"""
+		self._path = tempfile.mkdtemp()
+		table = pa.table({
+			"number_col": [1, 2, 3, None, None, None, 23],
+			"double_col": [1.0, float("nan"), 3.0, None, 4.0, 5.0, 6.0],
+			"string_col": ["abc", "", None, "NULL", "xyz", "abc", "abc"]
+		})
+		pq.write_table(table.slice(0, 3), f"{self._path}/part_0.parquet", row_group_size=3)
+		pq.write_table(table.slice(3), f"{self._path}/part_1.parquet", row_group_size=3)
+
+	def tearDown(self):
+		"""
+		"""
+		shutil.rmtree(self._path)
+
+	def test_row_groups(self):
+		stats = ParquetFooterStats(self._path)
+		self.assertEqual(len(stats.get_row_groups()), 3)
+		self.assertEqual(stats.get_total_count(), 7)
+		self.assertEqual(stats.get_row_groups()[1]["columns"]["number_col"]["min"], None)
+
+	def test_column_metrics(self):
+		stats = ParquetFooterStats(self._path)
+		self.assertEqual(
+			stats.get_column_metrics("number_col", "number"),
+			{"total_count": 7, "null_count": 3, "min": 1.0, "max": 23.0}
+		)
+		# NaN is not part of the footer stats, the string null rules need a scan
+		self.assertEqual(stats.get_column_metrics("double_col", "number"), {"total_count": 7})
+		self.assertEqual(stats.get_column_metrics("string_col", "string"), {"total_count": 7})
+		self.assertEqual(stats.get_column_metrics("missing_col", "number"), {"total_count": 7})
+
+	def test_load(self):
+		self.assertIsNone(ParquetFooterStats.load(None))
+		self.assertIsNone(ParquetFooterStats.load(f"{self._path}/missing"))
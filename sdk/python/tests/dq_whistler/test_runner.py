@@ -2,6 +2,22 @@ import unittest
 from pyspark.sql.session import SparkSession
 from tests.dq_whistler.constraints.test_number_constraints import NumberConstraintTests
 from tests.dq_whistler.constraints.test_string_constraints import StringConstraintTests
+from tests.dq_whistler.constraints.test_constraint_engine import ConstraintEngineTests
+from tests.dq_whistler.constraints.test_string_matcher import StringMatcherTests
+from tests.dq_whistler.constraints.test_value_set import ValueSetTests
+from tests.dq_whistler.sketches.test_hyperloglog import HyperLogLogTests
+from tests.dq_whistler.sketches.test_space_saving import SpaceSavingTests
+from tests.dq_whistler.sketches.test_tdigest import TDigestTests
+from tests.dq_whistler.profiler.test_process_pool import ProcessPoolTests
+from tests.dq_whistler.profiler.test_column_state import ColumnStateTests
+from tests.dq_whistler.test_analyzer import AnalyzerTests
+from tests.dq_whistler.test_streaming import StreamingAnalyzerTests
+from tests.dq_whistler.test_parquet_stats import ParquetFooterStatsTests
+from tests.dq_whistler.test_sampling import SamplingTests
+from tests.dq_whistler.test_writer import ResultWriterTests
+from tests.dq_whistler.test_benchmarks import BenchmarkTests
+from tests.dq_whistler.test_drift import DriftDetectorTests
+from tests.dq_whistler.test_cache import ResultCacheTests
 
 
 def get_spark_session():
@@ -20,7 +36,26 @@ def run_tests():
 	Runs test cases for specific classes
 	"""
 	spark_session = get_spark_session()
-	test_classes = [NumberConstraintTests, StringConstraintTests]
+	test_classes = [
+		NumberConstraintTests,
+		StringConstraintTests,
+		ConstraintEngineTests,
+		StringMatcherTests,
+		ValueSetTests,
+		HyperLogLogTests,
+		SpaceSavingTests,
+		TDigestTests,
+		ProcessPoolTests,
+		ColumnStateTests,
+		AnalyzerTests,
+		StreamingAnalyzerTests,
+		ParquetFooterStatsTests,
+		SamplingTests,
+		ResultWriterTests,
+		BenchmarkTests,
+		DriftDetectorTests,
+		ResultCacheTests,
+	]
 
 	loader = unittest.TestLoader()
 	test_suites = []
@@ -0,0 +1,89 @@
+import json
+import unittest
+from unittest import mock
+import pandas as pd
+from pyspark.sql.session import SparkSession
+from pyspark.sql.dataframe import DataFrame
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.profiler.column_profiler import ColumnProfiler
+from dq_whistler.sampling import Sampler
+from tests.dq_whistler.resources.configuration import analyzer_config, analyzer_data
+
+
+class SamplingTests(unittest.TestCase):
+	"""
+	Test suite for the sampling mode of the analyzer
+	"""
+	spark_session: SparkSession
+	_data: DataFrame
+
+	def setUp(self):
+		"""
+		"""
+		rows = analyzer_data * 200
+		self._data = self.spark_session.createDataFrame(rows).toDF("number_col", "string_col")
+		self._pandas_data = pd.DataFrame(rows, columns=["number_col", "string_col"])
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def assert_within_ci(self, output, expected):
+		for column_output, column_expected in zip(output, expected):
+			lower, upper = column_output["null_count_ci"]
+			self.assertTrue(lower <= column_expected["null_count"] <= upper)
+			for constraint, constraint_expected in zip(column_output["constraints"], column_expected["constraints"]):
+				lower, upper = constraint["invalid_count_ci"]
+				self.assertTrue(lower <= constraint_expected["invalid_count"] <= upper)
+				self.assertTrue(constraint["invalid_rate_ci"][0] <= constraint["invalid_rate"] <= constraint["invalid_rate_ci"][1])
+
+	def test_full_sample_is_exact(self):
+		expected = json.loads(DataQualityAnalyzer(self._pandas_data, analyzer_config).analyze())
+		# the counts of the strata are computed without building the sketches of the states
+		with mock.patch.object(ColumnProfiler, "get_state", side_effect=AssertionError("get_state")):
+			output = json.loads(DataQualityAnalyzer(
+				self._pandas_data, analyzer_config, sampling={"method": "fraction", "fraction": 1.0}
+			).analyze())
+		self.assertEqual(output[0]["sample_count"], 1800)
+		self.assertEqual(output[0]["total_count"], 1800)
+		for column_output, column_expected in zip(output, expected):
+			self.assertEqual(column_output["null_count_ci"], [column_expected["null_count"]] * 2)
+			self.assertEqual(
+				[constraint["invalid_count"] for constraint in column_output["constraints"]],
+				[constraint["invalid_count"] for constraint in column_expected["constraints"]]
+			)
+
+	def test_pandas_reservoir(self):
+		expected = json.loads(DataQualityAnalyzer(self._pandas_data, analyzer_config).analyze())
+		output = json.loads(DataQualityAnalyzer(
+			self._pandas_data, analyzer_config, sampling={"method": "reservoir", "size": 900, "seed": 7}
+		).analyze())
+		self.assertEqual(output[0]["sample_count"], 900)
+		self.assert_within_ci(output, expected)
+
+	def test_spark_fraction(self):
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		output = json.loads(DataQualityAnalyzer(
+			self._data, analyzer_config, sampling={"method": "fraction", "fraction": 0.5, "seed": 7, "confidence": 0.99}
+		).analyze())
+		self.assertEqual(output[0]["confidence"], 0.99)
+		self.assertLess(output[0]["sample_count"], 1800)
+		self.assert_within_ci(output, expected)
+
+	def test_spark_stratified(self):
+		data = self._data.withColumn("stratum", (self._data["number_col"] > 10).cast("string"))
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		output = json.loads(DataQualityAnalyzer(data, analyzer_config, sampling={
+			"method": "stratified", "key": "stratum", "fractions": {"true": 0.2}, "fraction": 0.6, "seed": 7
+		}).analyze())
+		self.assert_within_ci(output, expected)
+
+	def test_sampler_estimate(self):
+		sampler = Sampler({"method": "stratified", "key": "key", "fractions": {"a": 0.1}, "fraction": 1.0})
+		estimate, margin = sampler.estimate([("a", 100, 10), ("b", 50, 5)])
+		self.assertAlmostEqual(estimate, 105.0)
+		self.assertGreater(margin, 0)
+		self.assertAlmostEqual(sampler.get_total([("a", 100), ("b", 50)]), 1050.0)
+		with self.assertRaises(NotImplementedError):
+			Sampler({"method": "systematic"})
@@ -0,0 +1,85 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pyspark.sql.session import SparkSession
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.streaming import StreamingDataQualityAnalyzer
+from tests.dq_whistler.resources.configuration import analyzer_config, analyzer_data
+
+
+class StreamingAnalyzerTests(unittest.TestCase):
+	"""
+	Test suite for the structured streaming analyzer
+	"""
+	spark_session: SparkSession
+	_path: str
+
+	def setUp(self):
+		"""
+		"""
+		self._path = tempfile.mkdtemp()
+
+	def tearDown(self):
+		"""
+		"""
+		shutil.rmtree(self._path)
+
+	def test_cumulative_result(self):
+		data = self.spark_session.createDataFrame(analyzer_data).toDF("number_col", "string_col")
+		for index, rows in enumerate((analyzer_data[:4], analyzer_data[4:])):
+			self.spark_session.createDataFrame(rows, data.schema).coalesce(1) \
+				.write.mode("append").parquet(f"{self._path}/input/part_{index}")
+		stream = self.spark_session.readStream \
+			.schema(data.schema) \
+			.option("maxFilesPerTrigger", 1) \
+			.option("recursiveFileLookup", "true") \
+			.parquet(f"{self._path}/input")
+
+		batches = []
+		analyzer = StreamingDataQualityAnalyzer(
+			analyzer_config,
+			on_batch=lambda batch_id, batch_result, cumulative_result: batches.append(batch_result)
+		)
+		query = analyzer.attach(stream) \
+			.option("checkpointLocation", f"{self._path}/checkpoint") \
+			.trigger(availableNow=True) \
+			.start()
+		query.awaitTermination()
+
+		expected = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+		output = analyzer.get_cumulative_result()
+		self.assertEqual(len(batches), 2)
+		self.assertEqual(sum(batch[0]["total_count"] for batch in batches), 9)
+		for column_output, column_expected in zip(output, expected):
+			self.assertEqual(column_output["batch_count"], 2)
+			self.assertEqual(column_output["total_count"], column_expected["total_count"])
+			self.assertEqual(column_output["null_count"], column_expected["null_count"])
+			self.assertEqual(
+				[constraint["invalid_count"] for constraint in column_output["constraints"]],
+				[constraint["invalid_count"] for constraint in column_expected["constraints"]]
+			)
+		for metric in ("min", "max", "mean", "stddev"):
+			self.assertAlmostEqual(output[0][metric], expected[0][metric])
+
+	def test_replayed_batch(self):
+		data = self.spark_session.createDataFrame(analyzer_data).toDF("number_col", "string_col")
+		analyzer = StreamingDataQualityAnalyzer(analyzer_config)
+		analyzer.process_batch(data, 0)
+		analyzer.process_batch(data, 0)
+		output = analyzer.get_cumulative_result()
+		self.assertEqual(output[0]["batch_count"], 1)
+		self.assertEqual(output[0]["total_count"], 9)
+
+		state = json.loads(json.dumps(analyzer.get_state()))
+		self.assertEqual(state["last_batch_id"], 0)
+		resumed = StreamingDataQualityAnalyzer(analyzer_config, initial_state=state)
+		resumed.process_batch(data, 0)
+		resumed.process_batch(data, 1)
+		output = resumed.get_cumulative_result()
+		self.assertEqual(output[0]["batch_count"], 2)
+		self.assertEqual(output[0]["total_count"], 18)
+		self.assertEqual(
+			[constraint["invalid_count"] for constraint in output[0]["constraints"]],
+			[2 * constraint["invalid_count"] for constraint in analyzer.get_cumulative_result()[0]["constraints"]]
+		)
@@ -0,0 +1,86 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import pyarrow.parquet as pq
+from pyspark.sql.session import SparkSession
+from pyspark.sql.dataframe import DataFrame
+from dq_whistler.analyzer import DataQualityAnalyzer
+from dq_whistler.result import ColumnResult, NpEncoder
+from dq_whistler.writer import ResultWriter
+from tests.dq_whistler.resources.configuration import analyzer_config, analyzer_data
+
+
+class ResultWriterTests(unittest.TestCase):
+	"""
+	Test suite for the column by column analysis and the result writer
+	"""
+	spark_session: SparkSession
+	_data: DataFrame
+
+	def setUp(self):
+		"""
+		"""
+		self._data = self.spark_session.createDataFrame(analyzer_data).toDF("number_col", "string_col")
+
+	def tearDown(self):
+		"""
+		"""
+		pass
+
+	def test_analyze_iter(self):
+		for data in (self._data, self._data.toPandas()):
+			expected = json.loads(DataQualityAnalyzer(data, analyzer_config).analyze())
+			outputs = DataQualityAnalyzer(data, analyzer_config, max_concurrency=2).analyze_iter()
+			first = next(outputs)
+			self.assertEqual(first["col_name"], "number_col")
+			self.assertEqual(json.loads(json.dumps([first, *outputs], cls=NpEncoder)), expected)
+
+			outputs = DataQualityAnalyzer(data, analyzer_config, max_concurrency=2).analyze_iter(ordered=False)
+			outputs = sorted(outputs, key=lambda output: output["col_name"])
+			self.assertEqual(json.loads(json.dumps(outputs, cls=NpEncoder)), expected)
+
+			outputs = list(DataQualityAnalyzer(data, analyzer_config).analyze_iter(as_objects=True))
+			self.assertTrue(all(isinstance(output, ColumnResult) for output in outputs))
+			self.assertEqual([json.loads(output.to_json()) for output in outputs], expected)
+
+	def test_jsonl(self):
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, "results.jsonl")
+			with ResultWriter(path) as writer:
+				outputs = DataQualityAnalyzer(self._data, analyzer_config).analyze_iter()
+				writer.write(next(outputs))
+				# the first column is readable before the rest are profiled
+				with open(path) as results_file:
+					self.assertEqual(json.loads(results_file.readline()), expected[0])
+				self.assertEqual(writer.write_all(outputs), 1)
+			with open(path) as results_file:
+				self.assertEqual([json.loads(line) for line in results_file], expected)
+
+		expected = json.loads(DataQualityAnalyzer(self._data.toPandas(), analyzer_config).analyze())
+		sink = io.StringIO()
+		with ResultWriter(sink) as writer:
+			writer.write_all(DataQualityAnalyzer(self._data.toPandas(), analyzer_config).analyze_iter(as_objects=True))
+		self.assertEqual([json.loads(line) for line in sink.getvalue().splitlines()], expected)
+
+	def test_parquet(self):
+		expected = json.loads(DataQualityAnalyzer(self._data, analyzer_config).analyze())
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, "results.parquet")
+			with ResultWriter(path, format="parquet", row_group_size=1) as writer:
+				self.assertEqual(writer.write_all(DataQualityAnalyzer(self._data, analyzer_config).analyze_iter()), 2)
+			parquet_file = pq.ParquetFile(path)
+			self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+			table = parquet_file.read()
+			self.assertEqual(table.column("col_name").to_pylist(), ["number_col"] * 2 + ["string_col"] * 2)
+			self.assertEqual(
+				table.column("constraint_status").to_pylist(),
+				[constraint["constraint_status"] for column in expected for constraint in column["constraints"]]
+			)
+			self.assertEqual(json.loads(table.column("metrics")[0].as_py())["max"], expected[0]["max"])
+
+			empty_path = os.path.join(directory, "empty.parquet")
+			ResultWriter(empty_path, format="parquet").close()
+			self.assertEqual(pq.read_table(empty_path).num_rows, 0)